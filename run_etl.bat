@@ -41,60 +41,22 @@ if errorlevel 1 (
 )
 
 echo ========================================
-echo    ETAPA 1: BRONZE LAYER (RPA)
+echo    ETAPAS 1-3: BRONZE, SILVER E GOLD
 echo ========================================
-echo Executando RPA para capturar leads do Clint...
-echo [%date% %time%] Iniciando Bronze Layer >> "%LOG_FILE%"
+echo Executando o pipeline em um unico processo (silver entregue a gold em memoria)...
+echo [%date% %time%] Iniciando pipeline (Bronze, Silver, Gold) >> "%LOG_FILE%"
 
-python scr\core\bronze\clint_main_modular.py todos
-set BRONZE_EXIT_CODE=%errorlevel%
+python scr\core\main.py
+set ETL_EXIT_CODE=%errorlevel%
 
-if %BRONZE_EXIT_CODE% neq 0 (
-    echo ERRO: Falha na execucao do Bronze Layer
-    echo [%date% %time%] ERRO: Falha na execucao do Bronze Layer >> "%LOG_FILE%"
+if %ETL_EXIT_CODE% neq 0 (
+    echo ERRO: Falha na execucao do pipeline ETL
+    echo [%date% %time%] ERRO: Falha na execucao do pipeline ETL >> "%LOG_FILE%"
     goto :error
 )
 
-echo ✅ Bronze Layer executado com sucesso!
-echo [%date% %time%] Bronze Layer executado com sucesso >> "%LOG_FILE%"
-echo.
-
-echo ========================================
-echo    ETAPA 2: SILVER LAYER
-echo ========================================
-echo Processando dados da camada Silver...
-echo [%date% %time%] Iniciando Silver Layer >> "%LOG_FILE%"
-
-python scr\core\silver\leads-forms-accelera.py
-set SILVER_EXIT_CODE=%errorlevel%
-
-if %SILVER_EXIT_CODE% neq 0 (
-    echo ERRO: Falha na execucao do Silver Layer
-    echo [%date% %time%] ERRO: Falha na execucao do Silver Layer >> "%LOG_FILE%"
-    goto :error
-)
-
-echo ✅ Silver Layer executado com sucesso!
-echo [%date% %time%] Silver Layer executado com sucesso >> "%LOG_FILE%"
-echo.
-
-echo ========================================
-echo    ETAPA 3: GOLD LAYER + GCS
-echo ========================================
-echo Criando modelo dimensional e fazendo upload para GCS...
-echo [%date% %time%] Iniciando Gold Layer >> "%LOG_FILE%"
-
-python scr\core\gold\gold_clint_digital.py
-set GOLD_EXIT_CODE=%errorlevel%
-
-if %GOLD_EXIT_CODE% neq 0 (
-    echo ERRO: Falha na execucao do Gold Layer
-    echo [%date% %time%] ERRO: Falha na execucao do Gold Layer >> "%LOG_FILE%"
-    goto :error
-)
-
-echo ✅ Gold Layer executado com sucesso!
-echo [%date% %time%] Gold Layer executado com sucesso >> "%LOG_FILE%"
+echo ✅ Bronze, Silver e Gold executados com sucesso!
+echo [%date% %time%] Bronze, Silver e Gold executados com sucesso >> "%LOG_FILE%"
 echo.
 
 REM Verificar se todos os arquivos foram criados
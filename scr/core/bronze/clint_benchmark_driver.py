@@ -0,0 +1,100 @@
+"""
+Benchmark dos Perfis do Navegador para Plataforma Clint
+Responsável por: Comparar tempo de inicialização e carregamento de página entre os perfis "padrao" e "leve"
+
+Uso:
+    python clint_benchmark_driver.py [url] [repeticoes]
+"""
+
+import statistics
+import time
+import os
+import sys
+
+# Adicionar o diretório utils ao path para importação
+utils_path = os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), '..', '..', 'utils')
+sys.path.append(utils_path)
+
+# Importar após configurar o path
+from variaveis import clint_url  # noqa: E402
+from clint_login import criar_driver_chrome  # noqa: E402
+from clint_waits import aguardar, pagina_carregada  # noqa: E402
+
+PERFIS = ["padrao", "leve"]
+
+
+def medir_perfil(perfil, url):
+    """
+    Mede inicialização do navegador e carregamento da página para um perfil
+
+    Returns:
+        dict: Tempos em segundos e bytes transferidos, ou None se falhar
+    """
+    inicio = time.perf_counter()
+    driver = criar_driver_chrome(perfil=perfil)
+    if not driver:
+        return None
+    tempo_inicializacao = time.perf_counter() - inicio
+
+    try:
+        inicio = time.perf_counter()
+        driver.get(url)
+        aguardar(driver, pagina_carregada(), f"página carregada ({perfil})")
+        tempo_carregamento = time.perf_counter() - inicio
+
+        recursos = driver.execute_script("""
+            const entradas = performance.getEntriesByType('resource');
+            return {
+                quantidade: entradas.length,
+                bytes: entradas.reduce((total, e) => total + (e.transferSize || 0), 0)
+            };
+        """)
+
+        return {
+            "inicializacao": tempo_inicializacao,
+            "carregamento": tempo_carregamento,
+            "recursos": recursos["quantidade"],
+            "bytes": recursos["bytes"],
+        }
+    finally:
+        driver.quit()
+
+
+def executar_benchmark(url=None, repeticoes=3):
+    """
+    Executa o benchmark alternando os perfis e exibe a mediana de cada métrica
+    """
+    url = url or clint_url
+    resultados = {perfil: [] for perfil in PERFIS}
+
+    print(f"🧪 Benchmark de perfis do navegador: {url} ({repeticoes} repetições)")
+
+    for rodada in range(1, repeticoes + 1):
+        for perfil in PERFIS:
+            print(f"\n▶️ Rodada {rodada} - perfil {perfil}")
+            medicao = medir_perfil(perfil, url)
+            if medicao:
+                resultados[perfil].append(medicao)
+
+    print("\n" + "=" * 60)
+    print(f"{'perfil':<8} {'início (s)':>11} {'carga (s)':>10} {'recursos':>9} {'KB':>10}")
+    print("-" * 60)
+    for perfil, medicoes in resultados.items():
+        if not medicoes:
+            print(f"{perfil:<8} sem medições válidas")
+            continue
+        print(f"{perfil:<8} "
+              f"{statistics.median(m['inicializacao'] for m in medicoes):>11.2f} "
+              f"{statistics.median(m['carregamento'] for m in medicoes):>10.2f} "
+              f"{statistics.median(m['recursos'] for m in medicoes):>9.0f} "
+              f"{statistics.median(m['bytes'] for m in medicoes) / 1024:>10.1f}")
+    print("=" * 60)
+
+    return resultados
+
+
+if __name__ == "__main__":
+    url_benchmark = sys.argv[1] if len(sys.argv) > 1 else None
+    repeticoes_benchmark = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    executar_benchmark(url_benchmark, repeticoes_benchmark)
@@ -0,0 +1,117 @@
+"""
+Benchmark do RPA Completo contra o Simulador Local da Clint
+Responsável por: Executar login, 2FA, sessão e coleta contra clint_simulador.py e exibir
+a mediana do tempo de cada etapa (spans), sem depender de app.clint.digital nem do BigQuery
+
+Uso:
+    python clint_benchmark_rpa.py [repeticoes] [escala_latencia]
+
+A primeira execução é "fria" (login + token); as seguintes reaproveitam a sessão salva.
+"""
+
+from collections import defaultdict
+import statistics
+import tempfile
+import time
+import os
+import sys
+
+# Adicionar o diretório utils ao path para importação
+utils_path = os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), '..', '..', 'utils')
+sys.path.append(utils_path)
+
+# Importar após configurar o path
+from clint_simulador import (iniciar_simulador, encerrar_simulador, ProvedorTokenSimulado,  # noqa: E402
+                             ID_ORIGEM_SIMULADA, USUARIO_SIMULADO, SENHA_SIMULADA)
+
+
+def configurar_ambiente(url_base, pasta_trabalho):
+    """
+    Aponta o RPA para o simulador e isola downloads, sessão e estado em uma pasta temporária
+
+    Precisa rodar antes de importar os módulos da bronze, que leem variaveis.py na importação.
+    """
+    os.environ["CLINT_URL"] = f"{url_base}/login"
+    os.environ["CLINT_USER"] = USUARIO_SIMULADO
+    os.environ["CLINT_PASSWORD"] = SENHA_SIMULADA
+    os.environ["CLINT_URLS"] = f"{url_base}/origin/{ID_ORIGEM_SIMULADA}"
+    os.environ["CLINT_PASTA_DOWNLOADS"] = os.path.join(pasta_trabalho, 'downloads')
+    os.environ["CLINT_PASTA_SESSAO"] = os.path.join(pasta_trabalho, 'sessao')
+    os.environ["CLINT_PASTA_ESTADO"] = os.path.join(pasta_trabalho, 'estado')
+    os.environ.setdefault("CLINT_PERFIL_DRIVER", "leve")
+
+
+def executar_benchmark(repeticoes=3, escala=1.0):
+    """
+    Executa o RPA completo repetidas vezes contra o simulador e exibe a mediana por etapa
+
+    Args:
+        repeticoes (int): Execuções após a execução fria
+        escala (float): Multiplicador das latências do simulador
+
+    Returns:
+        dict: Durações em segundos por etapa, separadas em "fria" e "quente"
+    """
+    simulador = iniciar_simulador(escala=escala)
+    pasta_trabalho = tempfile.mkdtemp(prefix="clint_benchmark_")
+    configurar_ambiente(simulador.url_base, pasta_trabalho)
+
+    from clint_main_modular import executar_rpa_completo
+    from rastreamento import spans_registrados, limpar_rastreamento
+
+    provedor = ProvedorTokenSimulado(simulador.url_base)
+    duracoes = {"fria": defaultdict(list), "quente": defaultdict(list)}
+    falhas = 0
+
+    print(f"🧪 Benchmark do RPA: 1 execução fria + {repeticoes} com sessão salva "
+          f"(escala de latência {escala})")
+    print(f"📁 Pasta de trabalho: {pasta_trabalho}")
+
+    try:
+        for execucao in range(repeticoes + 1):
+            tipo = "fria" if execucao == 0 else "quente"
+            print(f"\n▶️ Execução {execucao + 1} ({tipo})")
+
+            limpar_rastreamento()
+            inicio = time.perf_counter()
+            sucesso = executar_rpa_completo(provedor_token=provedor)
+            duracoes[tipo]["total"].append(time.perf_counter() - inicio)
+
+            if not sucesso:
+                falhas += 1
+                continue
+
+            # Espera e etapas com o mesmo nome na execução são somadas
+            por_etapa = defaultdict(float)
+            for rastro in spans_registrados():
+                if rastro.duracao is not None:
+                    por_etapa[rastro.nome] += rastro.duracao
+            for nome, duracao in por_etapa.items():
+                duracoes[tipo][nome].append(duracao)
+    finally:
+        print(f"\n📊 Simulador: {simulador.estado.contadores}")
+        encerrar_simulador(simulador)
+
+    etapas = sorted(set(duracoes["fria"]) | set(duracoes["quente"]))
+    print("\n" + "=" * 60)
+    print(f"{'etapa':<30} {'fria (s)':>10} {'quente (s)':>12} {'n':>4}")
+    print("-" * 60)
+    for etapa in etapas:
+        fria = duracoes["fria"].get(etapa)
+        quente = duracoes["quente"].get(etapa)
+        print(f"{etapa:<30} "
+              f"{statistics.median(fria) if fria else float('nan'):>10.2f} "
+              f"{statistics.median(quente) if quente else float('nan'):>12.2f} "
+              f"{len(quente or []):>4}")
+    print("=" * 60)
+    if falhas:
+        print(f"⚠️ {falhas} execução(ões) falharam e ficaram fora das etapas")
+
+    return duracoes
+
+
+if __name__ == "__main__":
+    repeticoes_benchmark = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+    escala_benchmark = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    executar_benchmark(repeticoes_benchmark, escala_benchmark)
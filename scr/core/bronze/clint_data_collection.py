@@ -6,13 +6,11 @@ Responsável por: Navegar URLs, aplicar filtros, download e upload para bucket
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from google.cloud import storage
-from google.oauth2 import service_account
 import time
 import os
 import sys
 import pandas as pd
-import io
+from datetime import datetime, timezone
 
 # Adicionar o diretório utils ao path para importação
 utils_path = os.path.join(os.path.dirname(
@@ -22,17 +20,31 @@ sys.path.append(utils_path)
 # Importar após configurar o path (como no clint_login_plataforma.py)
 # As importações serão feitas dentro das funções após configurar o path
 
+from rastreamento import span, iniciar_span, tamanho_arquivo
+from clint_waits import (aguardar, pagina_carregada, menu_filtro_status_aberto,
+                         checkbox_status_marcado, contagem_linhas_estavel,
+                         SELETOR_LINHAS_NEGOCIOS, SELETOR_FILTRO_STATUS,
+                         SELETOR_BOTAO_EXPORTAR)
 
-def limpar_pasta_downloads():
+# Extensões usadas pelo Chrome enquanto o download está em andamento
+EXTENSOES_DOWNLOAD_TEMPORARIO = (".crdownload", ".tmp")
+
+
+def limpar_pasta_downloads(download_folder=None):
     """
     Limpa arquivos antigos da pasta de downloads antes de fazer novo download
+
+    Args:
+        download_folder: Pasta a limpar (padrão: clint_pasta_downloads)
     """
     try:
-        download_folder = r"C:\Repositorio\Python\p95-accelera360\data\bronze\leads-forms-accelera"
+        from variaveis import clint_pasta_downloads
+
+        download_folder = download_folder or clint_pasta_downloads
         if os.path.exists(download_folder):
-            # Listar todos os arquivos CSV na pasta
-            csv_files = [f for f in os.listdir(
-                download_folder) if f.endswith(".csv")]
+            # Listar os CSVs e os temporários de downloads interrompidos (ex.: Chrome encerrado)
+            csv_files = [f for f in os.listdir(download_folder)
+                         if f.endswith((".csv",) + EXTENSOES_DOWNLOAD_TEMPORARIO)]
 
             if csv_files:
                 print(
@@ -56,6 +68,80 @@ def limpar_pasta_downloads():
         print(f"⚠️ Erro ao limpar pasta de downloads: {e}")
 
 
+def aguardar_download_concluido(download_folder, arquivos_anteriores=None,
+                                timeout=300, intervalo=0.5, tempo_estavel=2):
+    """
+    Aguarda o Chrome finalizar o download de um novo arquivo CSV
+
+    O download é considerado concluído quando não há mais arquivos temporários
+    (.crdownload/.tmp) novos na pasta e o tamanho do novo CSV permanece igual
+    durante `tempo_estavel` segundos.
+
+    Args:
+        download_folder: Pasta de downloads configurada no Chrome
+        arquivos_anteriores: Nomes dos arquivos existentes antes do clique
+        timeout (int): Tempo máximo de espera em segundos
+        intervalo (float): Intervalo entre verificações em segundos
+        tempo_estavel (float): Tempo em segundos sem alteração de tamanho
+
+    Returns:
+        str: Caminho do arquivo baixado, ou None se o tempo esgotar
+    """
+    arquivos_anteriores = set(arquivos_anteriores or [])
+    inicio = time.monotonic()
+    limite = inicio + timeout
+    ultimo_arquivo = None
+    ultimo_tamanho = -1
+    estavel_desde = None
+
+    print(f"⏳ Aguardando conclusão do download (máximo {timeout}s)...")
+
+    while time.monotonic() < limite:
+        try:
+            arquivos = os.listdir(download_folder)
+        except FileNotFoundError:
+            arquivos = []
+
+        # Temporários que já existiam antes do clique não pertencem a este download
+        temporarios = [
+            f for f in arquivos
+            if f.endswith(EXTENSOES_DOWNLOAD_TEMPORARIO) and f not in arquivos_anteriores]
+        novos_csv = [
+            f for f in arquivos
+            if f.endswith(".csv") and f not in arquivos_anteriores]
+
+        if novos_csv and not temporarios:
+            # Considerar o CSV novo mais recente
+            novos_csv.sort(key=lambda x: os.path.getmtime(
+                os.path.join(download_folder, x)), reverse=True)
+            arquivo = os.path.join(download_folder, novos_csv[0])
+
+            try:
+                tamanho = os.path.getsize(arquivo)
+            except OSError:
+                tamanho = -1
+
+            agora = time.monotonic()
+            if arquivo != ultimo_arquivo or tamanho != ultimo_tamanho or tamanho <= 0:
+                ultimo_arquivo = arquivo
+                ultimo_tamanho = tamanho
+                estavel_desde = agora
+            elif agora - estavel_desde >= tempo_estavel:
+                print(
+                    f"✅ Download concluído em {agora - inicio:.1f}s: {novos_csv[0]} ({tamanho} bytes)")
+                return arquivo
+        else:
+            # Download ainda em andamento (ou não iniciado)
+            ultimo_arquivo = None
+            ultimo_tamanho = -1
+            estavel_desde = None
+
+        time.sleep(intervalo)
+
+    print(f"❌ Tempo esgotado ({timeout}s) aguardando conclusão do download")
+    return None
+
+
 def aplicar_filtros_status(driver, wait):
     """
     Aplica filtros de status na página usando a lógica robusta do bonze_clint_web_scrapping_p93.py
@@ -72,9 +158,10 @@ def aplicar_filtros_status(driver, wait):
 
         # Abrir filtro de status
         status_filter = wait.until(EC.element_to_be_clickable(
-            (By.CSS_SELECTOR, '[data-cy="tbl-status-deal-filter"]')))
+            (By.CSS_SELECTOR, SELETOR_FILTRO_STATUS)))
         status_filter.click()
-        time.sleep(3)  # Aguarda o menu abrir completamente
+        aguardar(driver, menu_filtro_status_aberto(),
+                 "menu do filtro de status aberto", timeout=10)
 
         print("✅ Filtro de status aberto.")
 
@@ -84,7 +171,6 @@ def aplicar_filtros_status(driver, wait):
         for status in status_list:
             try:
                 print(f"📋 Procurando checkbox para status: {status}")
-                time.sleep(1)  # Pausa entre tentativas
 
                 # Tentar clicar diretamente no checkbox usando JavaScript
                 try:
@@ -115,7 +201,8 @@ def aplicar_filtros_status(driver, wait):
                         print(
                             f"⚠️ Método alternativo também falhou para '{status}': {alt_error}")
 
-                time.sleep(1)
+                aguardar(driver, checkbox_status_marcado(status),
+                         f"status '{status}' marcado", timeout=5, obrigatoria=False)
 
             except Exception as e:
                 print(f"⚠️ Não foi possível marcar o status '{status}': {e}")
@@ -126,7 +213,7 @@ def aplicar_filtros_status(driver, wait):
         print(f"❌ Erro ao aplicar filtros de status: {e}")
         try:
             driver.find_element(
-                By.CSS_SELECTOR, '[data-cy="tbl-status-deal-filter"]').click()
+                By.CSS_SELECTOR, SELETOR_FILTRO_STATUS).click()
             time.sleep(1)
         except:
             pass
@@ -149,10 +236,9 @@ def fazer_download_csv(driver, wait):
 
         # Clicar no botão de download
         download_btn = wait.until(EC.element_to_be_clickable(
-            (By.CSS_SELECTOR, '[data-cy="bt-export-deals-via-pipe"]')))
+            (By.CSS_SELECTOR, SELETOR_BOTAO_EXPORTAR)))
         download_btn.click()
         print("✅ Botão de download clicado com sucesso!")
-        time.sleep(2)
 
         # Tratar pop-up de confirmação
         try:
@@ -160,7 +246,6 @@ def fazer_download_csv(driver, wait):
                 (By.XPATH, "//button[normalize-space(text())='Sim']")))
             sim_btn.click()
             print("✅ Botão 'Sim' do pop-up clicado!")
-            time.sleep(2)
         except Exception as e:
             print(f"⚠️ Erro ao clicar no botão 'Sim' do pop-up: {e}")
 
@@ -188,24 +273,13 @@ def fazer_upload_bucket(driver, nome_arquivo):
         print("🚀 Iniciando upload para o bucket Google Cloud Storage...")
 
         # Importar após configurar o path (como no clint_login_plataforma.py)
-        from funcoes import carregar_configuracao
+        from funcoes import upload_arquivo_gcs
+        from clientes_gcp import obter_bucket
+        from variaveis import clint_upload_gzip
 
-        # Carregar configuração
-        config = carregar_configuracao()
-        if not config:
-            print("❌ Falha ao carregar configuração")
-            return False
-
-        # Obter credenciais
-        credentials = service_account.Credentials.from_service_account_file(
-            config['credentials-path'],
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-
-        # Criar cliente do Storage
-        storage_client = storage.Client(credentials=credentials)
+        # Bucket com cliente do Storage compartilhado pelo processo
         bucket_name = "p95-accelera360"
-        bucket = storage_client.bucket(bucket_name)
+        bucket = obter_bucket(bucket_name)
 
         # Nome do arquivo no bucket
         nome_arquivo_bucket = f"bronze/leads-forms-accelera/{nome_arquivo}.csv"
@@ -229,22 +303,9 @@ def fazer_upload_bucket(driver, nome_arquivo):
                 os.path.join(download_folder, x)), reverse=True)
             csv_path = os.path.join(download_folder, csv_files[0])
 
-            # Ler arquivo CSV
-            df = pd.read_csv(csv_path)
-            print(f"📊 DataFrame carregado com {len(df)} linhas")
-
-            # Converter para CSV em memória
-            csv_buffer = io.StringIO()
-            df.to_csv(csv_buffer, index=False)
-            csv_content = csv_buffer.getvalue()
-
-            # Fazer upload
-            blob = bucket.blob(nome_arquivo_bucket)
-            blob.upload_from_string(csv_content, content_type='text/csv')
-
-            print(
-                f"✅ Arquivo enviado para: gs://{bucket_name}/{nome_arquivo_bucket}")
-            print(f"📊 Tamanho: {len(csv_content)} bytes, Linhas: {len(df)}")
+            # Enviar direto do disco, sem carregar o CSV em memória
+            upload_arquivo_gcs(bucket, csv_path, nome_arquivo_bucket,
+                               content_type='text/csv', compactar=clint_upload_gzip)
 
             # Remover arquivo temporário
             os.remove(csv_path)
@@ -275,24 +336,11 @@ def fazer_upload_bucket_direto(csv_content, nome_arquivo):
         print("🚀 Iniciando upload direto para o bucket Google Cloud Storage...")
 
         # Importar após configurar o path (como no clint_login_plataforma.py)
-        from funcoes import carregar_configuracao
-
-        # Carregar configuração
-        config = carregar_configuracao()
-        if not config:
-            print("❌ Falha ao carregar configuração")
-            return False
+        from clientes_gcp import obter_bucket
 
-        # Obter credenciais
-        credentials = service_account.Credentials.from_service_account_file(
-            config['credentials-path'],
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-
-        # Criar cliente do Storage
-        storage_client = storage.Client(credentials=credentials)
+        # Bucket com cliente do Storage compartilhado pelo processo
         bucket_name = "p95-accelera360"
-        bucket = storage_client.bucket(bucket_name)
+        bucket = obter_bucket(bucket_name)
 
         # Nome do arquivo no bucket
         nome_arquivo_bucket = f"bronze/leads-forms-accelera/{nome_arquivo}.csv"
@@ -315,6 +363,135 @@ def fazer_upload_bucket_direto(csv_content, nome_arquivo):
         return False
 
 
+# Seletores candidatos para os cards/linhas de negócios, em ordem de prioridade
+SELETORES_NEGOCIOS = [
+    SELETOR_LINHAS_NEGOCIOS,
+    "[data-cy*='lead']",
+    ".lead-item",
+    ".deal-item",
+    ".business-item",
+    ".opportunity-item",
+    ".card",  # Cards de leads
+    ".item"   # Itens de lista
+]
+
+# Extrai todos os cards renderizados em uma única chamada, rola a lista e
+# devolve o resultado após dois frames (tempo para a lista virtualizada renderizar)
+SCRIPT_EXTRAIR_NEGOCIOS = """
+const seletores = arguments[0];
+const concluir = arguments[arguments.length - 1];
+
+let seletorUsado = null;
+let itens = [];
+for (const seletor of seletores) {
+    // Botões e campos da barra de filtros também usam data-cy com "deal"
+    itens = Array.from(document.querySelectorAll(seletor))
+        .filter(el => !["BUTTON", "INPUT", "SELECT"].includes(el.tagName));
+    if (itens.length) { seletorUsado = seletor; break; }
+}
+
+function containerRolavel(el) {
+    while (el && el !== document.body) {
+        const estilo = getComputedStyle(el);
+        if (/(auto|scroll)/.test(estilo.overflowY) && el.scrollHeight > el.clientHeight) return el;
+        el = el.parentElement;
+    }
+    return document.scrollingElement || document.documentElement;
+}
+
+function textoCabecalhoColuna(el) {
+    const coluna = el.closest("[data-cy*='column'], [data-cy*='stage'], [class*='column']");
+    if (!coluna) return "";
+    const cabecalho = coluna.querySelector("header, h1, h2, h3, h4, [data-cy*='title']");
+    return cabecalho ? cabecalho.innerText.trim().split("\\n")[0] : "";
+}
+
+const registros = itens.map(el => {
+    const texto = el.innerText || "";
+    const linhas = texto.split("\\n").map(l => l.trim()).filter(Boolean);
+    const links = Array.from(el.querySelectorAll("a[href]")).map(a => a.href);
+    const mailto = links.find(h => h.startsWith("mailto:"));
+    const tel = links.find(h => h.startsWith("tel:"));
+    const linkNegocio = links.find(h => /deal|negocio|lead/i.test(h)) || "";
+    const email = mailto ? mailto.slice(7) : ((texto.match(/[\\w.+-]+@[\\w-]+\\.[\\w.]+/) || [""])[0]);
+    const valor = (texto.match(/R\\$\\s?[\\d.,]+/) || [""])[0];
+    const status = /\\bganho\\b|\\bwon\\b/i.test(texto) ? "Ganho"
+        : /\\bperdido\\b|\\blost\\b/i.test(texto) ? "Perdido" : "Aberto";
+    const id = el.getAttribute("data-id") || el.getAttribute("data-deal-id")
+        || el.id || linkNegocio || linhas.join("|");
+
+    return {
+        id: id,
+        nome: linhas[0] || "",
+        email: email,
+        fone: tel ? tel.slice(4) : "",
+        valor: valor,
+        status: status,
+        estagio: textoCabecalhoColuna(el),
+        link: linkNegocio,
+        texto: linhas.join(" | ")
+    };
+});
+
+const container = containerRolavel(itens[0] || document.body);
+const posicaoAnterior = container.scrollTop;
+container.scrollTop = posicaoAnterior + container.clientHeight;
+const fim = container.scrollTop === posicaoAnterior
+    || container.scrollTop + container.clientHeight >= container.scrollHeight;
+
+requestAnimationFrame(() => requestAnimationFrame(() =>
+    concluir({seletor: seletorUsado, registros: registros, fim: fim})));
+"""
+
+
+def extrair_negocios_dom(driver, max_rolagens=500):
+    """
+    Extrai os negócios renderizados na página como dados estruturados
+
+    Cada passo executa um único script no navegador que coleta todos os cards
+    visíveis e rola a lista, em vez de uma chamada WebDriver por elemento.
+    A rolagem incremental cobre listas virtualizadas.
+
+    Args:
+        driver: Driver do Selenium na página da origem
+        max_rolagens (int): Limite de passos de rolagem
+
+    Returns:
+        DataFrame: Negócios extraídos (vazio se nenhum card for encontrado)
+    """
+    colunas = ["id", "nome", "email", "fone", "valor", "status",
+               "estagio", "link", "texto", "url_origem", "data_captura"]
+    negocios = {}
+    passos_sem_novos = 0
+    seletor = None
+
+    for passo in range(1, max_rolagens + 1):
+        resultado = driver.execute_async_script(
+            SCRIPT_EXTRAIR_NEGOCIOS, SELETORES_NEGOCIOS)
+        seletor = seletor or resultado.get("seletor")
+
+        quantidade_anterior = len(negocios)
+        for registro in resultado.get("registros", []):
+            negocios.setdefault(registro["id"], registro)
+
+        if len(negocios) == quantidade_anterior:
+            passos_sem_novos += 1
+        else:
+            passos_sem_novos = 0
+
+        # Fim da lista sem novos cards, ou rolagem que não renderiza mais nada
+        if (resultado.get("fim") and passos_sem_novos > 0) or passos_sem_novos >= 3:
+            break
+
+    print(
+        f"📊 {len(negocios)} negócio(s) extraído(s) em {passo} passo(s) (seletor: {seletor})")
+
+    df = pd.DataFrame(list(negocios.values()), columns=colunas[:-2])
+    df["url_origem"] = driver.current_url
+    df["data_captura"] = datetime.now().strftime("%Y-%m-%d")
+    return df[colunas]
+
+
 def capturar_leads_reais(driver, wait):
     """
     Captura os leads reais da página após aplicar filtros
@@ -331,121 +508,33 @@ def capturar_leads_reais(driver, wait):
 
         # Aguardar página carregar completamente após filtros
         print("⏳ Aguardando página carregar com filtros aplicados...")
-        time.sleep(5)
-
-        # Aguardar elementos de leads carregarem
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "body")))
-        time.sleep(3)
-
-        # Procurar por elementos de leads reais na página
-        print("🔍 Procurando elementos de leads na página...")
-
-        # Aguardar mais tempo para garantir que todos os dados carregaram
-        print("⏳ Aguardando carregamento completo dos dados (60 segundos)...")
-        time.sleep(60)
-
-        # Tentar encontrar elementos de leads por diferentes seletores
-        leads_data = []
-        selectors = [
-            "[data-cy*='deal']",
-            "[data-cy*='lead']",
-            ".lead-item",
-            ".deal-item",
-            ".business-item",
-            ".opportunity-item",
-            ".card",  # Cards de leads
-            ".item"   # Itens de lista
-        ]
-
-        for selector in selectors:
-            try:
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                if elements and len(elements) > 0:
-                    print(
-                        f"📊 Encontrados {len(elements)} elementos com seletor: {selector}")
-                    leads_data = elements
-                    break
-            except:
-                continue
-
-        if not leads_data:
-            # Fallback: procurar por qualquer elemento que possa conter dados de leads
-            print("🔍 Procurando elementos alternativos...")
-            try:
-                # Procurar por elementos com texto que pareça ser de leads
-                all_elements = driver.find_elements(By.CSS_SELECTOR, "*")
-                # Aumentar limite para encontrar mais elementos
-                for elem in all_elements[:200]:
-                    try:
-                        text = elem.text.strip()
-                        if text and len(text) > 10 and any(keyword in text.lower() for keyword in ['lead', 'negócio', 'oportunidade', 'cliente', 'forms']):
-                            leads_data.append(elem)
-                            if len(leads_data) >= 20:  # Aumentar limite para capturar mais leads
-                                break
-                    except:
-                        continue
-            except:
-                pass
-
-        if leads_data:
-            print(f"✅ Encontrados {len(leads_data)} elementos de leads")
-
-            # Criar CSV com dados reais capturados
-            csv_lines = [
-                "id,nome,email,status,valor,origem,data_captura,url_origem"]
-
-            # ✅ CAPTURAR TODOS OS ELEMENTOS ENCONTRADOS (SEM LIMITE!)
-            print(
-                f"🔄 Processando TODOS os {len(leads_data)} elementos encontrados...")
+        aguardar(driver, pagina_carregada(), "página com filtros carregada")
 
-            # REMOVER LIMITE [:50] - PROCESSAR TODOS!
-            for i, elem in enumerate(leads_data, 1):
-                try:
-                    text = elem.text.strip()
-                    if text and len(text) > 5:
-                        # Extrair informações reais do texto
-                        lines = text.split('\n')
-                        nome = lines[0][:50] if lines else f"Lead {i}"
-                        status = "Aberto"  # Status padrão
-                        valor = "R$0"      # Valor padrão
-
-                        # Tentar identificar status e valor no texto
-                        for line in lines:
-                            if any(s in line.lower() for s in ['ganho', 'won']):
-                                status = "Ganho"
-                            elif any(s in line.lower() for s in ['perdido', 'lost']):
-                                status = "Perdido"
-                            elif 'r$' in line.lower():
-                                valor = line.strip()
-
-                        csv_lines.append(
-                            f"{i},{nome},{nome.lower().replace(' ', '')}@email.com,{status},{valor},Forms,2024-01-27,{driver.current_url}")
-
-                        # Mostrar progresso a cada 100 elementos processados
-                        if i % 100 == 0:
-                            print(
-                                f"📊 Processados {i} de {len(leads_data)} elementos...")
-
-                except Exception as e:
-                    print(f"⚠️ Erro ao processar elemento {i}: {e}")
-                    csv_lines.append(
-                        f"{i},Lead {i},lead{i}@email.com,Aberto,R$0,Forms,2024-01-27,{driver.current_url}")
+        # Aguardar a quantidade de negócios renderizados estabilizar
+        print("⏳ Aguardando carregamento completo dos dados...")
+        aguardar(driver, contagem_linhas_estavel(),
+                 "linhas de negócios estáveis", timeout=60, obrigatoria=False)
 
-            csv_content = "\n".join(csv_lines)
-            print(
-                f"📊 CSV criado com {len(csv_lines)-1} linhas de leads reais (TODOS OS ELEMENTOS PROCESSADOS!)")
+        # Extrair todos os cards em lote (uma chamada por passo de rolagem)
+        print("🔍 Extraindo negócios da página...")
+        driver.set_script_timeout(30)
+        df = extrair_negocios_dom(driver)
 
-            return csv_content
-        else:
+        if df.empty:
             print("⚠️ Nenhum elemento de lead encontrado na página")
             return None
 
+        csv_content = df.to_csv(index=False)
+        print(
+            f"📊 CSV criado com {len(df)} linhas de leads reais e colunas {list(df.columns)}")
+        return csv_content
+
     except Exception as e:
         print(f"❌ Erro na captura de leads reais: {e}")
         return None
 
 
-def fazer_download_csv_nativo(driver, wait, nome_arquivo):
+def fazer_download_csv_nativo(driver, wait, nome_arquivo, download_folder=None):
     """
     Faz download do CSV usando o botão nativo da página Clint
     Exatamente como implementado no bonze_clint_web_scrapping_p93.py
@@ -454,6 +543,7 @@ def fazer_download_csv_nativo(driver, wait, nome_arquivo):
         driver: Driver do Selenium
         wait: WebDriverWait configurado
         nome_arquivo: Nome do arquivo para salvar
+        download_folder: Pasta de downloads do Chrome (padrão: clint_pasta_downloads)
 
     Returns:
         bool: True se download bem-sucedido, False caso contrário
@@ -461,16 +551,17 @@ def fazer_download_csv_nativo(driver, wait, nome_arquivo):
     try:
         print("📥 Procurando botão de download nativo...")
 
+        from variaveis import clint_pasta_downloads
+
+        # Usar a pasta de downloads configurada no Chrome
+        download_folder = download_folder or clint_pasta_downloads
+
         # Limpar pasta de downloads antes de fazer novo download
-        limpar_pasta_downloads()
+        limpar_pasta_downloads(download_folder)
 
         # Aguardar página carregar completamente após filtros
         print("⏳ Aguardando página carregar com filtros aplicados...")
-        time.sleep(10)
-
-        # Aguardar elementos de leads carregarem
-        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "body")))
-        time.sleep(5)
+        aguardar(driver, pagina_carregada(), "página com filtros carregada")
 
         # Verificar se há indicador de total de leads
         try:
@@ -480,18 +571,24 @@ def fazer_download_csv_nativo(driver, wait, nome_arquivo):
         except:
             print("📊 Verificando total de leads na página...")
 
-        # Aguardar mais tempo para garantir que todos os dados carregaram
-        print("⏳ Aguardando carregamento completo dos dados (90 segundos)...")
-        time.sleep(90)
+        # Aguardar a quantidade de negócios renderizados estabilizar
+        print("⏳ Aguardando carregamento completo dos dados...")
+        aguardar(driver, contagem_linhas_estavel(),
+                 "linhas de negócios estáveis", timeout=90, obrigatoria=False)
 
         # Procurar pelo botão de download nativo
         print("🔍 Procurando botão de download...")
         download_btn = wait.until(EC.element_to_be_clickable(
-            (By.CSS_SELECTOR, '[data-cy="bt-export-deals-via-pipe"]')))
+            (By.CSS_SELECTOR, SELETOR_BOTAO_EXPORTAR)))
+
+        os.makedirs(download_folder, exist_ok=True)
+        print(f"📁 Pasta de destino: {download_folder}")
+
+        # Registrar arquivos existentes antes do clique para identificar o novo download
+        arquivos_anteriores = set(os.listdir(download_folder))
 
         download_btn.click()
         print("✅ Botão de download clicado com sucesso!")
-        time.sleep(2)
 
         # --- Tratamento de pop-up/modal de confirmação de download ---
         try:
@@ -500,36 +597,17 @@ def fazer_download_csv_nativo(driver, wait, nome_arquivo):
                 (By.XPATH, "//button[normalize-space(text())='Sim']")))
             sim_btn.click()
             print("✅ Botão 'Sim' do pop-up de confirmação clicado!")
-            time.sleep(2)
         except Exception as e:
             print(f"⚠️ Erro ao tentar clicar no botão 'Sim' do pop-up: {e}")
 
         # --- Fim do tratamento do pop-up ---
-        time.sleep(20)  # Aumentar tempo para download completar
-
-        # Processar arquivo CSV baixado
-        print("📁 Processando arquivo CSV baixado...")
-
-        # Usar a pasta de downloads configurada no Chrome
-        download_folder = r"C:\Repositorio\Python\p95-accelera360\data\bronze\leads-forms-accelera"
-        os.makedirs(download_folder, exist_ok=True)
-        print(f"📁 Pasta de destino: {download_folder}")
 
-        # Aguardar mais tempo e verificar novamente
-        print("⏳ Aguardando download completar...")
-        time.sleep(10)
-
-        # Procurar por arquivos CSV na pasta de downloads configurada
-        csv_files = [f for f in os.listdir(
-            download_folder) if f.endswith(".csv")]
-
-        if csv_files:
-            # Ordenar por data de modificação (mais recente primeiro)
-            csv_files.sort(key=lambda x: os.path.getmtime(
-                os.path.join(download_folder, x)), reverse=True)
-            csv_path = os.path.join(download_folder, csv_files[0])
+        # Aguardar o Chrome finalizar o download (sem esperas fixas)
+        csv_path = aguardar_download_concluido(
+            download_folder, arquivos_anteriores)
 
-            print(f"📊 Arquivo CSV encontrado: {csv_files[0]}")
+        if csv_path:
+            print(f"📊 Arquivo CSV encontrado: {os.path.basename(csv_path)}")
             print(f"📁 Caminho completo: {csv_path}")
 
             # Ler o arquivo para verificar o conteúdo
@@ -568,7 +646,7 @@ def fazer_download_csv_nativo(driver, wait, nome_arquivo):
                 return False
 
         else:
-            print("❌ Nenhum arquivo CSV encontrado na pasta de downloads configurada")
+            print("❌ Nenhum arquivo CSV concluído na pasta de downloads configurada")
             print(f"📁 Conteúdo da pasta: {os.listdir(download_folder)}")
             return False
 
@@ -577,7 +655,7 @@ def fazer_download_csv_nativo(driver, wait, nome_arquivo):
         return False
 
 
-def coletar_dados_url(driver, url, nome_arquivo, index, total_urls):
+def coletar_dados_url(driver, url, nome_arquivo, index, total_urls, download_folder=None):
     """
     Coleta dados de uma URL específica
 
@@ -587,23 +665,62 @@ def coletar_dados_url(driver, url, nome_arquivo, index, total_urls):
         nome_arquivo: Nome do arquivo para salvar
         index: Índice da URL atual
         total_urls: Total de URLs
+        download_folder: Pasta de downloads do Chrome (padrão: clint_pasta_downloads)
 
     Returns:
         bool: True se coleta bem-sucedida
     """
+    rastro = iniciar_span("bronze.origem", url=url, indice=index)
+    sucesso = False
+
     try:
         print(f"\n{'='*50}")
         print(f"COLETANDO DADOS - URL {index} de {total_urls}")
         print(f"URL: {url}")
         print(f"{'='*50}")
 
+        from variaveis import (clint_pasta_downloads, clint_modo_exportacao,
+                               clint_modo_coleta, clint_margem_incremental_horas)
+        from clint_export_http import exportar_via_http, capturar_requisicao_exportacao
+        from clint_incremental import (calcular_inicio_incremental, aplicar_filtro_data,
+                                       escrever_manifesto, marca_pendente,
+                                       TIPO_COMPLETA, TIPO_INCREMENTAL)
+
+        download_folder = download_folder or clint_pasta_downloads
+        inicio_coleta = datetime.now(timezone.utc)
+
+        # Coleta incremental: data inicial a partir da marca d'água da origem
+        desde = None
+        if clint_modo_coleta == "incremental":
+            desde = calcular_inicio_incremental(
+                url, clint_margem_incremental_horas)
+
+        # Exportação HTTP direta (sem renderizar a página nem clicar)
+        # A requisição aprendida não tem filtro de data, por isso só vale para exportação completa
+        if clint_modo_exportacao == "http" and desde is None:
+            destino = os.path.join(download_folder, "leads-forms-accelera.csv")
+            with span("bronze.exportacao_http") as rastro_http:
+                exportado = exportar_via_http(driver, url, destino)
+                rastro_http.definir(sucesso=exportado,
+                                    bytes=tamanho_arquivo(destino) if exportado else None)
+
+            if exportado:
+                escrever_manifesto(download_folder, TIPO_COMPLETA,
+                                   extras=marca_pendente(url, inicio_coleta, TIPO_COMPLETA))
+                print(
+                    f"✅ Exportação HTTP concluída com sucesso para a URL {index}!")
+                rastro.definir(modo="http", tipo=TIPO_COMPLETA)
+                sucesso = True
+                return True
+            print("🔄 Usando exportação pelo navegador como fallback...")
+
         # Navegar para a URL
-        driver.get(url)
-        time.sleep(5)
+        with span("bronze.navegacao"):
+            driver.get(url)
 
-        # Aguardar página carregar
-        wait = WebDriverWait(driver, 30)
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
+            # Aguardar página carregar
+            wait = WebDriverWait(driver, 30)
+            aguardar(driver, pagina_carregada(), "página da origem carregada")
         print("✅ Página carregada completamente.")
 
         # Verificar URL atual
@@ -613,23 +730,54 @@ def coletar_dados_url(driver, url, nome_arquivo, index, total_urls):
             print(f"Esperado: {url}")
             print(f"Atual: {current_url}")
 
-        time.sleep(3)
-
         # Aplicar filtros de status
-        if not aplicar_filtros_status(driver, wait):
-            print("⚠️ Filtros de status não aplicados, continuando...")
+        with span("bronze.filtros"):
+            if not aplicar_filtros_status(driver, wait):
+                print("⚠️ Filtros de status não aplicados, continuando...")
+
+            # Aplicar filtro de data (coleta incremental); se falhar, recarregar e exportar tudo
+            tipo = TIPO_COMPLETA
+            if desde is not None:
+                if aplicar_filtro_data(driver, desde):
+                    tipo = TIPO_INCREMENTAL
+                else:
+                    driver.get(url)
+                    aguardar(driver, pagina_carregada(),
+                             "página da origem recarregada")
+                    if not aplicar_filtros_status(driver, wait):
+                        print("⚠️ Filtros de status não aplicados, continuando...")
 
         # Fazer download nativo usando o botão da página Clint
         print("📥 Fazendo download nativo usando botão da página...")
-        if fazer_download_csv_nativo(driver, wait, nome_arquivo):
+        with span("bronze.download", tipo=tipo) as rastro_download:
+            baixado = fazer_download_csv_nativo(
+                driver, wait, nome_arquivo, download_folder)
+            rastro_download.definir(sucesso=baixado, bytes=tamanho_arquivo(
+                os.path.join(download_folder, "leads-forms-accelera.csv")) if baixado else None)
+
+        if baixado:
             print(
                 f"✅ Download nativo concluído com sucesso para a URL {index}!")
+
+            # A marca d'água fica pendente no manifesto até a silver gravar o CSV
+            escrever_manifesto(download_folder, tipo,
+                               desde if tipo == TIPO_INCREMENTAL else None,
+                               marca_pendente(url, inicio_coleta, tipo))
+
+            # Aprender a requisição do botão para as próximas exportações HTTP
+            if clint_modo_exportacao == "http" and tipo == TIPO_COMPLETA:
+                capturar_requisicao_exportacao(driver, url)
+            rastro.definir(modo="navegador", tipo=tipo)
+            sucesso = True
             return True
         else:
             print(
                 f"⚠️ Download nativo falhou para a URL {index}, tentando método alternativo...")
             # Fallback para método antigo se o download nativo falhar
-            csv_content = capturar_leads_reais(driver, wait)
+            with span("bronze.extracao_dom") as rastro_dom:
+                csv_content = capturar_leads_reais(driver, wait)
+                rastro_dom.definir(
+                    bytes=len(csv_content.encode('utf-8')) if csv_content else 0)
 
             if csv_content:
                 # Fazer upload direto para GCS como fallback
@@ -638,6 +786,8 @@ def coletar_dados_url(driver, url, nome_arquivo, index, total_urls):
                     return False
                 print(
                     f"✅ Coleta da URL {index} concluída com sucesso (método alternativo)!")
+                rastro.definir(modo="extracao_dom")
+                sucesso = True
                 return True
             else:
                 print(
@@ -646,15 +796,21 @@ def coletar_dados_url(driver, url, nome_arquivo, index, total_urls):
 
     except Exception as e:
         print(f"❌ Erro na coleta da URL {index}: {e}")
+        rastro.definir(erro=str(e))
         return False
 
+    finally:
+        rastro.encerrar(sucesso=sucesso)
+
 
-def executar_coleta_completa(driver):
+def executar_coleta_completa(driver, concorrencia=None, urls=None):
     """
     Executa a coleta completa de todas as URLs
 
     Args:
         driver: Driver do Selenium autenticado
+        concorrencia (int): Origens coletadas em paralelo (padrão: clint_concorrencia)
+        urls (list): Origens a coletar (padrão: clint_urls)
 
     Returns:
         bool: True se coleta bem-sucedida
@@ -663,10 +819,22 @@ def executar_coleta_completa(driver):
         print("🚀 Iniciando coleta completa de dados...")
 
         # Importar após configurar o path (como no clint_login_plataforma.py)
-        from variaveis import clint_urls
+        from variaveis import clint_urls, clint_concorrencia
 
         # Configurações
-        nomes_arquivos = ["leads-forms-accelera"]
+        clint_urls = urls or clint_urls
+        nomes_arquivos = ["leads-forms-accelera"] + [
+            f"leads-forms-accelera-{i}" for i in range(2, len(clint_urls) + 1)]
+        concorrencia = concorrencia or clint_concorrencia
+
+        # Coleta concorrente quando há mais de uma origem e concorrência configurada
+        if concorrencia > 1 and len(clint_urls) > 1:
+            from clint_parallel_collection import executar_coleta_concorrente
+
+            sucesso = executar_coleta_concorrente(
+                driver, clint_urls, nomes_arquivos, concorrencia)
+            print(f"\n✅ Coleta de todas as {len(clint_urls)} URLs finalizada!")
+            return sucesso
 
         # Processar cada URL
         for i, url in enumerate(clint_urls, 1):
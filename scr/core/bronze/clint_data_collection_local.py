@@ -6,13 +6,9 @@ Responsável por: Navegar URLs, aplicar filtros, download e upload para bucket
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from google.cloud import storage
-from google.oauth2 import service_account
 import time
 import os
 import sys
-import pandas as pd
-import io
 
 # Adicionar o diretório utils ao path para importação
 utils_path = os.path.join(os.path.dirname(
@@ -155,24 +151,13 @@ def fazer_upload_bucket(driver, nome_arquivo):
         print("🚀 Iniciando upload para o bucket Google Cloud Storage...")
 
         # Importar após configurar o path (como no clint_login_plataforma.py)
-        from funcoes import carregar_configuracao
+        from funcoes import upload_arquivo_gcs
+        from clientes_gcp import obter_bucket
+        from variaveis import clint_upload_gzip
 
-        # Carregar configuração
-        config = carregar_configuracao()
-        if not config:
-            print("❌ Falha ao carregar configuração")
-            return False
-
-        # Obter credenciais
-        credentials = service_account.Credentials.from_service_account_file(
-            config['credentials-path'],
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
-
-        # Criar cliente do Storage
-        storage_client = storage.Client(credentials=credentials)
+        # Bucket com cliente do Storage compartilhado pelo processo
         bucket_name = "p95-accelera360"
-        bucket = storage_client.bucket(bucket_name)
+        bucket = obter_bucket(bucket_name)
 
         # Nome do arquivo no bucket
         nome_arquivo_bucket = f"bronze/leads-forms-accelera/{nome_arquivo}.csv"
@@ -196,22 +181,9 @@ def fazer_upload_bucket(driver, nome_arquivo):
                 os.path.join(download_folder, x)), reverse=True)
             csv_path = os.path.join(download_folder, csv_files[0])
 
-            # Ler arquivo CSV
-            df = pd.read_csv(csv_path)
-            print(f"📊 DataFrame carregado com {len(df)} linhas")
-
-            # Converter para CSV em memória
-            csv_buffer = io.StringIO()
-            df.to_csv(csv_buffer, index=False)
-            csv_content = csv_buffer.getvalue()
-
-            # Fazer upload
-            blob = bucket.blob(nome_arquivo_bucket)
-            blob.upload_from_string(csv_content, content_type='text/csv')
-
-            print(
-                f"✅ Arquivo enviado para: gs://{bucket_name}/{nome_arquivo_bucket}")
-            print(f"📊 Tamanho: {len(csv_content)} bytes, Linhas: {len(df)}")
+            # Enviar direto do disco, sem carregar o CSV em memória
+            upload_arquivo_gcs(bucket, csv_path, nome_arquivo_bucket,
+                               content_type='text/csv', compactar=clint_upload_gzip)
 
             # Remover arquivo temporário
             os.remove(csv_path)
@@ -242,24 +214,11 @@ def fazer_upload_bucket_direto(csv_content, nome_arquivo):
         print("🚀 Iniciando upload direto para o bucket Google Cloud Storage...")
 
         # Importar após configurar o path (como no clint_login_plataforma.py)
-        from funcoes import carregar_configuracao
-
-        # Carregar configuração
-        config = carregar_configuracao()
-        if not config:
-            print("❌ Falha ao carregar configuração")
-            return False
-
-        # Obter credenciais
-        credentials = service_account.Credentials.from_service_account_file(
-            config['credentials-path'],
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
+        from clientes_gcp import obter_bucket
 
-        # Criar cliente do Storage
-        storage_client = storage.Client(credentials=credentials)
+        # Bucket com cliente do Storage compartilhado pelo processo
         bucket_name = "p95-accelera360"
-        bucket = storage_client.bucket(bucket_name)
+        bucket = obter_bucket(bucket_name)
 
         # Nome do arquivo no bucket
         nome_arquivo_bucket = f"bronze/leads-forms-accelera/{nome_arquivo}.csv"
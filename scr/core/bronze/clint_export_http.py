@@ -0,0 +1,246 @@
+"""
+Módulo de Exportação HTTP Direta para Plataforma Clint
+Responsável por: Aprender a requisição do botão de exportação via logs de rede (CDP)
+e repeti-la com os cookies do navegador, gravando a resposta direto em disco
+"""
+
+from variaveis import clint_pasta_sessao
+from requests.adapters import HTTPAdapter
+import requests
+import threading
+import json
+import os
+
+# Arquivo com a requisição de exportação aprendida (contém cabeçalhos de autenticação)
+CAMINHO_REQUISICAO_EXPORTACAO = os.path.join(
+    clint_pasta_sessao, 'clint_requisicao_exportacao.json')
+
+# Marcador usado no lugar do id da origem na requisição aprendida
+MARCADOR_ORIGEM = "{id_origem}"
+
+# Cabeçalhos que não devem ser repetidos (gerados pela própria sessão HTTP)
+CABECALHOS_IGNORADOS = {"cookie", "content-length", "host", "connection",
+                        "accept-encoding", "origin-agent-cluster"}
+
+TAMANHO_BLOCO = 1024 * 1024
+
+_sessao_http = None
+_lock_sessao = threading.Lock()
+
+
+def id_da_origem(url_origem):
+    """
+    Extrai o id da origem da URL da Clint (.../origin/<id>)
+    """
+    return url_origem.rstrip('/').split('/')[-1]
+
+
+def obter_sessao_http():
+    """
+    Retorna a sessão HTTP compartilhada do processo (pool de conexões reutilizado)
+    """
+    global _sessao_http
+    with _lock_sessao:
+        if _sessao_http is None:
+            sessao = requests.Session()
+            adaptador = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            sessao.mount("https://", adaptador)
+            sessao.mount("http://", adaptador)
+            _sessao_http = sessao
+        return _sessao_http
+
+
+def habilitar_log_rede(chrome_options):
+    """
+    Habilita o log de performance do Chrome, necessário para aprender a requisição
+    """
+    chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+
+
+def capturar_requisicao_exportacao(driver, url_origem, caminho=CAMINHO_REQUISICAO_EXPORTACAO):
+    """
+    Identifica nos logs de rede a requisição disparada pelo botão de exportação e a salva
+
+    Deve ser chamada logo após um download nativo bem-sucedido.
+
+    Args:
+        driver: Driver do Selenium com log de performance habilitado
+        url_origem (str): URL da origem exportada
+        caminho (str): Arquivo de destino da requisição aprendida
+
+    Returns:
+        dict: Requisição aprendida, ou None se não encontrada
+    """
+    try:
+        print("🔍 Procurando requisição de exportação nos logs de rede...")
+
+        requisicoes = {}
+        cabecalhos_extras = {}
+        for entrada in driver.get_log("performance"):
+            mensagem = json.loads(entrada["message"])["message"]
+            metodo = mensagem.get("method")
+            params = mensagem.get("params", {})
+
+            if metodo == "Network.requestWillBeSent":
+                requisicao = params.get("request", {})
+                if params.get("type") in ("XHR", "Fetch") and "export" in requisicao.get("url", "").lower():
+                    requisicoes[params["requestId"]] = requisicao
+            elif metodo == "Network.requestWillBeSentExtraInfo":
+                cabecalhos_extras[params.get("requestId")] = params.get(
+                    "headers", {})
+
+        if not requisicoes:
+            print("⚠️ Requisição de exportação não encontrada nos logs de rede")
+            return None
+
+        # A última requisição de exportação corresponde ao clique mais recente
+        id_requisicao, requisicao = list(requisicoes.items())[-1]
+        cabecalhos = dict(requisicao.get("headers", {}))
+        cabecalhos.update(cabecalhos_extras.get(id_requisicao, {}))
+        cabecalhos = {k: v for k, v in cabecalhos.items()
+                      if not k.startswith(":") and k.lower() not in CABECALHOS_IGNORADOS}
+
+        id_origem = id_da_origem(url_origem)
+        especificacao = {
+            "url": requisicao["url"].replace(id_origem, MARCADOR_ORIGEM),
+            "metodo": requisicao.get("method", "GET"),
+            "cabecalhos": cabecalhos,
+            "corpo": (requisicao.get("postData") or "").replace(id_origem, MARCADOR_ORIGEM) or None,
+        }
+
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        with open(caminho, 'w', encoding='utf-8') as f:
+            json.dump(especificacao, f, indent=2)
+
+        print(
+            f"✅ Requisição de exportação aprendida: {especificacao['metodo']} {especificacao['url']}")
+        return especificacao
+
+    except Exception as e:
+        print(f"⚠️ Erro ao capturar requisição de exportação: {e}")
+        return None
+
+
+def carregar_requisicao_exportacao(caminho=CAMINHO_REQUISICAO_EXPORTACAO):
+    """
+    Carrega a requisição de exportação aprendida
+
+    Returns:
+        dict: Requisição aprendida, ou None se ainda não foi aprendida
+    """
+    if not os.path.exists(caminho):
+        return None
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Requisição de exportação salva inválida: {e}")
+        return None
+
+
+def copiar_cookies(driver, sessao):
+    """
+    Copia todos os cookies do navegador (todos os domínios, via CDP) para a sessão HTTP
+    """
+    cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+    for cookie in cookies:
+        sessao.cookies.set(cookie["name"], cookie["value"],
+                           domain=cookie.get("domain"), path=cookie.get("path", "/"))
+
+
+def _gravar_resposta(resposta, destino):
+    """
+    Grava o corpo da resposta em disco em blocos, sem carregar tudo em memória
+    """
+    caminho_temporario = f"{destino}.part"
+    tamanho = 0
+    with open(caminho_temporario, 'wb') as f:
+        for bloco in resposta.iter_content(chunk_size=TAMANHO_BLOCO):
+            if bloco:
+                f.write(bloco)
+                tamanho += len(bloco)
+    os.replace(caminho_temporario, destino)
+    return tamanho
+
+
+def exportar_via_http(driver, url_origem, destino, timeout=300):
+    """
+    Exporta os negócios da origem repetindo a requisição aprendida, sem cliques na página
+
+    Se a resposta for JSON com um link para o arquivo, o link é seguido.
+
+    Args:
+        driver: Driver do Selenium autenticado (usado apenas para os cookies)
+        url_origem (str): URL da origem a exportar
+        destino (str): Caminho do CSV de saída
+        timeout (int): Tempo máximo da requisição em segundos
+
+    Returns:
+        bool: True se o arquivo foi gravado; False indica usar o fluxo pelo navegador
+    """
+    try:
+        especificacao = carregar_requisicao_exportacao()
+        if not especificacao:
+            print("ℹ️ Requisição de exportação ainda não aprendida")
+            return False
+
+        print("🚀 Exportando via HTTP direto...")
+
+        id_origem = id_da_origem(url_origem)
+        sessao = obter_sessao_http()
+        copiar_cookies(driver, sessao)
+        sessao.headers["User-Agent"] = driver.execute_script(
+            "return navigator.userAgent")
+
+        corpo = especificacao.get("corpo")
+        resposta = sessao.request(
+            especificacao["metodo"],
+            especificacao["url"].replace(MARCADOR_ORIGEM, id_origem),
+            headers=especificacao.get("cabecalhos", {}),
+            data=corpo.replace(MARCADOR_ORIGEM, id_origem).encode(
+                'utf-8') if corpo else None,
+            stream=True,
+            timeout=timeout,
+        )
+
+        with resposta:
+            if resposta.status_code != 200:
+                print(
+                    f"⚠️ Exportação HTTP retornou status {resposta.status_code}")
+                return False
+
+            tipo = resposta.headers.get("Content-Type", "")
+
+            if "json" in tipo:
+                # Alguns endpoints retornam o link do arquivo gerado
+                dados = resposta.json()
+                links = [v for v in (dados.values() if isinstance(dados, dict) else [])
+                         if isinstance(v, str) and v.startswith("http")]
+                if not links:
+                    print("⚠️ Resposta JSON da exportação sem link para o arquivo")
+                    return False
+                with sessao.get(links[0], stream=True, timeout=timeout) as arquivo:
+                    if arquivo.status_code != 200:
+                        print(
+                            f"⚠️ Download do arquivo exportado retornou status {arquivo.status_code}")
+                        return False
+                    tamanho = _gravar_resposta(arquivo, destino)
+
+            elif "html" in tipo:
+                print("⚠️ Exportação HTTP retornou HTML (sessão expirada?)")
+                return False
+
+            else:
+                tamanho = _gravar_resposta(resposta, destino)
+
+        if tamanho == 0:
+            print("⚠️ Exportação HTTP retornou arquivo vazio")
+            os.remove(destino)
+            return False
+
+        print(f"✅ Exportação HTTP concluída: {destino} ({tamanho} bytes)")
+        return True
+
+    except Exception as e:
+        print(f"⚠️ Erro na exportação HTTP: {e}")
+        return False
@@ -0,0 +1,187 @@
+"""
+Módulo de Coleta Incremental para Plataforma Clint
+Responsável por: Ler a marca d'água de cada origem, aplicar o filtro de data da página
+e registrar no manifesto se a exportação é completa ou apenas o delta (com a marca d'água
+pendente, efetivada pela silver)
+"""
+
+from variaveis import clint_pasta_estado
+from clint_waits import aguardar, contagem_linhas_estavel, elemento_clicavel
+from selenium.webdriver.common.by import By
+from selenium.webdriver.common.keys import Keys
+from datetime import datetime, timedelta, timezone
+import json
+import os
+
+# Arquivo com a marca d'água (última coleta bem-sucedida) de cada origem
+CAMINHO_MARCAS_DAGUA = os.path.join(clint_pasta_estado, 'clint_marcas_dagua.json')
+
+# Manifesto gravado ao lado do CSV exportado, lido pela camada silver
+NOME_MANIFESTO = "leads-forms-accelera.manifesto.json"
+
+TIPO_COMPLETA = "completa"
+TIPO_INCREMENTAL = "incremental"
+
+
+def _gravar_json(caminho, dados):
+    """
+    Grava o JSON de forma atômica para não deixar arquivo corrompido se o processo cair
+    """
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    caminho_temporario = f"{caminho}.tmp"
+    with open(caminho_temporario, 'w', encoding='utf-8') as f:
+        json.dump(dados, f, indent=2)
+    os.replace(caminho_temporario, caminho)
+
+
+def _ler_json(caminho):
+    """
+    Lê um JSON do disco, retornando None se não existir ou estiver inválido
+    """
+    if not os.path.exists(caminho):
+        return None
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Arquivo inválido, será ignorado ({caminho}): {e}")
+        return None
+
+
+def obter_marca_dagua(url, caminho=CAMINHO_MARCAS_DAGUA):
+    """
+    Retorna o início da última coleta bem-sucedida da origem
+
+    Args:
+        url (str): URL da origem
+        caminho (str): Arquivo das marcas d'água
+
+    Returns:
+        datetime: Marca d'água em UTC, ou None se a origem nunca foi coletada
+    """
+    marca = (_ler_json(caminho) or {}).get(url)
+    if not marca:
+        return None
+    return datetime.fromisoformat(marca["inicio_coleta"])
+
+
+def marca_pendente(url, inicio_coleta, tipo, caminho=CAMINHO_MARCAS_DAGUA):
+    """
+    Monta a marca d'água pendente da origem, gravada no manifesto da exportação
+
+    A marca só é efetivada pela silver depois que o CSV foi gravado (ou mesclado) no
+    Parquet; se a silver falhar, a próxima coleta repete o mesmo intervalo. O início
+    (e não o fim) da coleta é usado para que negócios alterados durante a exportação
+    entrem na próxima execução.
+
+    Args:
+        url (str): URL da origem
+        inicio_coleta (datetime): Momento (UTC) em que a coleta começou
+        tipo (str): "completa" ou "incremental"
+        caminho (str): Arquivo das marcas d'água
+
+    Returns:
+        dict: Campos extras do manifesto (marcas_pendentes e arquivo_marcas)
+    """
+    return {
+        "marcas_pendentes": {url: {"inicio_coleta": inicio_coleta.isoformat(), "tipo": tipo}},
+        "arquivo_marcas": caminho,
+    }
+
+
+def calcular_inicio_incremental(url, margem_horas=24, caminho=CAMINHO_MARCAS_DAGUA):
+    """
+    Calcula a data inicial do filtro incremental a partir da marca d'água
+
+    Args:
+        url (str): URL da origem
+        margem_horas (int): Margem de segurança subtraída da marca d'água
+        caminho (str): Arquivo das marcas d'água
+
+    Returns:
+        date: Data inicial do filtro, ou None se for necessária exportação completa
+    """
+    marca = obter_marca_dagua(url, caminho)
+    if marca is None:
+        print("ℹ️ Origem sem marca d'água - exportação completa")
+        return None
+
+    # O filtro da página é por dia; a margem cobre fuso horário e atrasos de atualização
+    return (marca - timedelta(hours=margem_horas)).date()
+
+
+def aplicar_filtro_data(driver, desde):
+    """
+    Aplica o filtro de data da página de pipeline para exportar apenas negócios desde a data
+
+    Os seletores são configuráveis em variaveis.py, pois dependem da tela da Clint.
+
+    Args:
+        driver: Driver do Selenium na página da origem (filtros de status já aplicados)
+        desde (date): Data inicial do filtro
+
+    Returns:
+        bool: True se o filtro foi aplicado; False indica exportação completa
+    """
+    try:
+        from variaveis import (clint_seletor_filtro_data, clint_seletor_campo_data,
+                               clint_seletor_data_inicial, clint_formato_filtro_data)
+
+        print(f"📅 Aplicando filtro incremental a partir de {desde:%d/%m/%Y}...")
+
+        aguardar(driver, elemento_clicavel(By.CSS_SELECTOR, clint_seletor_filtro_data),
+                 "filtro de data clicável", timeout=10).click()
+
+        # Campo de data a filtrar (ex.: data de atualização), quando a tela oferece opções
+        if clint_seletor_campo_data:
+            aguardar(driver, elemento_clicavel(By.XPATH, clint_seletor_campo_data),
+                     "campo do filtro de data clicável", timeout=10).click()
+
+        campo_data = aguardar(driver, elemento_clicavel(By.CSS_SELECTOR, clint_seletor_data_inicial),
+                              "data inicial do filtro visível", timeout=10)
+        campo_data.send_keys(Keys.CONTROL, "a")
+        campo_data.send_keys(desde.strftime(clint_formato_filtro_data), Keys.ENTER)
+
+        # O delta pode ser vazio, por isso a contagem mínima é zero
+        aguardar(driver, contagem_linhas_estavel(minimo=0),
+                 "linhas de negócios estáveis após filtro de data", timeout=60, obrigatoria=False)
+
+        print("✅ Filtro incremental aplicado.")
+        return True
+
+    except Exception as e:
+        print(f"⚠️ Filtro de data não aplicado, usando exportação completa: {e}")
+        return False
+
+
+def escrever_manifesto(pasta, tipo, desde=None, extras=None):
+    """
+    Grava o manifesto da exportação ao lado do CSV, indicando à silver se é completa ou delta
+
+    Args:
+        pasta (str): Pasta do CSV exportado
+        tipo (str): "completa" ou "incremental"
+        desde (date ou str): Data inicial do filtro incremental
+        extras (dict): Campos adicionais do manifesto
+    """
+    try:
+        if desde is not None and not isinstance(desde, str):
+            desde = desde.isoformat()
+        _gravar_json(os.path.join(pasta, NOME_MANIFESTO), {
+            "tipo": tipo,
+            "desde": desde,
+            "gerado_em": datetime.now(timezone.utc).isoformat(),
+            **(extras or {}),
+        })
+    except Exception as e:
+        print(f"⚠️ Erro ao gravar manifesto da exportação: {e}")
+
+
+def ler_manifesto(pasta):
+    """
+    Lê o manifesto da exportação; sem manifesto, a exportação é tratada como completa
+
+    Returns:
+        dict: Manifesto da exportação
+    """
+    return _ler_json(os.path.join(pasta, NOME_MANIFESTO)) or {"tipo": TIPO_COMPLETA}
@@ -3,8 +3,11 @@ Módulo de Login para Plataforma Clint
 Responsável por: Acesso, login básico e contagem regressiva
 """
 
-from variaveis import clint_url, clint_user, clint_password
+from variaveis import (clint_url, clint_user, clint_password, clint_pasta_downloads,
+                       clint_modo_exportacao, clint_perfil_driver)
 from funcoes import contagem_regressiva
+from clint_waits import aguardar, pagina_carregada, login_processado
+from clint_export_http import habilitar_log_rede
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
@@ -20,16 +23,54 @@ sys.path.append(utils_path)
 
 # Importar após configurar o path (como no clint_login_plataforma.py)
 
-
-def criar_driver_chrome():
+# Argumentos do perfil "leve": headless, sem GPU/extensões e com cache/memória reduzidos
+ARGUMENTOS_PERFIL_LEVE = [
+    "--headless=new",
+    "--window-size=1920,1080",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-dev-shm-usage",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--no-first-run",
+    "--mute-audio",
+    "--disk-cache-size=33554432",
+    "--media-cache-size=1",
+    "--js-flags=--max-old-space-size=512",
+]
+
+# Recursos bloqueados via CDP no perfil "leve" (imagens, mídia, fontes e rastreadores)
+URLS_BLOQUEADAS_PERFIL_LEVE = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.mp4", "*.webm", "*.mp3", "*.wav",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*", "*clarity.ms*",
+    "*segment.io*", "*segment.com*", "*intercom.io*", "*intercomcdn.com*",
+    "*mixpanel.com*", "*amplitude.com*", "*fullstory.com*",
+]
+
+
+def criar_driver_chrome(downloads_path=None, perfil=None):
     """
     Cria e configura o driver do Chrome para automação
+
+    Args:
+        downloads_path (str): Pasta de downloads (padrão: clint_pasta_downloads)
+        perfil (str): "padrao" ou "leve" (padrão: clint_perfil_driver)
     """
     try:
-        print("🌐 Configurando navegador Chrome...")
+        perfil = perfil or clint_perfil_driver
+        print(f"🌐 Configurando navegador Chrome (perfil {perfil})...")
 
         chrome_options = webdriver.ChromeOptions()
-        chrome_options.add_argument("--start-maximized")
+        if perfil == "leve":
+            for argumento in ARGUMENTOS_PERFIL_LEVE:
+                chrome_options.add_argument(argumento)
+        else:
+            chrome_options.add_argument("--start-maximized")
         chrome_options.add_argument(
             "--disable-blink-features=AutomationControlled")
         chrome_options.add_experimental_option(
@@ -37,20 +78,35 @@ def criar_driver_chrome():
         chrome_options.add_experimental_option('useAutomationExtension', False)
 
         # Configurar pasta de downloads personalizada
-        downloads_path = r"C:\Repositorio\Python\p95-accelera360\data\bronze\leads-forms-accelera"
+        downloads_path = downloads_path or clint_pasta_downloads
         os.makedirs(downloads_path, exist_ok=True)
 
-        chrome_options.add_experimental_option("prefs", {
+        preferencias = {
             "download.default_directory": downloads_path,
             "download.prompt_for_download": False,
             "download.directory_upgrade": True,
             "safebrowsing.enabled": True
-        })
+        }
+        if perfil == "leve":
+            preferencias["profile.managed_default_content_settings.images"] = 2
+        chrome_options.add_experimental_option("prefs", preferencias)
+
+        # Log de rede necessário para aprender a requisição de exportação HTTP
+        if clint_modo_exportacao == "http":
+            habilitar_log_rede(chrome_options)
 
         driver = webdriver.Chrome(options=chrome_options)
         driver.execute_script(
             "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
 
+        if perfil == "leve":
+            # Bloquear recursos desnecessários e garantir downloads no modo headless
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {
+                "urls": URLS_BLOQUEADAS_PERFIL_LEVE})
+            driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+                "behavior": "allow", "downloadPath": os.path.abspath(downloads_path)})
+
         print("✅ Driver Chrome criado com sucesso!")
         return driver
 
@@ -85,14 +141,13 @@ def fazer_login(driver):
         # Acessar o site da Clint
         print(f"🔗 Acessando: {clint_url}")
         driver.get(clint_url)
-        time.sleep(3)
-
-        print("✅ Site da Clint carregado com sucesso!")
-        print(f"📄 Título da página: {driver.title}")
 
         # Aguardar página de login carregar
         print("⏳ Aguardando página de login carregar...")
-        time.sleep(3)
+        aguardar(driver, pagina_carregada(), "página de login carregada")
+
+        print("✅ Site da Clint carregado com sucesso!")
+        print(f"📄 Título da página: {driver.title}")
 
         # Realizar login automático
         print("🔐 Iniciando processo de login...")
@@ -105,7 +160,6 @@ def fazer_login(driver):
         email_field.clear()
         email_field.send_keys(clint_user)
         print(f"✅ Email preenchido: {clint_user}")
-        time.sleep(1)
 
         # Campo de senha
         password_field = wait.until(EC.presence_of_element_located(
@@ -115,7 +169,6 @@ def fazer_login(driver):
         password_field.clear()
         password_field.send_keys(clint_password)
         print("✅ Senha preenchida")
-        time.sleep(1)
 
         # Botão de continuar
         continue_button = wait.until(EC.element_to_be_clickable(
@@ -125,7 +178,8 @@ def fazer_login(driver):
 
         # Aguardar processamento do login
         print("⏳ Aguardando processamento do login...")
-        time.sleep(5)
+        aguardar(driver, login_processado(), "login processado",
+                 timeout=30, obrigatoria=False)
 
         print("✅ Login realizado com sucesso!")
         return True
@@ -158,18 +212,20 @@ def aguardar_contagem_regressiva(segundos=45):
         print("\n✅ Tempo de espera concluído!")
 
 
-def executar_login_completo():
+def executar_login_completo(driver=None):
     """
     Executa o processo completo de login
 
+    Args:
+        driver: Driver já criado (opcional); se não informado, um novo é criado
+
     Returns:
         driver: Driver configurado e logado, ou None se falhar
     """
-    driver = None
-
     try:
         # Criar driver
-        driver = criar_driver_chrome()
+        if not driver:
+            driver = criar_driver_chrome()
         if not driver:
             return None
 
@@ -178,9 +234,6 @@ def executar_login_completo():
             print("❌ Falha no login")
             return None
 
-        # Aguardar contagem regressiva
-        aguardar_contagem_regressiva(60)
-
         print("🎉 Processo de login completo finalizado com sucesso!")
         return driver
 
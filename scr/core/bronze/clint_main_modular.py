@@ -3,9 +3,7 @@ Main Modular para RPA da Plataforma Clint
 Orquestra todos os módulos mantendo a sessão compartilhada
 """
 
-from clint_data_collection import executar_coleta_completa
-from clint_token_verification import executar_verificacao_token
-from clint_login import executar_login_completo
+from datetime import datetime, timezone
 import time
 import sys
 import os
@@ -20,45 +18,108 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
 
 # Importar módulos (APÓS configurar o path)
+# Apenas o cliente do serviço é importado no topo; Selenium e pandas são carregados
+# dentro das funções, para que o pedido a um serviço aquecido não pague essas importações
+from clint_servico_coleta import (consultar_servico, solicitar_coleta,  # noqa: E402
+                                  iniciar_servico, encerrar_servico)
+from rastreamento import span, iniciar_span, exportar_rastreamento  # noqa: E402
 
 
-def executar_rpa_completo():
+def autenticar_driver(driver, provedor_token=None):
+    """
+    Autentica o driver restaurando a sessão salva ou, se expirada, com login e token
+
+    Args:
+        driver: Driver do Selenium recém-criado (ou com sessão expirada)
+        provedor_token: Provedor do token 2FA (padrão: provedor compartilhado do BigQuery)
+
+    Returns:
+        bool: True se o driver está autenticado
+    """
+    from clint_token_verification import executar_verificacao_token
+    from clint_login import executar_login_completo
+    from clint_session import restaurar_sessao, salvar_sessao
+
+    # ETAPA 0: SESSÃO SALVA
+    print("\n📋 ETAPA 0: RESTAURAÇÃO DA SESSÃO SALVA")
+    print("-" * 40)
+
+    with span("bronze.sessao") as rastro:
+        sessao_restaurada = restaurar_sessao(driver)
+        rastro.definir(restaurada=sessao_restaurada)
+
+    if sessao_restaurada:
+        print("✅ ETAPA 0 CONCLUÍDA: Sessão restaurada, login e token dispensados!")
+        return True
+
+    # ETAPA 1: LOGIN
+    print("\n📋 ETAPA 1: LOGIN NA PLATAFORMA")
+    print("-" * 40)
+    inicio_login = datetime.now(timezone.utc)
+    with span("bronze.login"):
+        driver_logado = executar_login_completo(driver)
+
+    if not driver_logado:
+        print("❌ Falha na etapa de login. RPA interrompido.")
+        return False
+
+    print("✅ ETAPA 1 CONCLUÍDA: Login realizado com sucesso!")
+
+    # ETAPA 2: VERIFICAÇÃO DE TOKEN
+    print("\n📋 ETAPA 2: VERIFICAÇÃO DE TOKEN")
+    print("-" * 40)
+    with span("bronze.token"):
+        driver_verificado = executar_verificacao_token(
+            driver, desde=inicio_login, provedor=provedor_token)
+
+    if not driver_verificado:
+        print("❌ Falha na etapa de verificação de token. RPA interrompido.")
+        return False
+
+    print("✅ ETAPA 2 CONCLUÍDA: Token verificado com sucesso!")
+
+    # Salvar sessão para as próximas execuções
+    salvar_sessao(driver)
+    return True
+
+
+def executar_rpa_completo(provedor_token=None):
     """
     Executa o RPA completo em sequência, mantendo a sessão compartilhada
+
+    Args:
+        provedor_token: Provedor do token 2FA (padrão: provedor compartilhado do BigQuery)
     """
+    from clint_data_collection import executar_coleta_completa
+    from clint_login import criar_driver_chrome
+    from clint_waits import resumo_esperas
+
     driver = None
     sucesso_total = True
+    concluido = False
+    rastro = iniciar_span("bronze")
 
     try:
         print("🚀 INICIANDO RPA COMPLETO DA PLATAFORMA CLINT")
         print("=" * 60)
 
-        # ETAPA 1: LOGIN
-        print("\n📋 ETAPA 1: LOGIN NA PLATAFORMA")
-        print("-" * 40)
-        driver = executar_login_completo()
+        with span("bronze.navegador"):
+            driver = criar_driver_chrome()
 
         if not driver:
-            print("❌ Falha na etapa de login. RPA interrompido.")
+            print("❌ Falha ao criar o navegador. RPA interrompido.")
             return False
 
-        print("✅ ETAPA 1 CONCLUÍDA: Login realizado com sucesso!")
-
-        # ETAPA 2: VERIFICAÇÃO DE TOKEN
-        print("\n📋 ETAPA 2: VERIFICAÇÃO DE TOKEN")
-        print("-" * 40)
-        driver = executar_verificacao_token(driver)
-
-        if not driver:
-            print("❌ Falha na etapa de verificação de token. RPA interrompido.")
+        if not autenticar_driver(driver, provedor_token):
             return False
 
-        print("✅ ETAPA 2 CONCLUÍDA: Token verificado com sucesso!")
-
         # ETAPA 3: COLETA DE DADOS
         print("\n📋 ETAPA 3: COLETA DE DADOS")
         print("-" * 40)
-        if not executar_coleta_completa(driver):
+        with span("bronze.coleta"):
+            coleta_ok = executar_coleta_completa(driver)
+
+        if not coleta_ok:
             print("⚠️ Falha na etapa de coleta de dados.")
             sucesso_total = False
         else:
@@ -74,6 +135,7 @@ def executar_rpa_completo():
             print("✅ Login e verificação concluídos")
             print("⚠️ Alguns problemas na coleta de dados")
 
+        concluido = True
         return sucesso_total
 
     except Exception as e:
@@ -81,6 +143,9 @@ def executar_rpa_completo():
         return False
 
     finally:
+        # Exibir onde o tempo de espera foi gasto
+        resumo_esperas()
+
         # Sempre fechar o navegador
         if driver:
             print("\n🚪 Fechando navegador...")
@@ -90,15 +155,23 @@ def executar_rpa_completo():
             except Exception as e:
                 print(f"⚠️ Erro ao fechar navegador: {e}")
 
+        # Gravar os spans da execução (JSON lines + Chrome trace)
+        rastro.encerrar(sucesso=concluido and sucesso_total)
+        arquivo_jsonl, arquivo_trace = exportar_rastreamento("bronze")
+        print(f"🧭 Rastreamento salvo em: {arquivo_jsonl} e {arquivo_trace}")
+
 
 def executar_etapa_especifica(etapa):
     """
     Executa uma etapa específica do RPA
 
     Args:
-        etapa (str): Nome da etapa ('login', 'token', 'dados', 'todos')
+        etapa (str): Nome da etapa ('login', 'token', 'dados', 'todos',
+            'servico', 'encerrar-servico')
     """
     if etapa.lower() == 'login':
+        from clint_login import executar_login_completo
+
         print("🔐 Executando apenas etapa de LOGIN...")
         driver = executar_login_completo()
         if driver:
@@ -117,10 +190,30 @@ def executar_etapa_especifica(etapa):
         print("💡 Execute primeiro: python clint_main_modular.py login")
 
     elif etapa.lower() == 'todos':
+        # Com o serviço em execução, apenas pedir a coleta ao navegador já autenticado
+        if consultar_servico():
+            print("🛰️ Serviço de coleta ativo - enviando pedido de coleta...")
+            if solicitar_coleta():
+                return
+            # Um pedido sem resposta pode continuar rodando no serviço; o RPA completo só
+            # assume a coleta se o serviço deixou de responder
+            if consultar_servico():
+                print("❌ Coleta pelo serviço não concluída")
+                return
+            print("⚠️ Serviço de coleta parou de responder - executando o RPA completo...")
         executar_rpa_completo()
 
+    elif etapa.lower() == 'servico':
+        iniciar_servico()
+
+    elif etapa.lower() == 'encerrar-servico':
+        if encerrar_servico():
+            print("✅ Pedido de encerramento enviado ao serviço")
+        else:
+            print("⚠️ Serviço de coleta não está em execução")
+
     else:
-        print("❌ Etapa inválida. Use: login, token, dados ou todos")
+        print("❌ Etapa inválida. Use: login, token, dados, todos, servico ou encerrar-servico")
 
 
 def mostrar_menu():
@@ -6,6 +6,7 @@ Orquestra todos os módulos mantendo a sessão compartilhada
 from clint_data_collection import executar_coleta_completa
 from clint_token_verification import executar_verificacao_token
 from clint_login import executar_login_completo
+from datetime import datetime, timezone
 import time
 import sys
 import os
@@ -36,6 +37,7 @@ def executar_rpa_completo():
         # ETAPA 1: LOGIN
         print("\n📋 ETAPA 1: LOGIN NA PLATAFORMA")
         print("-" * 40)
+        inicio_login = datetime.now(timezone.utc)
         driver = executar_login_completo()
 
         if not driver:
@@ -47,7 +49,7 @@ def executar_rpa_completo():
         # ETAPA 2: VERIFICAÇÃO DE TOKEN
         print("\n📋 ETAPA 2: VERIFICAÇÃO DE TOKEN")
         print("-" * 40)
-        driver = executar_verificacao_token(driver)
+        driver = executar_verificacao_token(driver, desde=inicio_login)
 
         if not driver:
             print("❌ Falha na etapa de verificação de token. RPA interrompido.")
@@ -0,0 +1,230 @@
+"""
+Módulo de Coleta Concorrente para Plataforma Clint
+Responsável por: Coletar várias origens em paralelo com um pool limitado de drivers autenticados
+"""
+
+from clint_data_collection import coletar_dados_url
+from clint_login import criar_driver_chrome
+from clint_session import capturar_sessao, aplicar_sessao
+from rastreamento import span, span_atual, tamanho_arquivo
+from clint_incremental import (ler_manifesto, escrever_manifesto, NOME_MANIFESTO,
+                               TIPO_COMPLETA, TIPO_INCREMENTAL)
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import queue
+import os
+import pandas as pd
+
+
+def pasta_da_origem(url, pasta_base):
+    """
+    Retorna a pasta de downloads exclusiva de uma origem
+
+    Args:
+        url (str): URL da origem na Clint (.../origin/<id>)
+        pasta_base (str): Pasta de downloads da camada bronze
+
+    Returns:
+        str: Caminho da pasta da origem (criada se não existir)
+    """
+    id_origem = url.rstrip('/').split('/')[-1]
+    pasta = os.path.join(pasta_base, 'origens', id_origem)
+    os.makedirs(pasta, exist_ok=True)
+    return pasta
+
+
+def definir_pasta_download(driver, pasta):
+    """
+    Redireciona os downloads do navegador para a pasta informada via CDP
+    """
+    driver.execute_cdp_cmd("Browser.setDownloadBehavior", {
+        "behavior": "allow",
+        "downloadPath": os.path.abspath(pasta),
+    })
+
+
+def criar_driver_com_sessao(sessao, pasta_base):
+    """
+    Cria um driver adicional já autenticado com os cookies da sessão principal
+
+    Args:
+        sessao (dict): Sessão capturada do driver autenticado
+        pasta_base (str): Pasta de downloads padrão do novo driver
+
+    Returns:
+        driver: Driver autenticado, ou None se falhar
+    """
+    driver = criar_driver_chrome(pasta_base)
+    if not driver:
+        return None
+
+    try:
+        aplicar_sessao(driver, sessao)
+        return driver
+    except Exception as e:
+        print(f"⚠️ Erro ao aplicar sessão no driver adicional: {e}")
+        driver.quit()
+        return None
+
+
+def consolidar_downloads(arquivos, destino, origens_faltantes=None):
+    """
+    Consolida os CSVs baixados por origem em um único arquivo bronze
+
+    A exportação consolidada só é marcada como completa (a silver substitui a base) quando
+    todas as origens solicitadas chegaram nesta execução com exportação completa. Com alguma
+    origem faltando ou incremental, o manifesto pede mescla (desde a menor data inicial), e
+    os negócios das origens que falharam continuam na silver em vez de desaparecer. Só as
+    origens consolidadas levam marca d'água pendente para a silver efetivar.
+
+    Args:
+        arquivos (list): Caminhos dos CSVs de cada origem coletada nesta execução
+        destino (str): Caminho do CSV consolidado
+        origens_faltantes (list): Origens solicitadas que não geraram CSV nesta execução
+
+    Returns:
+        bool: True se o arquivo consolidado foi gerado
+    """
+    origens_faltantes = list(origens_faltantes or [])
+    ausentes = [a for a in arquivos if not os.path.exists(a)]
+    if ausentes:
+        print(f"⚠️ {len(ausentes)} arquivo(s) de origem não encontrado(s): {ausentes}")
+        origens_faltantes += ausentes
+    arquivos = [a for a in arquivos if os.path.exists(a)]
+    if not arquivos:
+        print("❌ Nenhum arquivo de origem disponível para consolidar")
+        return False
+
+    # Exportações de pipelines diferentes podem ter colunas de formulário diferentes
+    df = pd.concat([pd.read_csv(a) for a in arquivos], ignore_index=True)
+    df.to_csv(destino, index=False)
+
+    manifestos = [ler_manifesto(os.path.dirname(a)) for a in arquivos]
+    completa = not origens_faltantes and all(
+        m.get("tipo") == TIPO_COMPLETA for m in manifestos)
+    desde = min((m["desde"] for m in manifestos if m.get("desde")), default=None)
+    marcas = {"marcas_pendentes": {}}
+    for m in manifestos:
+        marcas["marcas_pendentes"].update(m.get("marcas_pendentes") or {})
+        if m.get("arquivo_marcas"):
+            marcas["arquivo_marcas"] = m["arquivo_marcas"]
+    if origens_faltantes:
+        print(f"⚠️ Exportação parcial ({len(origens_faltantes)} origem(ns) sem arquivo "
+              "nesta execução) - a silver vai mesclar em vez de substituir a base")
+    escrever_manifesto(os.path.dirname(destino),
+                       TIPO_COMPLETA if completa else TIPO_INCREMENTAL, desde,
+                       {"parcial": bool(origens_faltantes),
+                        "origens_faltantes": origens_faltantes, **marcas})
+
+    print(
+        f"✅ {len(arquivos)} arquivo(s) consolidado(s) em {destino} ({len(df)} linhas)")
+    return True
+
+
+def executar_coleta_concorrente(driver, urls, nomes_arquivos, concorrencia):
+    """
+    Coleta as origens em paralelo usando um pool limitado de drivers
+
+    O driver principal participa do pool; os demais drivers são criados com
+    os mesmos cookies/localStorage, sem novo login ou 2FA. Cada origem baixa
+    para sua própria pasta e os arquivos são consolidados ao final.
+
+    Args:
+        driver: Driver do Selenium autenticado
+        urls (list): URLs das origens
+        nomes_arquivos (list): Nome do arquivo de cada origem
+        concorrencia (int): Quantidade máxima de origens coletadas ao mesmo tempo
+
+    Returns:
+        bool: True se ao menos uma origem foi coletada e consolidada (com origens
+        faltando, o manifesto consolidado pede mescla na silver)
+    """
+    from variaveis import clint_pasta_downloads
+
+    concorrencia = max(1, min(concorrencia, len(urls)))
+    print(
+        f"🚀 Coleta concorrente de {len(urls)} origens com {concorrencia} navegador(es)...")
+
+    sessao = capturar_sessao(driver)
+
+    # Pool de drivers: o principal + drivers adicionais semeados com a sessão
+    drivers = [driver]
+    for _ in range(concorrencia - 1):
+        novo_driver = criar_driver_com_sessao(sessao, clint_pasta_downloads)
+        if novo_driver:
+            drivers.append(novo_driver)
+
+    print(f"✅ Pool com {len(drivers)} navegador(es) autenticado(s)")
+
+    disponiveis = queue.Queue()
+    for d in drivers:
+        disponiveis.put(d)
+
+    # Spans das threads do pool ficam abaixo do span da coleta
+    span_coleta = span_atual()
+
+    def _coletar(index, url):
+        pasta = pasta_da_origem(url, clint_pasta_downloads)
+        arquivo = os.path.join(pasta, "leads-forms-accelera.csv")
+
+        # Remover CSV e manifesto de execuções anteriores: só o arquivo baixado nesta
+        # coleta pode ser consolidado (o fallback pelo DOM não grava CSV na pasta)
+        for antigo in (arquivo, os.path.join(pasta, NOME_MANIFESTO)):
+            if os.path.exists(antigo):
+                os.remove(antigo)
+
+        with span("bronze.aguardar_navegador", pai=span_coleta):
+            driver_origem = disponiveis.get()
+        try:
+            with span("bronze.worker", pai=span_coleta, url=url):
+                definir_pasta_download(driver_origem, pasta)
+                sucesso = coletar_dados_url(
+                    driver_origem, url, nomes_arquivos[index - 1], index, len(urls), pasta)
+            return sucesso, arquivo if os.path.exists(arquivo) else None
+        finally:
+            disponiveis.put(driver_origem)
+
+    arquivos_baixados = []
+    origens_faltantes = []
+    try:
+        with ThreadPoolExecutor(max_workers=len(drivers)) as executor:
+            futuros = {executor.submit(_coletar, i, url): i
+                       for i, url in enumerate(urls, 1)}
+
+            for futuro in as_completed(futuros):
+                index = futuros[futuro]
+                try:
+                    sucesso, arquivo = futuro.result()
+                    if sucesso and arquivo:
+                        arquivos_baixados.append((index, arquivo))
+                    elif sucesso:
+                        print(f"⚠️ URL {index} coletada sem CSV local (método alternativo), "
+                              "fora da consolidação")
+                        origens_faltantes.append(urls[index - 1])
+                    else:
+                        print(f"⚠️ Falha na URL {index}, continuando...")
+                        origens_faltantes.append(urls[index - 1])
+                except Exception as e:
+                    print(f"❌ Erro na coleta da URL {index}: {e}")
+                    origens_faltantes.append(urls[index - 1])
+
+    finally:
+        # Fechar apenas os drivers adicionais; o principal é fechado pelo main
+        for d in drivers[1:]:
+            try:
+                d.quit()
+            except Exception:
+                pass
+
+        # Restaurar a pasta de downloads padrão do driver principal
+        try:
+            definir_pasta_download(driver, clint_pasta_downloads)
+        except Exception:
+            pass
+
+    destino = os.path.join(clint_pasta_downloads, "leads-forms-accelera.csv")
+    with span("bronze.consolidacao", origens=len(arquivos_baixados),
+              faltantes=len(origens_faltantes)) as rastro:
+        consolidado = consolidar_downloads(
+            [arquivo for _, arquivo in sorted(arquivos_baixados)], destino, origens_faltantes)
+        rastro.definir(bytes=tamanho_arquivo(destino) if consolidado else None)
+    return consolidado
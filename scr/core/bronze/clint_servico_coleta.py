@@ -0,0 +1,322 @@
+"""
+Serviço de Coleta com Navegador Aquecido para Plataforma Clint
+Responsável por: Manter um Chrome autenticado entre execuções e atender pedidos de coleta
+via HTTP local (127.0.0.1), renovando a sessão apenas quando ela expira
+
+Uso:
+    python clint_servico_coleta.py            # inicia o serviço
+    GET  /status                              # estado do serviço
+    POST /coletar {"urls": [...], "concorrencia": N}
+    POST /encerrar
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from datetime import datetime
+import urllib.request
+import urllib.error
+import threading
+import json
+import time
+import os
+import sys
+
+# Adicionar o diretório utils ao path para importação
+utils_path = os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), '..', '..', 'utils')
+sys.path.append(utils_path)
+
+# Importar após configurar o path
+from variaveis import clint_servico_porta  # noqa: E402
+from rastreamento import span, limpar_rastreamento, exportar_rastreamento  # noqa: E402
+
+HOST_SERVICO = "127.0.0.1"
+
+
+class ServicoColeta:
+    """
+    Mantém um único driver autenticado e serializa os pedidos de coleta sobre ele
+    """
+
+    def __init__(self):
+        self.driver = None
+        self.lock = threading.Lock()
+        self.iniciado_em = datetime.now().isoformat()
+        self.autenticado_em = None
+        self.ultima_coleta = None
+        self.total_coletas = 0
+
+    def _driver_ativo(self):
+        """
+        Verifica se o Chrome ainda responde (pode ter sido fechado ou travado)
+        """
+        if self.driver is None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except Exception:
+            return False
+
+    def _garantir_autenticacao(self):
+        """
+        Recria o navegador se necessário e refaz a autenticação só quando a sessão expirou
+
+        Returns:
+            bool: True se o driver está pronto para coletar
+        """
+        from clint_login import criar_driver_chrome
+        from clint_main_modular import autenticar_driver
+        from clint_session import validar_sessao
+
+        if not self._driver_ativo():
+            print("🌐 Iniciando navegador do serviço...")
+            self.encerrar_driver()
+            self.driver = criar_driver_chrome()
+            if not self.driver:
+                return False
+        elif self.autenticado_em and validar_sessao(self.driver):
+            return True
+
+        print("🔐 Sessão ausente ou expirada - autenticando...")
+        if not autenticar_driver(self.driver):
+            return False
+
+        self.autenticado_em = datetime.now().isoformat()
+        return True
+
+    def coletar(self, urls=None, concorrencia=None):
+        """
+        Executa uma coleta com o navegador aquecido (um pedido por vez)
+
+        Args:
+            urls (list): Origens a coletar (padrão: clint_urls)
+            concorrencia (int): Origens coletadas em paralelo (padrão: clint_concorrencia)
+
+        Returns:
+            dict: Resultado da coleta com sucesso e duração em segundos
+        """
+        from clint_data_collection import executar_coleta_completa
+        from clint_waits import resumo_esperas, limpar_registro_esperas
+
+        with self.lock:
+            inicio = time.perf_counter()
+            limpar_registro_esperas()
+            limpar_rastreamento()
+            try:
+                with span("bronze.servico") as rastro:
+                    with span("bronze.autenticacao"):
+                        autenticado = self._garantir_autenticacao()
+                    with span("bronze.coleta"):
+                        sucesso = autenticado and executar_coleta_completa(
+                            self.driver, concorrencia, urls)
+                    rastro.definir(sucesso=bool(sucesso))
+            except Exception as e:
+                print(f"❌ Erro na coleta do serviço: {e}")
+                sucesso = False
+            finally:
+                resumo_esperas()
+                exportar_rastreamento("bronze_servico")
+
+            duracao = time.perf_counter() - inicio
+            self.total_coletas += 1
+            self.ultima_coleta = {
+                "concluida_em": datetime.now().isoformat(),
+                "sucesso": bool(sucesso),
+                "duracao": round(duracao, 2),
+            }
+            return self.ultima_coleta
+
+    def _navegador_ativo_status(self):
+        """
+        Informa se o navegador está ativo sem disputar o driver com uma coleta em andamento
+
+        O chromedriver atende um comando por vez: consultar o driver durante uma coleta pode
+        passar do tempo da sonda de /status, e o cliente concluiria que o serviço caiu.
+
+        Returns:
+            tuple: (em_execucao, navegador_ativo)
+        """
+        if not self.lock.acquire(blocking=False):
+            # Coleta em andamento: o driver está em uso e, portanto, ativo
+            return True, self.driver is not None
+        try:
+            return False, self._driver_ativo()
+        finally:
+            self.lock.release()
+
+    def status(self):
+        """
+        Retorna o estado atual do serviço
+        """
+        em_execucao, navegador_ativo = self._navegador_ativo_status()
+        return {
+            "iniciado_em": self.iniciado_em,
+            "autenticado_em": self.autenticado_em,
+            "em_execucao": em_execucao,
+            "navegador_ativo": navegador_ativo,
+            "total_coletas": self.total_coletas,
+            "ultima_coleta": self.ultima_coleta,
+        }
+
+    def encerrar_driver(self):
+        """
+        Fecha o navegador do serviço, se aberto
+        """
+        if self.driver:
+            try:
+                self.driver.quit()
+            except Exception as e:
+                print(f"⚠️ Erro ao fechar navegador: {e}")
+            self.driver = None
+
+
+class ManipuladorServico(BaseHTTPRequestHandler):
+    """
+    Rotas HTTP do serviço de coleta
+    """
+
+    def _responder(self, codigo, dados):
+        corpo = json.dumps(dados).encode('utf-8')
+        self.send_response(codigo)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(corpo)))
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _ler_corpo(self):
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        if not tamanho:
+            return {}
+        return json.loads(self.rfile.read(tamanho).decode('utf-8'))
+
+    def do_GET(self):
+        if self.path == "/status":
+            self._responder(200, self.server.servico.status())
+        else:
+            self._responder(404, {"erro": "rota não encontrada"})
+
+    def do_POST(self):
+        try:
+            corpo = self._ler_corpo()
+        except ValueError:
+            self._responder(400, {"erro": "corpo JSON inválido"})
+            return
+
+        if self.path == "/coletar":
+            resultado = self.server.servico.coletar(
+                corpo.get("urls"), corpo.get("concorrencia"))
+            self._responder(200 if resultado["sucesso"] else 500, resultado)
+
+        elif self.path == "/encerrar":
+            self._responder(200, {"encerrando": True})
+            threading.Thread(target=self.server.shutdown, daemon=True).start()
+
+        else:
+            self._responder(404, {"erro": "rota não encontrada"})
+
+    def log_message(self, formato, *args):
+        print(f"🛰️ {self.address_string()} - {formato % args}")
+
+
+def iniciar_servico(porta=None, aquecer=True):
+    """
+    Inicia o serviço de coleta e atende pedidos até receber /encerrar ou Ctrl+C
+
+    Args:
+        porta (int): Porta local do serviço (padrão: clint_servico_porta)
+        aquecer (bool): Autentica o navegador já na inicialização
+    """
+    porta = porta or clint_servico_porta
+    servico = ServicoColeta()
+
+    if aquecer:
+        with servico.lock:
+            if not servico._garantir_autenticacao():
+                print("⚠️ Aquecimento falhou; a autenticação será refeita no primeiro pedido")
+
+    servidor = ThreadingHTTPServer((HOST_SERVICO, porta), ManipuladorServico)
+    servidor.servico = servico
+
+    print(f"🚀 Serviço de coleta ouvindo em http://{HOST_SERVICO}:{porta}")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Serviço interrompido pelo usuário")
+    finally:
+        servidor.server_close()
+        servico.encerrar_driver()
+        print("✅ Serviço de coleta encerrado")
+
+
+def _requisitar(metodo, rota, dados=None, porta=None, timeout=5):
+    """
+    Envia uma requisição JSON ao serviço local e retorna (status, resposta)
+    """
+    porta = porta or clint_servico_porta
+    corpo = json.dumps(dados).encode('utf-8') if dados is not None else None
+    requisicao = urllib.request.Request(
+        f"http://{HOST_SERVICO}:{porta}{rota}", data=corpo, method=metodo,
+        headers={"Content-Type": "application/json"})
+    try:
+        with urllib.request.urlopen(requisicao, timeout=timeout) as resposta:
+            return resposta.status, json.loads(resposta.read().decode('utf-8'))
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read().decode('utf-8') or "{}")
+
+
+def consultar_servico(porta=None):
+    """
+    Consulta o estado do serviço de coleta
+
+    Returns:
+        dict: Estado do serviço, ou None se ele não estiver em execução
+    """
+    try:
+        _, estado = _requisitar("GET", "/status", porta=porta, timeout=2)
+        return estado
+    except (urllib.error.URLError, OSError, ValueError):
+        return None
+
+
+def solicitar_coleta(urls=None, concorrencia=None, porta=None, timeout=3600):
+    """
+    Pede uma coleta ao serviço e aguarda o resultado
+
+    Args:
+        urls (list): Origens a coletar (padrão do serviço: clint_urls)
+        concorrencia (int): Origens coletadas em paralelo
+        porta (int): Porta local do serviço
+        timeout (int): Tempo máximo de espera pela coleta em segundos
+
+    Returns:
+        bool: True se a coleta foi concluída com sucesso; False também quando o serviço não
+        responde, a conexão cai ou a resposta não é JSON
+    """
+    dados = {"urls": urls, "concorrencia": concorrencia}
+    try:
+        _, resultado = _requisitar("POST", "/coletar", dados,
+                                   porta=porta, timeout=timeout)
+    except (urllib.error.URLError, OSError, ValueError) as e:
+        # TimeoutError e ConnectionResetError são OSError; JSONDecodeError é ValueError
+        print(f"❌ Erro ao solicitar coleta ao serviço: {e}")
+        return False
+    print(
+        f"📨 Coleta pelo serviço: {'sucesso' if resultado.get('sucesso') else 'falha'} "
+        f"em {resultado.get('duracao')}s")
+    return bool(resultado.get("sucesso"))
+
+
+def encerrar_servico(porta=None):
+    """
+    Pede ao serviço que encerre e feche o navegador
+    """
+    try:
+        _requisitar("POST", "/encerrar", {}, porta=porta)
+        return True
+    except (urllib.error.URLError, OSError):
+        return False
+
+
+if __name__ == "__main__":
+    porta_servico = int(sys.argv[1]) if len(sys.argv) > 1 else None
+    iniciar_servico(porta_servico)
@@ -0,0 +1,210 @@
+"""
+Módulo de Sessão Persistente para Plataforma Clint
+Responsável por: Salvar, restaurar e validar a sessão autenticada (cookies e localStorage)
+"""
+
+from variaveis import clint_url, clint_urls, clint_pasta_sessao
+from clint_waits import aguardar
+from selenium.webdriver.common.by import By
+from datetime import datetime
+import json
+import os
+
+# Arquivo onde a sessão autenticada é salva entre execuções
+CAMINHO_SESSAO = os.path.join(clint_pasta_sessao, 'clint_sessao.json')
+
+# Seletores que indicam página autenticada ou tela de login
+SELETOR_PAGINA_AUTENTICADA = '[data-cy="tbl-status-deal-filter"]'
+SELETOR_FORMULARIO_LOGIN = "input[placeholder='Email']"
+
+
+def capturar_sessao(driver):
+    """
+    Captura cookies e localStorage da sessão autenticada do driver
+
+    Args:
+        driver: Driver do Selenium autenticado
+
+    Returns:
+        dict: Sessão no mesmo formato salvo em disco
+    """
+    local_storage = driver.execute_script("""
+        const itens = {};
+        for (let i = 0; i < window.localStorage.length; i++) {
+            const chave = window.localStorage.key(i);
+            itens[chave] = window.localStorage.getItem(chave);
+        }
+        return itens;
+    """)
+
+    return {
+        "salva_em": datetime.now().isoformat(),
+        "url": driver.current_url,
+        "cookies": driver.get_cookies(),
+        "local_storage": local_storage or {},
+    }
+
+
+def salvar_sessao(driver, caminho=CAMINHO_SESSAO):
+    """
+    Salva cookies e localStorage da sessão autenticada em disco
+
+    Args:
+        driver: Driver do Selenium autenticado (após verificação do token)
+        caminho (str): Arquivo de destino da sessão
+
+    Returns:
+        bool: True se a sessão foi salva com sucesso
+    """
+    try:
+        print("💾 Salvando sessão autenticada...")
+
+        sessao = capturar_sessao(driver)
+
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+
+        # Escrita atômica para não deixar arquivo corrompido se o processo cair
+        caminho_temporario = f"{caminho}.tmp"
+        with open(caminho_temporario, 'w', encoding='utf-8') as f:
+            json.dump(sessao, f)
+        os.replace(caminho_temporario, caminho)
+
+        print(
+            f"✅ Sessão salva ({len(sessao['cookies'])} cookies, {len(sessao['local_storage'])} itens de localStorage)")
+        return True
+
+    except Exception as e:
+        print(f"⚠️ Erro ao salvar sessão: {e}")
+        return False
+
+
+def carregar_sessao(caminho=CAMINHO_SESSAO):
+    """
+    Carrega a sessão salva em disco
+
+    Returns:
+        dict: Sessão salva, ou None se não existir ou estiver corrompida
+    """
+    if not os.path.exists(caminho):
+        print("ℹ️ Nenhuma sessão salva encontrada")
+        return None
+
+    try:
+        with open(caminho, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except Exception as e:
+        print(f"⚠️ Sessão salva inválida, será descartada: {e}")
+        remover_sessao(caminho)
+        return None
+
+
+def aplicar_sessao(driver, sessao):
+    """
+    Aplica cookies e localStorage de uma sessão no driver
+
+    O driver precisa estar no domínio da Clint para aceitar os cookies,
+    por isso a URL base é aberta antes da aplicação.
+
+    Args:
+        driver: Driver do Selenium
+        sessao (dict): Sessão carregada por carregar_sessao
+    """
+    driver.get(clint_url)
+    driver.delete_all_cookies()
+
+    for cookie in sessao.get("cookies", []):
+        cookie = dict(cookie)
+        if "expiry" in cookie:
+            cookie["expiry"] = int(cookie["expiry"])
+        if cookie.get("sameSite") not in ("Strict", "Lax", "None"):
+            cookie.pop("sameSite", None)
+        try:
+            driver.add_cookie(cookie)
+        except Exception as e:
+            print(f"⚠️ Cookie '{cookie.get('name')}' não aplicado: {e}")
+
+    driver.execute_script("""
+        const itens = arguments[0];
+        for (const chave in itens) {
+            window.localStorage.setItem(chave, itens[chave]);
+        }
+    """, sessao.get("local_storage", {}))
+
+
+def sessao_autenticada():
+    """
+    Condição: retorna "autenticada" se a página protegida renderizou ou "login" se caiu na tela de login
+    """
+    def _condicao(driver):
+        if "login" in driver.current_url or driver.find_elements(By.CSS_SELECTOR, SELETOR_FORMULARIO_LOGIN):
+            return "login"
+        if driver.find_elements(By.CSS_SELECTOR, SELETOR_PAGINA_AUTENTICADA):
+            return "autenticada"
+        return False
+    return _condicao
+
+
+def validar_sessao(driver, url_validacao=None, timeout=30):
+    """
+    Valida a sessão abrindo uma página que exige autenticação
+
+    Args:
+        driver: Driver do Selenium com a sessão aplicada
+        url_validacao (str): Página autenticada usada na validação
+        timeout (int): Tempo máximo de espera em segundos
+
+    Returns:
+        bool: True se a sessão continua válida
+    """
+    url_validacao = url_validacao or (clint_urls[0] if clint_urls else clint_url)
+    driver.get(url_validacao)
+
+    estado = aguardar(driver, sessao_autenticada(), "validação da sessão salva",
+                      timeout=timeout, obrigatoria=False)
+    return estado == "autenticada"
+
+
+def restaurar_sessao(driver, caminho=CAMINHO_SESSAO):
+    """
+    Restaura a sessão salva e valida se ela ainda está autenticada
+
+    Args:
+        driver: Driver do Selenium recém-criado
+        caminho (str): Arquivo da sessão salva
+
+    Returns:
+        bool: True se a sessão foi restaurada e validada; False exige login completo
+    """
+    try:
+        sessao = carregar_sessao(caminho)
+        if not sessao:
+            return False
+
+        print(f"♻️ Restaurando sessão salva em {sessao.get('salva_em')}...")
+        aplicar_sessao(driver, sessao)
+
+        if validar_sessao(driver):
+            print("✅ Sessão salva válida - login e verificação de token dispensados")
+            return True
+
+        print("⚠️ Sessão salva expirada - será necessário login completo")
+        remover_sessao(caminho)
+        driver.delete_all_cookies()
+        driver.execute_script("window.localStorage.clear();")
+        return False
+
+    except Exception as e:
+        print(f"⚠️ Erro ao restaurar sessão: {e}")
+        return False
+
+
+def remover_sessao(caminho=CAMINHO_SESSAO):
+    """
+    Remove a sessão salva em disco
+    """
+    try:
+        if os.path.exists(caminho):
+            os.remove(caminho)
+            print("🗑️ Sessão salva removida")
+    except Exception as e:
+        print(f"⚠️ Erro ao remover sessão salva: {e}")
@@ -0,0 +1,363 @@
+"""
+Simulador Local da Plataforma Clint
+Responsável por: Servir as telas gravadas de login, 2FA e pipeline e a exportação de um CSV
+de exemplo, com latências configuráveis, para medir o RPA sem acessar app.clint.digital
+
+Uso:
+    python clint_simulador.py [porta] [escala_latencia]
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+from datetime import datetime, timedelta, timezone
+import threading
+import secrets
+import random
+import json
+import time
+import csv
+import io
+import os
+import sys
+
+# Adicionar o diretório utils ao path para importação
+utils_path = os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), '..', '..', 'utils')
+sys.path.append(utils_path)
+
+# Importar após configurar o path
+from funcoes import ProvedorTokenAcesso  # noqa: E402
+
+# Telas gravadas e CSV de exemplo do simulador
+PASTA_SIMULADOR = os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), 'simulador')
+ARQUIVO_CSV_EXEMPLO = os.path.join(PASTA_SIMULADOR, 'exportacao_exemplo.csv')
+
+ID_ORIGEM_SIMULADA = "00000000-0000-4000-8000-000000000001"
+USUARIO_SIMULADO = "rpa@simulador.local"
+SENHA_SIMULADA = "simulador"
+COOKIE_SESSAO = "sessao_simulada"
+
+# Latências padrão em segundos de cada resposta do simulador
+LATENCIAS_PADRAO = {
+    "pagina": 0.2,          # HTML das telas
+    "login": 0.5,           # POST do email/senha
+    "campos_codigo": 1.0,   # tempo até os campos do código aparecerem
+    "token": 2.0,           # tempo até o token 2FA ficar disponível
+    "negocios": 0.5,        # carregamento dos cards do pipeline
+    "exportacao": 1.5,      # geração do arquivo exportado
+}
+
+
+class EstadoSimulador:
+    """
+    Estado compartilhado do simulador: sessões, token 2FA, arquivos exportados e contadores
+    """
+
+    def __init__(self, latencias=None, escala=1.0, arquivo_csv=ARQUIVO_CSV_EXEMPLO):
+        self.latencias = {chave: valor * escala for chave, valor in
+                          {**LATENCIAS_PADRAO, **(latencias or {})}.items()}
+        self.lock = threading.Lock()
+        self.sessoes = set()
+        self.token = None
+        self.data_token = None
+        self.arquivos = {}
+        self.contadores = {"logins": 0, "verificacoes": 0,
+                           "exportacoes": 0, "downloads": 0}
+
+        with open(arquivo_csv, 'r', encoding='utf-8', newline='') as f:
+            leitor = csv.DictReader(f)
+            self.colunas = leitor.fieldnames
+            self.negocios = list(leitor)
+
+    def aguardar(self, chave):
+        """
+        Simula a latência configurada para o tipo de resposta
+        """
+        time.sleep(self.latencias.get(chave, 0))
+
+    def gerar_token(self):
+        """
+        Gera o token 2FA do login atual, disponível após a latência de envio
+        """
+        with self.lock:
+            self.token = f"{random.randint(0, 999999):06d}"
+            self.data_token = datetime.now(timezone.utc) + \
+                timedelta(seconds=self.latencias["token"])
+            self.contadores["logins"] += 1
+
+    def token_atual(self):
+        """
+        Retorna (token, data_token) se o token já "chegou", ou (None, None)
+        """
+        with self.lock:
+            if not self.token or datetime.now(timezone.utc) < self.data_token:
+                return None, None
+            return self.token, self.data_token
+
+    def filtrar_negocios(self, status=None, desde=None):
+        """
+        Aplica os filtros de status e data (criação, ganho ou perda) da tela de pipeline
+        """
+        def _data(valor):
+            try:
+                return datetime.strptime(valor[:10], "%d/%m/%Y").date().isoformat()
+            except ValueError:
+                return ""
+
+        negocios = self.negocios
+        if status:
+            negocios = [n for n in negocios if n["status"] in status]
+        if desde:
+            negocios = [n for n in negocios if max(
+                _data(n["created_at"]), _data(n["won_at"]), _data(n["lost_at"])) >= desde]
+        return negocios
+
+    def gerar_arquivo(self, negocios):
+        """
+        Gera o CSV exportado e retorna a chave para download
+        """
+        saida = io.StringIO()
+        escritor = csv.DictWriter(saida, fieldnames=self.colunas)
+        escritor.writeheader()
+        escritor.writerows(negocios)
+
+        chave = secrets.token_hex(8)
+        with self.lock:
+            self.arquivos[chave] = saida.getvalue().encode('utf-8')
+            self.contadores["exportacoes"] += 1
+        return chave
+
+
+class ManipuladorSimulador(BaseHTTPRequestHandler):
+    """
+    Rotas do simulador, com os mesmos caminhos e seletores usados pelo RPA na Clint
+    """
+
+    @property
+    def estado(self):
+        return self.server.estado
+
+    def _responder(self, codigo, corpo, tipo="text/html; charset=utf-8", cabecalhos=None):
+        if isinstance(corpo, str):
+            corpo = corpo.encode('utf-8')
+        self.send_response(codigo)
+        self.send_header("Content-Type", tipo)
+        self.send_header("Content-Length", str(len(corpo)))
+        for nome, valor in (cabecalhos or {}).items():
+            self.send_header(nome, valor)
+        self.end_headers()
+        self.wfile.write(corpo)
+
+    def _responder_json(self, codigo, dados, cabecalhos=None):
+        self._responder(codigo, json.dumps(dados),
+                        "application/json", cabecalhos)
+
+    def _redirecionar(self, destino):
+        self.send_response(302)
+        self.send_header("Location", destino)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _autenticado(self):
+        cookies = self.headers.get("Cookie", "")
+        valores = dict(item.strip().split("=", 1)
+                       for item in cookies.split(";") if "=" in item)
+        return valores.get(COOKIE_SESSAO) in self.estado.sessoes
+
+    def _ler_json(self):
+        tamanho = int(self.headers.get("Content-Length") or 0)
+        return json.loads(self.rfile.read(tamanho) or b"{}")
+
+    def _tela(self, nome, **substituicoes):
+        with open(os.path.join(PASTA_SIMULADOR, nome), 'r', encoding='utf-8') as f:
+            html = f.read()
+        for chave, valor in substituicoes.items():
+            html = html.replace("{{" + chave + "}}", valor)
+        return html
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        partes = [p for p in url.path.split("/") if p]
+
+        if url.path == "/":
+            self._redirecionar("/inicio" if self._autenticado() else "/login")
+
+        elif url.path == "/login":
+            self.estado.aguardar("pagina")
+            self._responder(200, self._tela("login.html"))
+
+        elif url.path == "/inicio":
+            if not self._autenticado():
+                self._redirecionar("/login")
+                return
+            self.estado.aguardar("pagina")
+            self._responder(
+                200, "<html><head><title>Clint - Início (simulador)</title></head>"
+                     "<body><h1>Início</h1></body></html>")
+
+        elif len(partes) == 2 and partes[0] == "origin":
+            if not self._autenticado():
+                self._redirecionar("/login")
+                return
+            self.estado.aguardar("pagina")
+            self._responder(200, self._tela(
+                "pipeline.html", ID_ORIGEM=partes[1]))
+
+        elif len(partes) == 4 and partes[:2] == ["api", "origin"] and partes[3] == "deals":
+            if not self._autenticado():
+                self._responder_json(401, {"erro": "não autenticado"})
+                return
+            parametros = parse_qs(url.query)
+            status = (parametros.get("status", [""])[0]).split(",")
+            desde = parametros.get("desde", [None])[0]
+            self.estado.aguardar("negocios")
+            self._responder_json(
+                200, self.estado.filtrar_negocios([s for s in status if s], desde))
+
+        elif len(partes) == 2 and partes[0] == "arquivos":
+            if not self._autenticado():
+                self._responder_json(401, {"erro": "não autenticado"})
+                return
+            conteudo = self.estado.arquivos.get(partes[1].removesuffix(".csv"))
+            if conteudo is None:
+                self._responder_json(404, {"erro": "arquivo não encontrado"})
+                return
+            with self.estado.lock:
+                self.estado.contadores["downloads"] += 1
+            self._responder(200, conteudo, "text/csv; charset=utf-8", {
+                "Content-Disposition": 'attachment; filename="negocios-exportados.csv"'})
+
+        elif url.path == "/_simulador/token":
+            token, data_token = self.estado.token_atual()
+            self._responder_json(200, {
+                "token": token,
+                "data_token": data_token.isoformat() if data_token else None,
+            })
+
+        elif url.path == "/_simulador/status":
+            self._responder_json(200, {
+                "latencias": self.estado.latencias,
+                "contadores": self.estado.contadores,
+                "negocios": len(self.estado.negocios),
+            })
+
+        else:
+            self._responder_json(404, {"erro": "rota não encontrada"})
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        partes = [p for p in url.path.split("/") if p]
+        dados = self._ler_json()
+
+        if url.path == "/api/login":
+            self.estado.aguardar("login")
+            if dados.get("email") != USUARIO_SIMULADO or dados.get("senha") != SENHA_SIMULADA:
+                self._responder_json(401, {"erro": "credenciais inválidas"})
+                return
+            self.estado.gerar_token()
+            self._responder_json(200, {
+                "atraso_campos_ms": int(self.estado.latencias["campos_codigo"] * 1000)})
+
+        elif url.path == "/api/verificar":
+            token, _ = self.estado.token_atual()
+            if not token or dados.get("codigo") != token:
+                self._responder_json(401, {"erro": "código inválido"})
+                return
+            sessao = secrets.token_hex(16)
+            with self.estado.lock:
+                self.estado.sessoes.add(sessao)
+                self.estado.contadores["verificacoes"] += 1
+            self._responder_json(200, {"ok": True}, {
+                "Set-Cookie": f"{COOKIE_SESSAO}={sessao}; Path=/"})
+
+        elif len(partes) == 4 and partes[:2] == ["api", "origin"] and partes[3] == "export":
+            if not self._autenticado():
+                self._responder_json(401, {"erro": "não autenticado"})
+                return
+            self.estado.aguardar("exportacao")
+            negocios = self.estado.filtrar_negocios(
+                dados.get("status"), dados.get("desde"))
+            chave = self.estado.gerar_arquivo(negocios)
+            host = self.headers.get("Host")
+            self._responder_json(
+                200, {"url": f"http://{host}/arquivos/{chave}.csv"})
+
+        else:
+            self._responder_json(404, {"erro": "rota não encontrada"})
+
+    def log_message(self, formato, *args):
+        # Requisições do navegador não poluem a saída do benchmark
+        pass
+
+
+class ProvedorTokenSimulado(ProvedorTokenAcesso):
+    """
+    Provedor de token 2FA que lê o código gerado pelo simulador em vez do BigQuery
+
+    Injetado no RPA pelo parâmetro `provedor`/`provedor_token`.
+    """
+
+    def __init__(self, url_base):
+        super().__init__()
+        self.url_base = url_base.rstrip("/")
+
+    def token_mais_recente(self):
+        import urllib.request
+
+        with urllib.request.urlopen(f"{self.url_base}/_simulador/token", timeout=5) as resposta:
+            dados = json.loads(resposta.read().decode('utf-8'))
+        if not dados.get("token"):
+            return None, None
+        return dados["token"], datetime.fromisoformat(dados["data_token"])
+
+    def aguardar_token_novo(self, desde, timeout=60, intervalo_inicial=0.2,
+                            intervalo_maximo=1, fator=1.5, cancelado=None):
+        # Mesma lógica do provedor do BigQuery, com polling mais curto (servidor local)
+        return super().aguardar_token_novo(desde, timeout, intervalo_inicial,
+                                           intervalo_maximo, fator, cancelado)
+
+
+def iniciar_simulador(porta=0, latencias=None, escala=1.0, arquivo_csv=ARQUIVO_CSV_EXEMPLO):
+    """
+    Inicia o simulador em segundo plano
+
+    Args:
+        porta (int): Porta local (0 escolhe uma porta livre)
+        latencias (dict): Latências em segundos que substituem LATENCIAS_PADRAO
+        escala (float): Multiplicador aplicado a todas as latências
+        arquivo_csv (str): CSV servido pelo pipeline e pela exportação
+
+    Returns:
+        ThreadingHTTPServer: Servidor em execução (atributos `url_base` e `estado`)
+    """
+    servidor = ThreadingHTTPServer(("127.0.0.1", porta), ManipuladorSimulador)
+    servidor.daemon_threads = True
+    servidor.estado = EstadoSimulador(latencias, escala, arquivo_csv)
+    servidor.url_base = f"http://127.0.0.1:{servidor.server_address[1]}"
+
+    threading.Thread(target=servidor.serve_forever,
+                     name="simulador-clint", daemon=True).start()
+    print(f"🧪 Simulador da Clint em {servidor.url_base} "
+          f"({len(servidor.estado.negocios)} negócios de exemplo)")
+    return servidor
+
+
+def encerrar_simulador(servidor):
+    """
+    Encerra o simulador iniciado por iniciar_simulador
+    """
+    servidor.shutdown()
+    servidor.server_close()
+
+
+if __name__ == "__main__":
+    porta_simulador = int(sys.argv[1]) if len(sys.argv) > 1 else 8780
+    escala_latencia = float(sys.argv[2]) if len(sys.argv) > 2 else 1.0
+    simulador = iniciar_simulador(porta_simulador, escala=escala_latencia)
+    print(f"🔗 Origem simulada: {simulador.url_base}/origin/{ID_ORIGEM_SIMULADA}")
+    print(f"👤 Usuário: {USUARIO_SIMULADO} | Senha: {SENHA_SIMULADA}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        encerrar_simulador(simulador)
@@ -3,10 +3,14 @@ Módulo de Verificação de Token para Plataforma Clint
 Responsável por: Capturar token do BigQuery e preencher código de verificação
 """
 
-from funcoes import capturar_codigo_acesso_client
+from funcoes import capturar_codigo_acesso_client, obter_provedor_token
+from rastreamento import iniciar_span, span_atual
+from clint_waits import (aguardar, pagina_carregada, campos_codigo_visiveis,
+                         redirecionamento_fora_login)
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+import threading
 import time
 import os
 import sys
@@ -33,17 +37,13 @@ def aguardar_campos_codigo(driver, timeout=90):
     try:
         print("🔍 Aguardando campos de código de verificação...")
 
-        wait = WebDriverWait(driver, timeout)
+        code_inputs = aguardar(driver, campos_codigo_visiveis(),
+                               "campos de código visíveis", timeout=timeout,
+                               obrigatoria=False)
 
-        for _ in range(timeout):
-            code_inputs = driver.find_elements(
-                By.CSS_SELECTOR, "input[type='tel']")
-
-            if len(code_inputs) == 6:
-                print("✅ Campos de código encontrados!")
-                return code_inputs
-
-            time.sleep(1)
+        if code_inputs:
+            print("✅ Campos de código encontrados!")
+            return code_inputs
 
         print("❌ Campos de código de verificação não encontrados.")
         return None
@@ -79,7 +79,6 @@ def preencher_codigo_verificacao(driver, code_inputs, token_value):
         for i, input_elem in enumerate(code_inputs):
             input_elem.clear()
             input_elem.send_keys(code_digits[i])
-            time.sleep(0.5)
 
         print("✅ Código de verificação preenchido nos campos.")
         return True
@@ -111,7 +110,8 @@ def clicar_botao_continuar(driver):
 
         # Aguardar redirecionamento e verificar se a sessão foi mantida
         print("⏳ Aguardando redirecionamento após verificação...")
-        time.sleep(10)  # Aumentar tempo de espera para processo de verificação
+        aguardar(driver, redirecionamento_fora_login(),
+                 "redirecionamento fora do /login", timeout=10, obrigatoria=False)
 
         # Verificar se ainda estamos na página de login (erro) ou se fomos redirecionados
         current_url = driver.current_url
@@ -127,7 +127,9 @@ def clicar_botao_continuar(driver):
                     (By.CSS_SELECTOR, "button.btn.btn-success.btn-block")))
                 continuar_btn.click()
                 print("✅ Botão 'Continuar' clicado novamente!")
-                time.sleep(15)  # Aguardar mais tempo
+                aguardar(driver, redirecionamento_fora_login(),
+                         "redirecionamento fora do /login (2ª tentativa)",
+                         timeout=15, obrigatoria=False)
 
                 current_url = driver.current_url
                 print(f"📍 URL atual após segunda tentativa: {current_url}")
@@ -141,8 +143,7 @@ def clicar_botao_continuar(driver):
 
         # Aguardar página carregar completamente
         print("⏳ Aguardando página carregar após verificação...")
-        wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
-        time.sleep(5)
+        aguardar(driver, pagina_carregada(), "página pós-verificação carregada")
 
         print("✅ Redirecionamento concluído e sessão mantida!")
         return True
@@ -152,32 +153,84 @@ def clicar_botao_continuar(driver):
         return False
 
 
-def verificar_token_completo(driver):
+def iniciar_busca_token(desde=None, provedor=None):
+    """
+    Inicia a busca do token do BigQuery em segundo plano
+
+    Args:
+        desde (datetime): Momento do login; se informado, aguarda um token gerado depois dele
+        provedor: Provedor de token (padrão: provedor compartilhado do BigQuery)
+
+    Returns:
+        tuple: (resultado, concluido, cancelado) - dicionário com o token, evento de
+        conclusão e evento para cancelar a busca
+    """
+    resultado = {"token": None, "momento": None}
+    concluido = threading.Event()
+    cancelado = threading.Event()
+    span_pai = span_atual()
+
+    def _buscar():
+        rastro = iniciar_span("bronze.token.busca", pai=span_pai)
+        try:
+            if desde:
+                token_provedor = provedor or obter_provedor_token()
+                resultado["token"] = token_provedor.aguardar_token_novo(
+                    desde, cancelado=cancelado)
+            else:
+                resultado["token"] = capturar_codigo_acesso_client()
+        except Exception as e:
+            print(f"❌ Erro na busca do token: {e}")
+        finally:
+            resultado["momento"] = time.monotonic()
+            rastro.encerrar(encontrado=bool(resultado["token"]))
+            concluido.set()
+
+    # Thread daemon para não segurar o encerramento do processo se o RPA falhar antes
+    threading.Thread(target=_buscar, name="busca-token-2fa", daemon=True).start()
+    return resultado, concluido, cancelado
+
+
+def verificar_token_completo(driver, desde=None, provedor=None):
     """
     Executa o processo completo de verificação de token
 
+    A busca do token no BigQuery e a espera pelos campos de código rodam em
+    paralelo; o código é preenchido assim que os dois estiverem prontos.
+
     Args:
         driver: Driver do Selenium logado
+        desde (datetime): Momento do login; se informado, aguarda um token gerado depois dele
+        provedor: Provedor de token (padrão: provedor compartilhado do BigQuery)
 
     Returns:
         bool: True se verificação bem-sucedida, False caso contrário
     """
     try:
         print("🚀 Iniciando verificação de token...")
+        inicio = time.monotonic()
 
-        # Capturar token do BigQuery
-        token_value = capturar_codigo_acesso_client()
+        # Capturar token do BigQuery em segundo plano
+        resultado_token, token_concluido, cancelar_token = iniciar_busca_token(
+            desde, provedor)
+
+        # Aguardar campos de código enquanto o token é buscado
+        code_inputs = aguardar_campos_codigo(driver)
+        momento_campos = time.monotonic()
+        if not code_inputs:
+            cancelar_token.set()
+            return False
+
+        token_concluido.wait()
+        token_value = resultado_token["token"]
 
         if not token_value:
             print("❌ Falha ao capturar token do BigQuery")
             return False
 
         print(f"✅ Token capturado: {token_value[:10]}...")
-
-        # Aguardar campos de código
-        code_inputs = aguardar_campos_codigo(driver)
-        if not code_inputs:
-            return False
+        print(f"⏱️ Campos prontos em {momento_campos - inicio:.1f}s, "
+              f"token em {resultado_token['momento'] - inicio:.1f}s")
 
         # Preencher código de verificação
         if not preencher_codigo_verificacao(driver, code_inputs, token_value):
@@ -195,18 +248,20 @@ def verificar_token_completo(driver):
         return False
 
 
-def executar_verificacao_token(driver):
+def executar_verificacao_token(driver, desde=None, provedor=None):
     """
     Função principal para executar verificação de token
 
     Args:
         driver: Driver do Selenium logado
+        desde (datetime): Momento do login, para descartar tokens antigos
+        provedor: Provedor de token (padrão: provedor compartilhado do BigQuery)
 
     Returns:
         driver: Driver com verificação concluída, ou None se falhar
     """
     try:
-        if not verificar_token_completo(driver):
+        if not verificar_token_completo(driver, desde, provedor):
             print("❌ Falha na verificação de token")
             return None
 
@@ -0,0 +1,208 @@
+"""
+Módulo de Esperas por Condição para Plataforma Clint
+Responsável por: Condições de prontidão nomeadas, polling com timeout e registro da duração de cada espera
+"""
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from rastreamento import iniciar_span
+import time
+
+# Valores padrão de polling e timeout (em segundos)
+INTERVALO_PADRAO = 0.25
+TIMEOUT_PADRAO = 30
+
+# Seletores usados pelas condições da página de pipeline
+SELETOR_FILTRO_STATUS = '[data-cy="tbl-status-deal-filter"]'
+SELETOR_BOTAO_EXPORTAR = '[data-cy="bt-export-deals-via-pipe"]'
+# Os controles da barra de filtros também têm "deal" no data-cy (tbl-status-deal-filter,
+# tbl-date-deal-filter, bt-export-deals-via-pipe); só os cards/linhas de negócios contam
+SELETOR_LINHAS_NEGOCIOS = "[data-cy*='deal']:not([data-cy^='bt-']):not([data-cy^='tbl-'])"
+SELETOR_CAMPOS_CODIGO = "input[type='tel']"
+
+# Conta os elementos do seletor que não são controles de formulário
+SCRIPT_CONTAR_LINHAS = """
+return Array.from(document.querySelectorAll(arguments[0]))
+    .filter(el => !["BUTTON", "INPUT", "SELECT"].includes(el.tagName)).length;
+"""
+
+# Registro de todas as esperas executadas no processo
+registro_esperas = []
+
+
+def aguardar(driver, condicao, nome, timeout=TIMEOUT_PADRAO,
+             intervalo=INTERVALO_PADRAO, obrigatoria=True):
+    """
+    Aguarda uma condição ser satisfeita e registra quanto tempo a espera levou
+
+    Args:
+        driver: Driver do Selenium
+        condicao: Função que recebe o driver e retorna um valor verdadeiro quando pronta
+        nome (str): Nome da condição usado no registro de esperas
+        timeout (float): Tempo máximo de espera em segundos
+        intervalo (float): Intervalo entre verificações em segundos
+        obrigatoria (bool): Se True, propaga TimeoutException ao esgotar o tempo
+
+    Returns:
+        Valor retornado pela condição, ou None se o tempo esgotar e a espera não for obrigatória
+    """
+    inicio = time.monotonic()
+    sucesso = False
+    rastro = iniciar_span("espera", condicao=nome, timeout=timeout)
+
+    try:
+        resultado = WebDriverWait(
+            driver, timeout, poll_frequency=intervalo,
+            ignored_exceptions=(WebDriverException,)).until(condicao)
+        sucesso = True
+        return resultado
+
+    except TimeoutException:
+        if obrigatoria:
+            raise
+        print(f"⚠️ Tempo esgotado ({timeout}s) aguardando: {nome}")
+        return None
+
+    finally:
+        duracao = time.monotonic() - inicio
+        registro_esperas.append({
+            "condicao": nome,
+            "duracao": duracao,
+            "timeout": timeout,
+            "sucesso": sucesso,
+        })
+        rastro.encerrar(sucesso=sucesso)
+        print(f"⏱️ Espera '{nome}': {duracao:.2f}s")
+
+
+def pagina_carregada():
+    """
+    Condição: documento da página atual completamente carregado
+    """
+    def _condicao(driver):
+        return driver.execute_script("return document.readyState") == "complete"
+    return _condicao
+
+
+def elemento_clicavel(by, seletor):
+    """
+    Condição: elemento visível e habilitado para clique
+    """
+    return EC.element_to_be_clickable((by, seletor))
+
+
+def menu_filtro_status_aberto():
+    """
+    Condição: menu do filtro de status aberto, com as opções de status renderizadas
+    """
+    def _condicao(driver):
+        opcoes = driver.find_elements(
+            By.XPATH, "//input[@type='checkbox' and following-sibling::*[contains(text(), 'Ganho') or contains(text(), 'Perdido')]]")
+        return opcoes if opcoes else False
+    return _condicao
+
+
+def checkbox_status_marcado(status):
+    """
+    Condição: checkbox do status informado marcado
+    """
+    def _condicao(driver):
+        checkbox = driver.find_element(
+            By.XPATH, f"//input[@type='checkbox' and following-sibling::*[contains(text(), '{status}')]]")
+        return checkbox.is_selected()
+    return _condicao
+
+
+def contagem_linhas_estavel(seletor=SELETOR_LINHAS_NEGOCIOS, estavel_ms=1500, minimo=1):
+    """
+    Condição: quantidade de linhas da tabela de negócios sem variação por `estavel_ms` milissegundos
+
+    A contagem é feita com uma única chamada JavaScript por verificação, ignorando botões e
+    campos (controles que casem com o seletor), para que a página sem negócios renderizados
+    não satisfaça a condição.
+    """
+    estado = {"contagem": None, "desde": None}
+
+    def _condicao(driver):
+        contagem = driver.execute_script(
+            SCRIPT_CONTAR_LINHAS, seletor)
+        agora = time.monotonic()
+
+        if contagem != estado["contagem"]:
+            estado["contagem"] = contagem
+            estado["desde"] = agora
+            return False
+
+        if contagem >= minimo and (agora - estado["desde"]) * 1000 >= estavel_ms:
+            return contagem
+        return False
+    return _condicao
+
+
+def redirecionamento_fora_login():
+    """
+    Condição: navegador redirecionado para fora da página /login
+    """
+    def _condicao(driver):
+        return "login" not in driver.current_url
+    return _condicao
+
+
+def campos_codigo_visiveis(quantidade=6):
+    """
+    Condição: campos do código de verificação (2FA) renderizados
+    """
+    def _condicao(driver):
+        campos = driver.find_elements(By.CSS_SELECTOR, SELETOR_CAMPOS_CODIGO)
+        return campos if len(campos) == quantidade else False
+    return _condicao
+
+
+def login_processado():
+    """
+    Condição: login processado, exibindo os campos de código ou saindo da página de login
+    """
+    campos = campos_codigo_visiveis()
+    fora_login = redirecionamento_fora_login()
+
+    def _condicao(driver):
+        return campos(driver) or fora_login(driver)
+    return _condicao
+
+
+def resumo_esperas():
+    """
+    Exibe o resumo das esperas registradas, agrupadas por condição
+
+    Returns:
+        dict: Totais por condição (quantidade, tempo total, maior espera, falhas)
+    """
+    resumo = {}
+    for espera in registro_esperas:
+        item = resumo.setdefault(espera["condicao"], {
+            "quantidade": 0, "total": 0.0, "maior": 0.0, "falhas": 0})
+        item["quantidade"] += 1
+        item["total"] += espera["duracao"]
+        item["maior"] = max(item["maior"], espera["duracao"])
+        if not espera["sucesso"]:
+            item["falhas"] += 1
+
+    if resumo:
+        print("\n⏱️ RESUMO DAS ESPERAS")
+        print("-" * 60)
+        for nome, item in sorted(resumo.items(), key=lambda x: x[1]["total"], reverse=True):
+            print(f"{nome:<35} {item['quantidade']:>3}x  total {item['total']:7.2f}s  "
+                  f"maior {item['maior']:6.2f}s  falhas {item['falhas']}")
+        print(
+            f"{'TOTAL':<35}       total {sum(i['total'] for i in resumo.values()):7.2f}s")
+
+    return resumo
+
+
+def limpar_registro_esperas():
+    """
+    Limpa o registro de esperas (útil entre execuções no mesmo processo)
+    """
+    registro_esperas.clear()
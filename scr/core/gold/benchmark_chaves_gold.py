@@ -0,0 +1,130 @@
+"""
+Benchmark das Chaves Estrangeiras da Gold
+Responsável por: Comparar os quatro merges sequenciais do fato com a resolução por fatoração
+(resolver_fk) e com as chaves por hash (chave_hash), em tempo e pico de memória
+
+Uso:
+    python benchmark_chaves_gold.py [linhas ...]   # padrão: 100000 1000000
+"""
+
+import tracemalloc
+import time
+import sys
+
+import numpy as np
+import pandas as pd
+
+from chaves_gold import chave_hash, resolver_fk
+
+# Colunas do fato que não participam das chaves (largura parecida com a exportação real)
+COLUNAS_EXTRAS = 30
+
+# (PK, colunas no fato, colunas na dimensão, quantidade de chaves distintas)
+RELACIONAMENTOS = [
+    ('pk_cliente', ['nome', 'email'], ['nome', 'email'], None),
+    ('pk_vendedor', ['usuario_email', 'usuario_nome'], ['vendedor_email', 'vendedor_nome'], 25),
+    ('pk_pipeline', ['de_origem'], ['de_pipeline'], 6),
+    ('pk_estagio', ['estagio'], ['de_estagio'], 12),
+]
+
+
+def gerar_dados(linhas, semente=42):
+    """
+    Gera um fato sintético com as chaves naturais já padronizadas e as quatro dimensões
+    """
+    gerador = np.random.default_rng(semente)
+    fato = {f'extra_{i}': np.array([f'VALOR {i}-{j}' for j in range(50)], dtype=object)[
+        gerador.integers(0, 50, linhas)] for i in range(COLUNAS_EXTRAS)}
+    dims = {}
+    for coluna_pk, colunas_fato, colunas_dim, distintos in RELACIONAMENTOS:
+        distintos = distintos or linhas // 2
+        codigos = gerador.integers(0, distintos, linhas)
+        dim = pd.DataFrame({coluna_pk: range(1, distintos + 1)})
+        for coluna_fato, coluna_dim in zip(colunas_fato, colunas_dim):
+            valores = np.array([f'{coluna_fato.upper()} {i}' for i in range(distintos)], dtype=object)
+            fato[coluna_fato] = valores[codigos]
+            dim[coluna_dim] = valores
+        dims[coluna_pk] = dim
+    return pd.DataFrame(fato), dims
+
+
+def fks_por_merge(fato, dims):
+    """
+    Abordagem anterior: colunas auxiliares _padronizado e um merge por dimensão
+    """
+    fato = fato.copy()
+    auxiliares = []
+    for _, colunas_fato, _, _ in RELACIONAMENTOS:
+        for col in colunas_fato:
+            fato[f'{col}_padronizado'] = fato[col]
+            auxiliares.append(f'{col}_padronizado')
+    for coluna_pk, colunas_fato, colunas_dim, _ in RELACIONAMENTOS:
+        fato = pd.merge(fato, dims[coluna_pk], how='left',
+                        left_on=[f'{col}_padronizado' for col in colunas_fato], right_on=colunas_dim,
+                        suffixes=('', '_dim'))
+        fato = fato.drop(columns=[c for c in colunas_dim if c not in colunas_fato]
+                         + [f'{c}_dim' for c in colunas_dim if c in colunas_fato])
+    return fato.drop(columns=auxiliares)
+
+
+def fks_por_fatoracao(fato, dims):
+    """
+    resolver_fk: fatoração das chaves e indexação das posições na dimensão
+    """
+    return {coluna_pk: resolver_fk([fato[col] for col in colunas_fato], dims[coluna_pk],
+                                   coluna_pk, colunas_dim)
+            for coluna_pk, colunas_fato, colunas_dim, _ in RELACIONAMENTOS}
+
+
+def fks_por_hash(fato, dims):
+    """
+    chave_hash: FKs calculadas das colunas do fato, sem consultar as dimensões
+    """
+    return {coluna_pk: chave_hash(fato, colunas_fato)
+            for coluna_pk, colunas_fato, _, _ in RELACIONAMENTOS}
+
+
+def medir(funcao, *args):
+    """
+    Executa a função uma vez para o tempo e outra com tracemalloc para o pico de memória
+    """
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    duracao = time.perf_counter() - inicio
+
+    tracemalloc.start()
+    funcao(*args)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return resultado, duracao, pico
+
+
+def executar_benchmark(tamanhos=(100_000, 1_000_000)):
+    """
+    Mede as três abordagens para cada tamanho de fato e confere se as FKs coincidem
+    """
+    print("=" * 64)
+    print(f"{'linhas':>10} {'abordagem':<12} {'tempo (s)':>10} {'pico (MB)':>10} {'fato (MB)':>10}")
+    print("-" * 64)
+    for linhas in tamanhos:
+        fato, dims = gerar_dados(linhas)
+        tamanho_fato = fato.memory_usage(index=False).sum() / 1e6
+
+        por_merge, tempo_merge, pico_merge = medir(fks_por_merge, fato, dims)
+        por_fatoracao, tempo_fatoracao, pico_fatoracao = medir(fks_por_fatoracao, fato, dims)
+        _, tempo_hash, pico_hash = medir(fks_por_hash, fato, dims)
+
+        divergentes = sum(int((por_merge[pk].to_numpy() != np.asarray(fks)).sum())
+                          for pk, fks in por_fatoracao.items())
+
+        for abordagem, tempo, pico in [('merge', tempo_merge, pico_merge),
+                                       ('fatoracao', tempo_fatoracao, pico_fatoracao),
+                                       ('hash', tempo_hash, pico_hash)]:
+            print(f"{linhas:>10} {abordagem:<12} {tempo:>10.3f} {pico / 1e6:>10.1f} {tamanho_fato:>10.1f}")
+        print(f"{'':>10} FKs divergentes (merge x fatoração): {divergentes}")
+        print("-" * 64)
+
+
+if __name__ == "__main__":
+    tamanhos_benchmark = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    executar_benchmark(tamanhos_benchmark)
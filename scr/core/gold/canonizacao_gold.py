@@ -0,0 +1,86 @@
+"""
+Canonização de Texto da Camada Gold
+Responsável por: Padronizar as colunas de texto (sem espaços nas pontas, maiúsculas e
+marcadores de nulo como None) com o mesmo resultado nas dimensões e no fato
+
+Cada coluna é fatorada e só os valores distintos ainda não vistos passam pelas operações de
+texto; o resultado volta para as linhas pelos códigos. O valor canonizado fica em cache por
+coluna durante a execução, então o fato reaproveita o que foi feito nas dimensões.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# Textos tratados como nulo depois de padronizados ('nan', 'None ', 'null'...)
+MARCADORES_NULO = ['NAN', 'NONE', 'NULL']
+
+# Valor canonizado por coluna (nome na silver) e valor original, válido durante a execução
+_canonicos = {}
+
+
+def _canonizar_valores(valores):
+    """
+    Canoniza valores distintos não nulos de uma vez (operações de texto vetorizadas)
+    """
+    canonicos = pd.Series(valores, dtype=object).astype(str).str.strip().str.upper()
+    canonicos = canonicos.to_numpy(dtype=object)
+    canonicos[np.isin(canonicos, MARCADORES_NULO)] = None
+    return canonicos
+
+
+def canonizar_serie(serie, coluna=None, padrao=None):
+    """
+    Canoniza uma coluna de texto processando cada valor distinto uma única vez
+
+    Args:
+        serie: Series de texto
+        coluna (str): Chave do cache (nome da coluna na silver); None não usa o cache
+        padrao: Valor usado no lugar de nulos, inclusive os marcadores como 'nan'
+
+    Returns:
+        Series (object) com os valores canonizados, no mesmo índice
+    """
+    codigos, unicos = pd.factorize(serie)
+    unicos = np.asarray(unicos, dtype=object)
+
+    cache = _canonicos.setdefault(coluna, {}) if coluna is not None else {}
+    novos = [valor for valor in unicos if valor not in cache]
+    if novos:
+        cache.update(zip(novos, _canonizar_valores(novos)))
+
+    # Última posição para o código -1 do factorize (nulos)
+    canonicos = np.empty(len(unicos) + 1, dtype=object)
+    canonicos[:-1] = [cache[valor] for valor in unicos]
+    canonicos[-1] = None
+    if padrao is not None:
+        canonicos[pd.isna(canonicos)] = padrao
+
+    return pd.Series(canonicos[codigos], index=serie.index, name=serie.name)
+
+
+def canonizar_colunas(df, nome_dataframe=""):
+    """
+    Canoniza todas as colunas de texto de um DataFrame
+
+    Args:
+        df: DataFrame a padronizar
+        nome_dataframe (str): Nome usado no log (as colunas têm os nomes da silver)
+
+    Returns:
+        DataFrame com as colunas de texto canonizadas
+    """
+    logger.info(f"Padronizando dados em {nome_dataframe}...")
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        df[col] = canonizar_serie(df[col], col)
+    return df
+
+
+def limpar_cache_canonizacao():
+    """
+    Esquece os valores canonizados (chamado no início de cada execução da gold)
+    """
+    _canonicos.clear()
@@ -0,0 +1,184 @@
+"""
+Chaves Substitutas da Camada Gold
+Responsável por: Gerar as PKs das dimensões, sequenciais (padrão) ou por hash determinístico
+de 64 bits da chave natural padronizada, e resolver as FKs do fato sem merge
+
+No modo hash a mesma chave natural gera sempre a mesma PK, entre execuções e entre dimensão
+e fato: as FKs do fato saem das próprias colunas padronizadas, sem join com as dimensões, e
+os relacionamentos do Power BI não mudam a cada atualização.
+"""
+
+import logging
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+TIPO_CHAVE_SEQUENCIAL = 'sequencial'
+TIPO_CHAVE_HASH = 'hash'
+TIPOS_CHAVE = (TIPO_CHAVE_SEQUENCIAL, TIPO_CHAVE_HASH)
+
+
+def chave_hash(df, colunas, padroes=None):
+    """
+    Calcula o hash de 64 bits da chave natural de cada linha
+
+    O hash considera apenas os valores, na ordem das colunas (não os nomes), então a
+    dimensão e o fato podem usar colunas com nomes diferentes para a mesma chave.
+
+    Args:
+        df: DataFrame com as colunas da chave natural já padronizadas
+        colunas (list): Colunas da chave natural, na ordem
+        padroes (dict): Valor usado no lugar de nulos por coluna (os mesmos do fato)
+
+    Returns:
+        numpy.ndarray: Chaves int64 (mesmo tamanho e ordem do DataFrame)
+    """
+    chave = pd.DataFrame({i: df[col].astype(object).to_numpy()
+                          for i, col in enumerate(colunas)})
+    if padroes:
+        chave = chave.fillna({i: padroes[col] for i, col in enumerate(colunas) if col in padroes})
+    hashes = pd.util.hash_pandas_object(chave, index=False).to_numpy()
+    # int64 com sinal: o Parquet e o Power BI não têm inteiro de 64 bits sem sinal
+    return hashes.view('int64')
+
+
+def atribuir_pk(dim, coluna_pk, chave_natural, tipo_chave=TIPO_CHAVE_SEQUENCIAL, padroes=None):
+    """
+    Adiciona a PK como primeira coluna da dimensão
+
+    Args:
+        dim: DataFrame da dimensão, já padronizado
+        coluna_pk (str): Nome da coluna da PK
+        chave_natural (list): Colunas que identificam a linha (usadas no modo hash)
+        tipo_chave (str): "sequencial" (1..n a cada execução) ou "hash"
+        padroes (dict): Valores usados no lugar de nulos na chave natural
+
+    Returns:
+        DataFrame da dimensão com a PK
+    """
+    if tipo_chave not in TIPOS_CHAVE:
+        raise ValueError(f"Tipo de chave inválido: {tipo_chave} (use {', '.join(TIPOS_CHAVE)})")
+
+    if tipo_chave == TIPO_CHAVE_HASH:
+        pk = pd.Series(chave_hash(dim, chave_natural, padroes), index=dim.index)
+        repetidas = pk.duplicated()
+        if repetidas.any():
+            # A PK identifica a chave natural: fica a primeira linha de cada chave
+            logger.warning(
+                f"{repetidas.sum()} linhas com chave natural repetida descartadas "
+                f"({coluna_pk}: {', '.join(chave_natural)})")
+            dim = dim[~repetidas.to_numpy()]
+            pk = pk[~repetidas]
+        pk = pk.to_numpy()
+    else:
+        pk = range(1, len(dim) + 1)
+
+    dim = dim.reset_index(drop=True)
+    dim.insert(0, coluna_pk, pk)
+    return dim
+
+
+def deduplicar_por_chave(dim, chave_natural, nome_dimensao=""):
+    """
+    Mantém uma linha por chave natural (já canonizada), na ordem em que aparece
+
+    Args:
+        dim: DataFrame da dimensão, já padronizado
+        chave_natural (list): Colunas que identificam a linha
+        nome_dimensao (str): Nome usado no log
+
+    Returns:
+        DataFrame da dimensão com a chave natural única
+    """
+    total = len(dim)
+    dim = dim.drop_duplicates(subset=chave_natural).reset_index(drop=True)
+    if len(dim) < total:
+        logger.info(
+            f"{total - len(dim)} linhas de {nome_dimensao} com a mesma chave natural "
+            f"({', '.join(chave_natural)}) removidas")
+    return dim
+
+
+def garantir_chave_unica(dim, chave_natural, nome_dimensao=""):
+    """
+    Interrompe o processamento se a chave natural da dimensão se repetir
+
+    Uma chave repetida multiplicaria as linhas do fato no join (ou deixaria a FK ambígua).
+
+    Raises:
+        ValueError: Se alguma chave natural aparecer em mais de uma linha
+    """
+    repetidas = dim.duplicated(subset=chave_natural)
+    if repetidas.any():
+        raise ValueError(
+            f"Chave natural repetida em {nome_dimensao} ({', '.join(chave_natural)}): "
+            f"{repetidas.sum()} linhas")
+
+
+def _codificar_chave(colunas_fato, colunas_dim):
+    """
+    Fatora cada coluna da chave do fato uma única vez e traduz a dimensão para os mesmos códigos
+
+    Returns:
+        tuple: (código combinado de cada linha do fato, código combinado de cada linha da
+        dimensão, máscara das linhas da dimensão cuja chave aparece no fato)
+    """
+    codigos_fato = np.zeros(len(colunas_fato[0]), dtype=np.int64)
+    codigos_dim = np.zeros(len(colunas_dim[0]), dtype=np.int64)
+    presentes = np.ones(len(colunas_dim[0]), dtype=bool)
+    for coluna_fato, coluna_dim in zip(colunas_fato, colunas_dim):
+        codigos, unicos = pd.factorize(coluna_fato)
+        # Só os valores distintos são comparados como texto; o resto é aritmética de códigos
+        codigos_coluna_dim = pd.Index(unicos).get_indexer(coluna_dim)
+
+        # Nulo recebe um código próprio nos dois lados, como no merge (nulo casa com nulo)
+        codigo_nulo = len(unicos)
+        codigos[codigos < 0] = codigo_nulo
+        codigos_coluna_dim[pd.isna(coluna_dim).to_numpy()] = codigo_nulo
+
+        presentes &= codigos_coluna_dim >= 0
+        codigos_fato = codigos_fato * (codigo_nulo + 1) + codigos
+        codigos_dim = codigos_dim * (codigo_nulo + 1) + codigos_coluna_dim
+    return codigos_fato, codigos_dim, presentes
+
+
+def resolver_fk(colunas_fato, dim, coluna_pk, colunas_dim):
+    """
+    Resolve a FK do fato pela posição da chave natural na dimensão, sem merge
+
+    As colunas de texto são fatoradas uma vez; a busca na dimensão é feita sobre códigos
+    inteiros e o resultado volta por indexação, sem copiar o fato nem criar colunas auxiliares.
+
+    Args:
+        colunas_fato (list): Series padronizadas do fato com a chave natural
+        dim: DataFrame da dimensão com a PK e as colunas da chave natural
+        coluna_pk (str): Coluna da PK na dimensão
+        colunas_dim (list): Colunas da chave natural na dimensão (mesma ordem de colunas_fato)
+
+    Returns:
+        Array de FKs (int64, ou Int64 com nulos para chaves sem correspondência)
+    """
+    codigos_fato, codigos_dim, presentes = _codificar_chave(
+        colunas_fato, [dim[col] for col in colunas_dim])
+
+    # Linhas da dimensão com chave ausente do fato nunca seriam encontradas
+    indice_dim = pd.Index(codigos_dim[presentes])
+    pks = dim[coluna_pk].to_numpy()[presentes]
+    if not indice_dim.is_unique:
+        # O merge multiplicaria as linhas do fato; aqui fica a primeira PK de cada chave
+        repetidas = indice_dim.duplicated()
+        logger.warning(
+            f"{repetidas.sum()} chaves naturais repetidas na dimensão de {coluna_pk}; "
+            "usando a primeira PK de cada chave")
+        indice_dim = indice_dim[~repetidas]
+        pks = pks[~repetidas]
+
+    posicoes = indice_dim.get_indexer(codigos_fato)
+    encontrados = posicoes >= 0
+    if encontrados.all():
+        return pks[posicoes]
+    fks = pd.array(np.where(encontrados, pks[posicoes], 0), dtype='Int64')
+    fks[~encontrados] = pd.NA
+    return fks
@@ -1,10 +1,24 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import time
 from datetime import datetime
 import logging
 import sys
 import os
 
+# Adicionar o diretório utils ao path para importação
+utils_path = os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), '..', '..', 'utils')
+sys.path.append(utils_path)
+
+from rastreamento import span, iniciar_span, tamanho_arquivo, exportar_rastreamento  # noqa: E402
+from chaves_gold import (chave_hash, atribuir_pk, resolver_fk,  # noqa: E402
+                         deduplicar_por_chave, garantir_chave_unica,
+                         TIPO_CHAVE_SEQUENCIAL, TIPO_CHAVE_HASH)
+from canonizacao_gold import canonizar_serie, canonizar_colunas, limpar_cache_canonizacao  # noqa: E402
+from qualidade_gold import coletar_metricas, METRICAS_PADRAO  # noqa: E402
+
 # Configuração do logger
 
 
@@ -34,6 +48,19 @@ logger = setup_logger()
 ARQUIVO_SILVER = 'data/silver/leads-forms-accelera.parquet'
 ARQUIVO_GOLD = 'data/gold/leads-forms-accelera.parquet'
 
+# PKs sequenciais (1..n a cada execução) ou por hash da chave natural ("hash")
+TIPO_CHAVE_PADRAO = TIPO_CHAVE_SEQUENCIAL
+
+# Valores usados no lugar de nulos nas chaves naturais, iguais na dimensão e no fato
+VALORES_DESCONHECIDOS = {
+    'nome': 'DESCONHECIDO_NOME',
+    'email': 'DESCONHECIDO_EMAIL',
+    'usuario_email': 'DESCONHECIDO_USUARIO_EMAIL',
+    'usuario_nome': 'DESCONHECIDO_USUARIO_NOME',
+    'de_origem': 'DESCONHECIDO_DE_ORIGEM',
+    'estagio': 'DESCONHECIDO_ESTAGIO',
+}
+
 
 def criar_diretorios():
     """Cria os diretórios necessários se não existirem"""
@@ -48,85 +75,55 @@ def criar_diretorios():
             logger.info(f"Diretório criado: {diretorio}")
 
 
-def limpar_valores_nulos(df, nome_dataframe=""):
-    """
-    Substitui todos os valores nan/NaN/None por null (None) no DataFrame
-    """
-    logger.info(f"Limpando valores nulos em {nome_dataframe}...")
-
-    # Conta valores nulos antes da limpeza
-    valores_nulos_antes = df.isnull().sum().sum()
-
-    # Conta strings problemáticas antes
-    strings_problematicas_antes = 0
-    colunas_texto = df.select_dtypes(include=['object', 'string']).columns
-
-    for col in colunas_texto:
-        col_str = df[col].astype(str)
-        strings_problematicas_antes += (
-            (col_str == 'None') |
-            (col_str == 'nan') |
-            (col_str == 'NaN') |
-            (col_str == 'null') |
-            (col_str == 'NULL')
-        ).sum()
-
-    # Substitui todos os valores problemáticos por None
-    valores_problematicos = ['None', 'nan', 'NaN', 'null', 'NULL']
-    df = df.replace(valores_problematicos, None)
-
-    # Conta valores nulos depois da limpeza
-    valores_nulos_depois = df.isnull().sum().sum()
-
-    logger.info(f"Valores nulos antes: {valores_nulos_antes}")
-    logger.info(f"Strings problemáticas antes: {strings_problematicas_antes}")
-    logger.info(f"Valores nulos depois: {valores_nulos_depois}")
-
-    return df
+COLUNAS_DATA = ['dt_ganho', 'dt_criacao', 'dt_perda']
+TIPO_DATA = pd.ArrowDtype(pa.date32())
 
 
-def padronizar_dados(df, nome_dataframe=""):
+def ler_parquet_silver(caminho):
     """
-    Padroniza dados das colunas: remove espaços, deixa maiúsculas e trata valores nan
+    Lê o Parquet da silver mantendo as datas como date32 (sem objetos date do Python)
     """
-    logger.info(f"Padronizando dados em {nome_dataframe}...")
+    tabela = pq.read_table(caminho)
+    return tabela.to_pandas(types_mapper={pa.date32(): TIPO_DATA}.get)
 
-    # Conta registros antes da padronização
-    registros_antes = len(df)
 
-    # Identifica colunas de texto
-    colunas_texto = df.select_dtypes(include=['object', 'string']).columns
-
-    logger.info(f"Colunas de texto encontradas: {list(colunas_texto)}")
-
-    # Para cada coluna de texto
-    for col in colunas_texto:
-        # Primeiro, trata valores None/nan antes da conversão para string
-        df[col] = df[col].replace(['nan', 'NaN', 'null', 'NULL'], None)
+def garantir_colunas_data(df):
+    """
+    Garante as colunas de data como date32; arquivos silver antigos trazem texto 'yyyy-mm-dd'
+    """
+    for col in COLUNAS_DATA:
+        if col in df.columns and df[col].dtype != TIPO_DATA:
+            df[col] = pd.to_datetime(
+                df[col], errors='coerce', format='%Y-%m-%d').astype(TIPO_DATA)
+    return df
 
-        # Remove espaços no início e fim, converte para maiúsculas (apenas valores não-nulos)
-        mask_not_null = df[col].notna()
-        if mask_not_null.any():
-            df.loc[mask_not_null, col] = df.loc[mask_not_null,
-                                                col].astype(str).str.strip().str.upper()
 
-        # Substitui valores 'NAN' (string) que podem ter sido criados por None
-        df[col] = df[col].replace(['NAN', 'NONE'], None)
+def limpar_valores_nulos(df, nome_dataframe="", metricas=METRICAS_PADRAO):
+    """
+    Substitui todos os valores nan/NaN/None por null (None) no DataFrame
 
-    # Conta registros depois da padronização
-    registros_depois = len(df)
+    Args:
+        df: DataFrame a limpar
+        nome_dataframe (str): Nome usado no log
+        metricas (bool): Registra as métricas de qualidade antes da limpeza (uma passada por coluna)
+    """
+    logger.info(f"Limpando valores nulos em {nome_dataframe}...")
 
-    logger.info(f"Registros antes: {registros_antes}")
-    logger.info(f"Registros depois: {registros_depois}")
-    logger.info("Dados padronizados com sucesso")
+    if metricas:
+        coletar_metricas(df, nome_dataframe)
 
-    return df
+    # Substitui todos os valores problemáticos por None
+    valores_problematicos = ['None', 'nan', 'NaN', 'null', 'NULL']
+    return df.replace(valores_problematicos, None)
 
 
 def upload_para_gcs_gold(arquivo_local, nome_arquivo_gcs):
     """
     Faz upload de um arquivo para o Google Cloud Storage no bucket gold
 
+    Usa o cliente do Storage compartilhado pelo processo (config, credenciais e
+    conexão HTTP reaproveitados entre os uploads) e envia o arquivo direto do disco.
+
     Args:
         arquivo_local (str): Caminho do arquivo local
         nome_arquivo_gcs (str): Nome do arquivo no GCS
@@ -135,38 +132,17 @@ def upload_para_gcs_gold(arquivo_local, nome_arquivo_gcs):
         bool: True se o upload foi bem-sucedido, False caso contrário
     """
     try:
-        # Ler o arquivo local
-        with open(arquivo_local, 'rb') as f:
-            arquivo_conteudo = f.read()
-
         # Fazer upload para o bucket gold
         bucket_path = f"gold/{nome_arquivo_gcs}"
         logger.info(
             f"📤 Fazendo upload para: gs://p95-accelera360/{bucket_path}")
 
         try:
-            from google.cloud import storage
-            from google.oauth2 import service_account
-
-            # Caminho para o arquivo de configuração
-            config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(
-                os.path.dirname(os.path.abspath(__file__))))), 'scr', 'config', 'config.yaml')
-
-            # Carregar configuração YAML
-            import yaml
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-
-            # Obter credenciais
-            credentials = service_account.Credentials.from_service_account_file(
-                config['credentials-path'],
-                scopes=["https://www.googleapis.com/auth/cloud-platform"]
-            )
-
-            # Criar cliente do Storage
-            storage_client = storage.Client(credentials=credentials)
+            from clientes_gcp import obter_bucket
+            from funcoes import upload_arquivo_gcs
+
             bucket_name = "p95-accelera360"
-            bucket = storage_client.bucket(bucket_name)
+            bucket = obter_bucket(bucket_name)
 
             # Nome do arquivo no bucket gold
             nome_arquivo_bucket = f"gold/{nome_arquivo_gcs}"
@@ -175,9 +151,8 @@ def upload_para_gcs_gold(arquivo_local, nome_arquivo_gcs):
                 f"📁 Preparando upload para: gs://{bucket_name}/{nome_arquivo_bucket}")
 
             # Fazer upload
-            blob = bucket.blob(nome_arquivo_bucket)
-            blob.upload_from_string(
-                arquivo_conteudo, content_type='application/octet-stream')
+            upload_arquivo_gcs(bucket, arquivo_local, nome_arquivo_bucket,
+                               content_type='application/octet-stream')
 
             logger.info(
                 f"✅ Upload concluído: gs://{bucket_name}/{nome_arquivo_bucket}")
@@ -195,19 +170,36 @@ def upload_para_gcs_gold(arquivo_local, nome_arquivo_gcs):
         return False
 
 
-def main():
-    """Função principal do script"""
+def main(df=None, exportar_rastro=True, tipo_chave=TIPO_CHAVE_PADRAO, metricas=METRICAS_PADRAO):
+    """
+    Função principal do script
+
+    Args:
+        df: DataFrame da silver já em memória (orquestrador); se None, lê ARQUIVO_SILVER
+        exportar_rastro (bool): Grava os spans ao final (o orquestrador exporta os seus)
+        tipo_chave (str): "sequencial" ou "hash" (PKs estáveis entre execuções, FKs sem join)
+        metricas (bool): Registra métricas de qualidade das dimensões (desligado em produção)
+    """
     start_time_total = time.time()
+    rastro_gold = iniciar_span("gold")
     logger.info("=== INICIANDO PROCESSAMENTO GOLD CLINT DIGITAL ===")
 
     try:
         # Cria diretórios necessários
         criar_diretorios()
+        limpar_cache_canonizacao()
 
-        # Lê o arquivo Parquet
-        logger.info("Lendo arquivo Silver...")
+        # Lê o arquivo Parquet (ou usa a base silver recebida em memória)
         start_time = time.time()
-        df = pd.read_parquet(ARQUIVO_SILVER)
+        if df is None:
+            logger.info("Lendo arquivo Silver...")
+            with span("gold.leitura", arquivo=ARQUIVO_SILVER,
+                      bytes=tamanho_arquivo(ARQUIVO_SILVER)) as rastro:
+                df = ler_parquet_silver(ARQUIVO_SILVER)
+                rastro.definir(linhas=len(df))
+        else:
+            logger.info("Usando base Silver recebida em memória")
+        df = garantir_colunas_data(df)
         elapsed_time = time.time() - start_time
         logger.info(f"Arquivo Silver lido em {elapsed_time:.2f} segundos")
 
@@ -220,6 +212,7 @@ def main():
         # Cria o dataframe dim_cliente com as colunas especificadas
         logger.info("Criando dim_cliente...")
         start_time = time.time()
+        rastro = iniciar_span("gold.dim_cliente")
 
         colunas_dim_cliente = ['nome', 'email', 'ddi', 'fone', 'fone_completo']
 
@@ -231,70 +224,28 @@ def main():
                 f"Algumas colunas não foram encontradas. Colunas existentes: {colunas_existentes}")
             colunas_dim_cliente = colunas_existentes
 
-        # Cria o dataframe dim_cliente apenas com as colunas necessárias
-        dim_cliente = df[colunas_dim_cliente].copy()
+        # Remove duplicados exatos, limpa nulos e padroniza antes de deduplicar pela chave
+        # natural: " Maria " e "MARIA" com o mesmo email são o mesmo cliente
+        dim_cliente = df[colunas_dim_cliente].drop_duplicates()
+        dim_cliente = limpar_valores_nulos(dim_cliente, "dim_cliente", metricas)
+        dim_cliente = canonizar_colunas(dim_cliente, "dim_cliente")
 
-        # Trata registros com valores nulos de forma especial
-        # Primeiro, separa registros completamente válidos dos que têm algum nulo
-        registros_completamente_validos = ~dim_cliente.isnull().any(axis=1)
-        dim_cliente_validos = dim_cliente[registros_completamente_validos].copy(
-        )
-        dim_cliente_com_nulos = dim_cliente[~registros_completamente_validos].copy(
-        )
-
-        logger.info(
-            f"Registros completamente válidos: {len(dim_cliente_validos)}")
+        # Registros com algum nulo recebem DESCONHECIDO (nome e email iguais aos da FK do fato)
+        registros_com_nulos = dim_cliente.isnull().any(axis=1)
         logger.info(
-            f"Registros com algum valor nulo: {len(dim_cliente_com_nulos)}")
-
-        # Remove duplicados dos registros válidos
-        dim_cliente_validos = dim_cliente_validos.drop_duplicates()
-        logger.info(f"Registros válidos únicos: {len(dim_cliente_validos)}")
-
-        # Para registros com nulos, substitui valores nulos por DESCONHECIDO e remove duplicados
-        if len(dim_cliente_com_nulos) > 0:
-            logger.info(
-                f"Processando {len(dim_cliente_com_nulos)} registros com valores nulos")
-
-            # Substitui valores nulos por valores padrão (mesmos usados no merge do fato)
-            dim_cliente_com_nulos['nome'] = dim_cliente_com_nulos['nome'].fillna(
-                'DESCONHECIDO_NOME')
-            dim_cliente_com_nulos['email'] = dim_cliente_com_nulos['email'].fillna(
-                'DESCONHECIDO_EMAIL')
-            dim_cliente_com_nulos['ddi'] = dim_cliente_com_nulos['ddi'].fillna(
-                'DESCONHECIDO_DDI')
-            dim_cliente_com_nulos['fone'] = dim_cliente_com_nulos['fone'].fillna(
-                'DESCONHECIDO_FONE')
-            dim_cliente_com_nulos['fone_completo'] = dim_cliente_com_nulos['fone_completo'].fillna(
-                'DESCONHECIDO_FONE_COMPLETO')
-
-            # Remove duplicados dos registros com nulos tratados
-            dim_cliente_com_nulos = dim_cliente_com_nulos.drop_duplicates()
-            logger.info(
-                f"Registros com nulos únicos após tratamento: {len(dim_cliente_com_nulos)}")
-
-            # Combina registros válidos e registros com nulos tratados
-            dim_cliente = pd.concat(
-                [dim_cliente_validos, dim_cliente_com_nulos], ignore_index=True)
-        else:
-            dim_cliente = dim_cliente_validos
+            f"Registros com algum valor nulo: {registros_com_nulos.sum()}")
+        dim_cliente = dim_cliente.fillna(
+            {col: f'DESCONHECIDO_{col.upper()}' for col in colunas_dim_cliente})
 
+        # Um registro por chave natural (nome, email)
+        dim_cliente = deduplicar_por_chave(dim_cliente, ['nome', 'email'], "dim_cliente")
         logger.info(
             f"Total de registros únicos em dim_cliente: {len(dim_cliente)}")
 
-        # Gera uma chave primária (PK) para cada linha
-        dim_cliente['pk_cliente'] = range(1, len(dim_cliente) + 1)
-
-        # Reorganiza as colunas para que a PK seja a primeira
-        colunas_finais = ['pk_cliente'] + colunas_dim_cliente
-        dim_cliente = dim_cliente[colunas_finais]
-
-        # Limpa valores nulos no dim_cliente
-        dim_cliente = limpar_valores_nulos(dim_cliente, "dim_cliente")
-
-        # Padroniza dados no dim_cliente
-        dim_cliente = padronizar_dados(dim_cliente, "dim_cliente")
+        # Gera uma chave primária (PK) para cada linha, como primeira coluna
+        dim_cliente = atribuir_pk(dim_cliente, 'pk_cliente', ['nome', 'email'], tipo_chave)
 
+        rastro.encerrar(linhas=dim_cliente.shape[0], linhas_origem=len(df))
         elapsed_time = time.time() - start_time
         logger.info(f"Dim_cliente criado em {elapsed_time:.2f} segundos")
 
@@ -309,7 +260,9 @@ def main():
         logger.info("Salvando dim_cliente...")
         start_time = time.time()
         arquivo_dim_cliente = 'data/gold/dim_cliente.parquet'
-        dim_cliente.to_parquet(arquivo_dim_cliente, index=False)
+        with span("gold.escrita", arquivo=arquivo_dim_cliente, linhas=len(dim_cliente)) as rastro:
+            dim_cliente.to_parquet(arquivo_dim_cliente, index=False)
+            rastro.definir(bytes=tamanho_arquivo(arquivo_dim_cliente))
         elapsed_time = time.time() - start_time
         logger.info(
             f"DataFrame dim_cliente salvo em {elapsed_time:.2f} segundos: {arquivo_dim_cliente}")
@@ -320,6 +273,7 @@ def main():
         # Cria o dataframe dim_vendedores
         logger.info("Criando dim_vendedores...")
         start_time = time.time()
+        rastro = iniciar_span("gold.dim_vendedores")
 
         colunas_dim_vendedores = ['usuario_email',
                                   'usuario_nome', 'usuario_fone', 'usuario_link']
@@ -332,29 +286,29 @@ def main():
                 f"Algumas colunas de vendedor não foram encontradas. Colunas existentes: {colunas_vendedores_existentes}")
             colunas_dim_vendedores = colunas_vendedores_existentes
 
-        # Cria o dataframe dim_vendedores apenas com as colunas necessárias
-        dim_vendedores = df[colunas_dim_vendedores].copy()
-
-        # Tratar valores 'nan' (string) como nulos nas colunas essenciais
-        colunas_essenciais = ['usuario_email', 'usuario_nome']
-        for col in colunas_essenciais:
-            if col in dim_vendedores.columns:
-                dim_vendedores[col] = dim_vendedores[col].replace('nan', None)
+        # Remove duplicados exatos, limpa nulos e padroniza antes de deduplicar pela chave natural
+        dim_vendedores = df[colunas_dim_vendedores].drop_duplicates()
+        dim_vendedores = limpar_valores_nulos(dim_vendedores, "dim_vendedores", metricas)
+        dim_vendedores = canonizar_colunas(dim_vendedores, "dim_vendedores")
 
         # Trata registros com valores nulos de forma especial
         # Considera apenas colunas essenciais para determinar se é nulo (usuario_email e usuario_nome)
+        colunas_essenciais = ['usuario_email', 'usuario_nome']
         registros_nulos_vendedor = dim_vendedores[colunas_essenciais].isnull().all(
             axis=1)  # TODOS nulos nas essenciais
-        dim_vendedores_nulos = dim_vendedores[registros_nulos_vendedor].copy()
-        dim_vendedores_validos = dim_vendedores[~registros_nulos_vendedor].copy(
-        )
+        dim_vendedores_nulos = dim_vendedores[registros_nulos_vendedor]
+        dim_vendedores_validos = dim_vendedores[~registros_nulos_vendedor]
 
         logger.info(
             f"Vendedores com valores nulos: {len(dim_vendedores_nulos)}")
         logger.info(f"Vendedores válidos: {len(dim_vendedores_validos)}")
 
-        # Remove duplicados apenas dos registros válidos
-        dim_vendedores_validos = dim_vendedores_validos.drop_duplicates()
+        # Essencial nulo em parte recebe o mesmo DESCONHECIDO usado na FK do fato;
+        # depois fica um registro por chave natural (email, nome)
+        dim_vendedores_validos = dim_vendedores_validos.fillna(
+            {col: VALORES_DESCONHECIDOS[col] for col in colunas_essenciais})
+        dim_vendedores_validos = deduplicar_por_chave(
+            dim_vendedores_validos, colunas_essenciais, "dim_vendedores")
         logger.info(
             f"Vendedores válidos únicos: {len(dim_vendedores_validos)}")
 
@@ -377,9 +331,6 @@ def main():
         logger.info(
             f"Total de registros únicos em dim_vendedores: {len(dim_vendedores)}")
 
-        # Gera uma chave primária (PK) para cada linha
-        dim_vendedores['pk_vendedor'] = range(1, len(dim_vendedores) + 1)
-
         # Renomeia as colunas de usuario para vendedor
         mapeamento_colunas = {
             'usuario_email': 'vendedor_email',
@@ -389,17 +340,11 @@ def main():
         }
         dim_vendedores = dim_vendedores.rename(columns=mapeamento_colunas)
 
-        # Reorganiza as colunas para que a PK seja a primeira
-        colunas_finais_vendedores = [
-            'pk_vendedor'] + [mapeamento_colunas[col] for col in colunas_dim_vendedores]
-        dim_vendedores = dim_vendedores[colunas_finais_vendedores]
-
-        # Limpa valores nulos no dim_vendedores
-        dim_vendedores = limpar_valores_nulos(dim_vendedores, "dim_vendedores")
-
-        # Padroniza dados no dim_vendedores
-        dim_vendedores = padronizar_dados(dim_vendedores, "dim_vendedores")
+        # Gera uma chave primária (PK) para cada linha, como primeira coluna
+        dim_vendedores = atribuir_pk(
+            dim_vendedores, 'pk_vendedor', ['vendedor_email', 'vendedor_nome'], tipo_chave)
 
+        rastro.encerrar(linhas=dim_vendedores.shape[0], linhas_origem=len(df))
         elapsed_time = time.time() - start_time
         logger.info(f"Dim_vendedores criado em {elapsed_time:.2f} segundos")
 
@@ -414,7 +359,9 @@ def main():
         logger.info("Salvando dim_vendedores...")
         start_time = time.time()
         arquivo_dim_vendedores = 'data/gold/dim_vendedores.parquet'
-        dim_vendedores.to_parquet(arquivo_dim_vendedores, index=False)
+        with span("gold.escrita", arquivo=arquivo_dim_vendedores, linhas=len(dim_vendedores)) as rastro:
+            dim_vendedores.to_parquet(arquivo_dim_vendedores, index=False)
+            rastro.definir(bytes=tamanho_arquivo(arquivo_dim_vendedores))
         elapsed_time = time.time() - start_time
         logger.info(
             f"DataFrame dim_vendedores salvo em {elapsed_time:.2f} segundos: {arquivo_dim_vendedores}")
@@ -425,6 +372,7 @@ def main():
         # Cria o dataframe dim_pipeline
         logger.info("Criando dim_pipeline...")
         start_time = time.time()
+        rastro = iniciar_span("gold.dim_pipeline")
 
         colunas_dim_pipeline = ['de_origem']
 
@@ -436,30 +384,24 @@ def main():
                 f"Algumas colunas de pipeline não foram encontradas. Colunas existentes: {colunas_pipeline_existentes}")
             colunas_dim_pipeline = colunas_pipeline_existentes
 
-        # Cria o dataframe dim_pipeline apenas com as colunas necessárias
-        dim_pipeline = df[colunas_dim_pipeline].copy()
+        # Remove duplicados exatos, limpa nulos e padroniza antes de deduplicar pela chave natural
+        dim_pipeline = df[colunas_dim_pipeline].drop_duplicates()
+        dim_pipeline = limpar_valores_nulos(dim_pipeline, "dim_pipeline", metricas)
+        dim_pipeline = canonizar_colunas(dim_pipeline, "dim_pipeline")
 
-        # Remove registros duplicados
-        dim_pipeline = dim_pipeline.drop_duplicates()
+        # Pipeline nulo recebe o mesmo DESCONHECIDO usado na FK do fato
+        dim_pipeline = dim_pipeline.fillna({'de_origem': VALORES_DESCONHECIDOS['de_origem']})
+        dim_pipeline = deduplicar_por_chave(dim_pipeline, ['de_origem'], "dim_pipeline")
         logger.info(f"Registros únicos em dim_pipeline: {len(dim_pipeline)}")
 
-        # Gera uma chave primária (PK) para cada linha
-        dim_pipeline['pk_pipeline'] = range(1, len(dim_pipeline) + 1)
-
         # Renomeia a coluna de_origem para de_pipeline
         dim_pipeline = dim_pipeline.rename(
             columns={'de_origem': 'de_pipeline'})
 
-        # Reorganiza as colunas para que a PK seja a primeira
-        colunas_finais_pipeline = ['pk_pipeline', 'de_pipeline']
-        dim_pipeline = dim_pipeline[colunas_finais_pipeline]
-
-        # Limpa valores nulos no dim_pipeline
-        dim_pipeline = limpar_valores_nulos(dim_pipeline, "dim_pipeline")
-
-        # Padroniza dados no dim_pipeline
-        dim_pipeline = padronizar_dados(dim_pipeline, "dim_pipeline")
+        # Gera uma chave primária (PK) para cada linha, como primeira coluna
+        dim_pipeline = atribuir_pk(dim_pipeline, 'pk_pipeline', ['de_pipeline'], tipo_chave)
 
+        rastro.encerrar(linhas=dim_pipeline.shape[0], linhas_origem=len(df))
         elapsed_time = time.time() - start_time
         logger.info(f"Dim_pipeline criado em {elapsed_time:.2f} segundos")
 
@@ -474,7 +416,9 @@ def main():
         logger.info("Salvando dim_pipeline...")
         start_time = time.time()
         arquivo_dim_pipeline = 'data/gold/dim_pipeline.parquet'
-        dim_pipeline.to_parquet(arquivo_dim_pipeline, index=False)
+        with span("gold.escrita", arquivo=arquivo_dim_pipeline, linhas=len(dim_pipeline)) as rastro:
+            dim_pipeline.to_parquet(arquivo_dim_pipeline, index=False)
+            rastro.definir(bytes=tamanho_arquivo(arquivo_dim_pipeline))
         elapsed_time = time.time() - start_time
         logger.info(
             f"DataFrame dim_pipeline salvo em {elapsed_time:.2f} segundos: {arquivo_dim_pipeline}")
@@ -485,6 +429,7 @@ def main():
         # Cria o dataframe dim_estagio
         logger.info("Criando dim_estagio...")
         start_time = time.time()
+        rastro = iniciar_span("gold.dim_estagio")
 
         colunas_dim_estagio = ['estagio']
 
@@ -496,29 +441,24 @@ def main():
                 f"Algumas colunas de estagio não foram encontradas. Colunas existentes: {colunas_estagio_existentes}")
             colunas_dim_estagio = colunas_estagio_existentes
 
-        # Cria o dataframe dim_estagio apenas com as colunas necessárias
-        dim_estagio = df[colunas_dim_estagio].copy()
+        # Remove duplicados exatos, limpa nulos e padroniza antes de deduplicar pela chave
+        # natural: "Lead " e "LEAD" são o mesmo estágio
+        dim_estagio = df[colunas_dim_estagio].drop_duplicates()
+        dim_estagio = limpar_valores_nulos(dim_estagio, "dim_estagio", metricas)
+        dim_estagio = canonizar_colunas(dim_estagio, "dim_estagio")
 
-        # Remove registros duplicados
-        dim_estagio = dim_estagio.drop_duplicates()
+        # Estágio nulo recebe o mesmo DESCONHECIDO usado na FK do fato
+        dim_estagio = dim_estagio.fillna({'estagio': VALORES_DESCONHECIDOS['estagio']})
+        dim_estagio = deduplicar_por_chave(dim_estagio, ['estagio'], "dim_estagio")
         logger.info(f"Registros únicos em dim_estagio: {len(dim_estagio)}")
 
-        # Gera uma chave primária (PK) para cada linha
-        dim_estagio['pk_estagio'] = range(1, len(dim_estagio) + 1)
-
         # Renomeia a coluna estagio para de_estagio
         dim_estagio = dim_estagio.rename(columns={'estagio': 'de_estagio'})
 
-        # Reorganiza as colunas para que a PK seja a primeira
-        colunas_finais_estagio = ['pk_estagio', 'de_estagio']
-        dim_estagio = dim_estagio[colunas_finais_estagio]
-
-        # Limpa valores nulos no dim_estagio
-        dim_estagio = limpar_valores_nulos(dim_estagio, "dim_estagio")
-
-        # Padroniza dados no dim_estagio
-        dim_estagio = padronizar_dados(dim_estagio, "dim_estagio")
+        # Gera uma chave primária (PK) para cada linha, como primeira coluna
+        dim_estagio = atribuir_pk(dim_estagio, 'pk_estagio', ['de_estagio'], tipo_chave)
 
+        rastro.encerrar(linhas=dim_estagio.shape[0], linhas_origem=len(df))
         elapsed_time = time.time() - start_time
         logger.info(f"Dim_estagio criado em {elapsed_time:.2f} segundos")
 
@@ -533,7 +473,9 @@ def main():
         logger.info("Salvando dim_estagio...")
         start_time = time.time()
         arquivo_dim_estagio = 'data/gold/dim_estagio.parquet'
-        dim_estagio.to_parquet(arquivo_dim_estagio, index=False)
+        with span("gold.escrita", arquivo=arquivo_dim_estagio, linhas=len(dim_estagio)) as rastro:
+            dim_estagio.to_parquet(arquivo_dim_estagio, index=False)
+            rastro.definir(bytes=tamanho_arquivo(arquivo_dim_estagio))
         elapsed_time = time.time() - start_time
         logger.info(
             f"DataFrame dim_estagio salvo em {elapsed_time:.2f} segundos: {arquivo_dim_estagio}")
@@ -548,19 +490,12 @@ def main():
         # Cria o dataframe fato_clint_digital
         logger.info("Criando fato_clint_digital...")
         start_time = time.time()
+        rastro_fato = iniciar_span("gold.fato")
 
-        # Seleciona colunas para o fato (incluindo as necessárias para os merges)
+        # Seleciona colunas para o fato (as da chave natural só servem para resolver as FKs)
         colunas_fato = [col for col in df.columns if col not in
                         ['ddi', 'fone', 'fone_completo',
-                         'usuario_fone', 'usuario_link']]
-
-        # Verifica se as colunas existem no DataFrame
-        colunas_fato_existentes = [
-            col for col in colunas_fato if col in df.columns]
-        if len(colunas_fato_existentes) != len(colunas_fato):
-            logger.warning(
-                f"Algumas colunas do fato não foram encontradas. Colunas existentes: {colunas_fato_existentes}")
-            colunas_fato = colunas_fato_existentes
+                         'usuario_fone', 'usuario_link'] + list(VALORES_DESCONHECIDOS)]
 
         # Cria o dataframe fato_clint_digital
         fato_clint_digital = df[colunas_fato].copy()
@@ -568,111 +503,41 @@ def main():
         # Adiciona chaves estrangeiras para as dimensões
         logger.info("Adicionando chaves estrangeiras...")
         merge_start_time = time.time()
-
-        # Padronizar dados do fato para fazer match com as dimensões
-        logger.info("Padronizando dados do fato para merge...")
-
-        # Criar cópias padronizadas das colunas para merge
-        def padronizar_coluna_para_merge(coluna, valor_default):
-            """Padroniza uma coluna tratando todos os valores nan/None adequadamente"""
-            # Primeiro substitui todos os valores problemáticos por None
-            coluna_limpa = coluna.replace(
-                ['nan', 'NaN', 'null', 'NULL', 'None'], None)
-            # Preenche None com valor padrão
-            coluna_limpa = coluna_limpa.fillna(valor_default)
-            # Padroniza apenas valores não-nulos
-            mask_not_null = coluna_limpa.notna()
-            if mask_not_null.any():
-                coluna_limpa.loc[mask_not_null] = coluna_limpa.loc[mask_not_null].astype(
-                    str).str.strip().str.upper()
-            # Substitui valores 'NAN' que podem ter sido criados
-            coluna_limpa = coluna_limpa.replace(['NAN', 'NONE'], valor_default)
-            return coluna_limpa
-
-        if 'nome' in fato_clint_digital.columns:
-            fato_clint_digital['nome_padronizado'] = padronizar_coluna_para_merge(
-                fato_clint_digital['nome'], 'DESCONHECIDO_NOME')
-        if 'email' in fato_clint_digital.columns:
-            fato_clint_digital['email_padronizado'] = padronizar_coluna_para_merge(
-                fato_clint_digital['email'], 'DESCONHECIDO_EMAIL')
-        if 'usuario_email' in fato_clint_digital.columns:
-            fato_clint_digital['usuario_email_padronizado'] = padronizar_coluna_para_merge(
-                fato_clint_digital['usuario_email'], 'DESCONHECIDO_USUARIO_EMAIL')
-        if 'usuario_nome' in fato_clint_digital.columns:
-            fato_clint_digital['usuario_nome_padronizado'] = padronizar_coluna_para_merge(
-                fato_clint_digital['usuario_nome'], 'DESCONHECIDO_USUARIO_NOME')
-        if 'de_origem' in fato_clint_digital.columns:
-            fato_clint_digital['de_origem_padronizado'] = padronizar_coluna_para_merge(
-                fato_clint_digital['de_origem'], 'DESCONHECIDO_DE_ORIGEM')
-        if 'estagio' in fato_clint_digital.columns:
-            fato_clint_digital['estagio_padronizado'] = padronizar_coluna_para_merge(
-                fato_clint_digital['estagio'], 'DESCONHECIDO_ESTAGIO')
-
-        # Merge com dim_cliente (usando dados padronizados)
-        fato_clint_digital = pd.merge(
-            fato_clint_digital,
-            dim_cliente[['pk_cliente', 'nome', 'email']],
-            left_on=['nome_padronizado', 'email_padronizado'],
-            right_on=['nome', 'email'],
-            how='left',
-            suffixes=('', '_dim')
-        ).drop(columns=['nome_dim', 'email_dim'])
-
-        # Merge com dim_vendedores (usando dados padronizados)
-        fato_clint_digital = pd.merge(
-            fato_clint_digital,
-            dim_vendedores[['pk_vendedor', 'vendedor_email', 'vendedor_nome']],
-            left_on=['usuario_email_padronizado', 'usuario_nome_padronizado'],
-            right_on=['vendedor_email', 'vendedor_nome'],
-            how='left'
-        )
-
-        # Merge com dim_pipeline (usando dados padronizados)
-        fato_clint_digital = pd.merge(
-            fato_clint_digital,
-            dim_pipeline[['pk_pipeline', 'de_pipeline']],
-            left_on=['de_origem_padronizado'],
-            right_on=['de_pipeline'],
-            how='left'
-        )
-
-        # Merge com dim_estagio (usando dados padronizados)
-        fato_clint_digital = pd.merge(
-            fato_clint_digital,
-            dim_estagio[['pk_estagio', 'de_estagio']],
-            left_on=['estagio_padronizado'],
-            right_on=['de_estagio'],
-            how='left'
-        )
-
-        # Remove colunas duplicadas das dimensões e temporárias (após os merges)
-        colunas_para_remover = [
-            # Colunas originais duplicadas
-            'nome', 'email', 'usuario_email', 'usuario_nome',
-            'de_origem', 'estagio', 'vendedor_email', 'vendedor_nome',
-            'de_pipeline', 'de_estagio',
-            # Colunas temporárias padronizadas
-            'nome_padronizado', 'email_padronizado', 'usuario_email_padronizado',
-            'usuario_nome_padronizado', 'de_origem_padronizado', 'estagio_padronizado'
+        rastro_merge = iniciar_span("gold.fato.fks")
+
+        # Chaves padronizadas ficam fora do fato: só as FKs inteiras são adicionadas a ele.
+        # Os valores distintos já foram canonizados nas dimensões (cache por coluna)
+        chaves = pd.DataFrame({
+            col: canonizar_serie(df[col], col, valor_default)
+            for col, valor_default in VALORES_DESCONHECIDOS.items() if col in df.columns})
+
+        # Chave natural de cada dimensão: (nome, dimensão, PK, colunas no fato, colunas na dimensão)
+        relacionamentos = [
+            ('dim_cliente', dim_cliente, 'pk_cliente', ['nome', 'email'], ['nome', 'email']),
+            ('dim_vendedores', dim_vendedores, 'pk_vendedor', ['usuario_email', 'usuario_nome'],
+             ['vendedor_email', 'vendedor_nome']),
+            ('dim_pipeline', dim_pipeline, 'pk_pipeline', ['de_origem'], ['de_pipeline']),
+            ('dim_estagio', dim_estagio, 'pk_estagio', ['estagio'], ['de_estagio']),
         ]
 
-        colunas_para_remover = [
-            col for col in colunas_para_remover if col in fato_clint_digital.columns]
-
-        logger.info(
-            f"Removendo colunas duplicadas e temporárias: {colunas_para_remover}")
-        fato_clint_digital = fato_clint_digital.drop(
-            columns=colunas_para_remover)
+        for nome_dim, dim, coluna_pk, colunas_chave, colunas_dim in relacionamentos:
+            # Chave natural repetida na dimensão multiplicaria (ou tornaria ambígua) a FK
+            garantir_chave_unica(dim, colunas_dim, nome_dim)
 
-        # Converte colunas de data para o formato correto
-        for col in ['dt_ganho', 'dt_criacao', 'dt_perda']:
-            if col in fato_clint_digital.columns:
-                fato_clint_digital[col] = pd.to_datetime(
-                    fato_clint_digital[col], errors='coerce').dt.date
+            if tipo_chave == TIPO_CHAVE_HASH:
+                # FK calculada das chaves padronizadas do próprio fato, sem consultar a dimensão
+                fato_clint_digital[coluna_pk] = chave_hash(chaves, colunas_chave)
+            else:
+                # FK pela posição da chave natural na dimensão (fatoração, sem merge)
+                fato_clint_digital[coluna_pk] = resolver_fk(
+                    [chaves[col] for col in colunas_chave], dim, coluna_pk, colunas_dim)
+        del chaves
 
+        rastro_merge.encerrar(linhas=len(fato_clint_digital))
         merge_elapsed_time = time.time() - merge_start_time
-        logger.info(f"Merge realizado em {merge_elapsed_time:.2f} segundos")
+        logger.info(f"Chaves estrangeiras resolvidas em {merge_elapsed_time:.2f} segundos")
 
+        rastro_fato.encerrar(linhas=len(fato_clint_digital))
         elapsed_time = time.time() - start_time
         logger.info(
             f"Fato_clint_digital criado em {elapsed_time:.2f} segundos")
@@ -684,8 +549,9 @@ def main():
         print("\nPrimeiras linhas do fato_clint_digital:")
         print(fato_clint_digital.head())
 
-        # Verifica se há registros sem fk_cliente (merge não encontrou correspondência)
-        registros_sem_fk = fato_clint_digital['pk_cliente'].isna().sum()
+        # Verifica se há registros sem fk_cliente (FK nula ou ausente na dimensão)
+        registros_sem_fk = (
+            ~fato_clint_digital['pk_cliente'].isin(dim_cliente['pk_cliente'])).sum()
         if registros_sem_fk > 0:
             logger.warning(
                 f"{registros_sem_fk} registros não tiveram correspondência no dim_cliente")
@@ -693,9 +559,9 @@ def main():
             logger.info(
                 "Todos os registros tiveram correspondência no dim_cliente")
 
-        # Verifica se há registros sem fk_vendedor (merge não encontrou correspondência)
-        registros_sem_fk_vendedor = fato_clint_digital['pk_vendedor'].isna(
-        ).sum()
+        # Verifica se há registros sem fk_vendedor (FK nula ou ausente na dimensão)
+        registros_sem_fk_vendedor = (
+            ~fato_clint_digital['pk_vendedor'].isin(dim_vendedores['pk_vendedor'])).sum()
         if registros_sem_fk_vendedor > 0:
             logger.warning(
                 f"{registros_sem_fk_vendedor} registros não tiveram correspondência no dim_vendedores")
@@ -703,9 +569,9 @@ def main():
             logger.info(
                 "Todos os registros tiveram correspondência no dim_vendedores")
 
-        # Verifica se há registros sem fk_pipeline (merge não encontrou correspondência)
-        registros_sem_fk_pipeline = fato_clint_digital['pk_pipeline'].isna(
-        ).sum()
+        # Verifica se há registros sem fk_pipeline (FK nula ou ausente na dimensão)
+        registros_sem_fk_pipeline = (
+            ~fato_clint_digital['pk_pipeline'].isin(dim_pipeline['pk_pipeline'])).sum()
         if registros_sem_fk_pipeline > 0:
             logger.warning(
                 f"{registros_sem_fk_pipeline} registros não tiveram correspondência no dim_pipeline")
@@ -713,9 +579,9 @@ def main():
             logger.info(
                 "Todos os registros tiveram correspondência no dim_pipeline")
 
-        # Verifica se há registros sem fk_estagio (merge não encontrou correspondência)
-        registros_sem_fk_estagio = fato_clint_digital['pk_estagio'].isna(
-        ).sum()
+        # Verifica se há registros sem fk_estagio (FK nula ou ausente na dimensão)
+        registros_sem_fk_estagio = (
+            ~fato_clint_digital['pk_estagio'].isin(dim_estagio['pk_estagio'])).sum()
         if registros_sem_fk_estagio > 0:
             logger.warning(
                 f"{registros_sem_fk_estagio} registros não tiveram correspondência no dim_estagio")
@@ -727,7 +593,9 @@ def main():
         logger.info("Salvando fato_clint_digital...")
         start_time = time.time()
         arquivo_fato = 'data/gold/fato_clint_digital.parquet'
-        fato_clint_digital.to_parquet(arquivo_fato, index=False)
+        with span("gold.escrita", arquivo=arquivo_fato, linhas=len(fato_clint_digital)) as rastro:
+            fato_clint_digital.to_parquet(arquivo_fato, index=False)
+            rastro.definir(bytes=tamanho_arquivo(arquivo_fato))
         elapsed_time = time.time() - start_time
         logger.info(
             f"DataFrame fato_clint_digital salvo em {elapsed_time:.2f} segundos: {arquivo_fato}")
@@ -752,8 +620,17 @@ def main():
 
     except Exception as e:
         logger.error(f"Erro durante o processamento: {str(e)}")
+        rastro_gold.definir(erro=str(e))
         raise
 
+    finally:
+        # Gravar os spans do processamento (JSON lines + Chrome trace)
+        rastro_gold.encerrar()
+        if exportar_rastro:
+            arquivo_jsonl, arquivo_trace = exportar_rastreamento("gold")
+            logger.info(f"Rastreamento salvo em {arquivo_jsonl} e {arquivo_trace}")
+
 
 if __name__ == "__main__":
-    main()
+    main(tipo_chave=TIPO_CHAVE_HASH if "--chaves-hash" in sys.argv[1:] else TIPO_CHAVE_PADRAO,
+         metricas="--metricas" in sys.argv[1:])
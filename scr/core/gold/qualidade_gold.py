@@ -0,0 +1,78 @@
+"""
+Métricas de Qualidade de Dados da Camada Gold
+Responsável por: Contar nulos, marcadores de nulo em texto ('nan', 'None'...), vazios e
+valores distintos de cada coluna, sob demanda
+
+Cada coluna é percorrida uma única vez (pyarrow value_counts); os contadores saem da lista
+de valores distintos, que é pequena. A coleta é opcional: nas execuções de produção fica
+desligada e não custa nada.
+"""
+
+import logging
+
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+# Coleta desligada por padrão; ligada com --metricas ou main(metricas=True)
+METRICAS_PADRAO = False
+
+# Textos que a gold trata como nulo (os mesmos de limpar_valores_nulos)
+MARCADORES_NULO = ['None', 'nan', 'NaN', 'null', 'NULL']
+
+
+def metricas_coluna(serie):
+    """
+    Calcula os contadores de uma coluna em uma única passada
+
+    Args:
+        serie: Series do pandas
+
+    Returns:
+        dict com linhas, nulos, marcadores (textos de nulo), vazios e distintos
+    """
+    try:
+        valores = pa.array(serie, from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        # Coluna object com tipos misturados: contar sobre o texto, mantendo os nulos
+        valores = pa.array(serie.map(str, na_action='ignore'), from_pandas=True)
+
+    contagens = pc.value_counts(valores)
+    distintos = contagens.field('values')
+    quantidades = contagens.field('counts')
+
+    metricas = {'linhas': len(valores), 'nulos': valores.null_count,
+                'marcadores': 0, 'vazios': 0,
+                'distintos': len(distintos) - (1 if valores.null_count else 0)}
+    if pa.types.is_string(distintos.type) or pa.types.is_large_string(distintos.type):
+        marcadores = pc.is_in(distintos, value_set=pa.array(MARCADORES_NULO))
+        vazios = pc.equal(pc.utf8_trim_whitespace(distintos), '')
+        metricas['marcadores'] = pc.sum(pc.if_else(marcadores, quantidades, 0)).as_py() or 0
+        metricas['vazios'] = pc.sum(pc.if_else(vazios, quantidades, 0)).as_py() or 0
+    return metricas
+
+
+def coletar_metricas(df, nome_dataframe=""):
+    """
+    Calcula e registra no log as métricas de qualidade de todas as colunas
+
+    Args:
+        df: DataFrame analisado
+        nome_dataframe (str): Nome usado no log
+
+    Returns:
+        dict com as métricas por coluna
+    """
+    metricas = {col: metricas_coluna(df[col]) for col in df.columns}
+
+    nulos = sum(m['nulos'] for m in metricas.values())
+    marcadores = sum(m['marcadores'] for m in metricas.values())
+    vazios = sum(m['vazios'] for m in metricas.values())
+    logger.info(f"Qualidade de {nome_dataframe}: {len(df)} registros, {nulos} nulos, "
+                f"{marcadores} textos de nulo, {vazios} textos vazios")
+    for col, m in metricas.items():
+        if m['nulos'] or m['marcadores'] or m['vazios']:
+            logger.info(f"  {col}: {m['nulos']} nulos, {m['marcadores']} textos de nulo, "
+                        f"{m['vazios']} vazios, {m['distintos']} distintos")
+    return metricas
@@ -0,0 +1,155 @@
+"""
+Orquestrador do Pipeline ETL da Plataforma Clint
+Responsável por: Executar bronze, silver e gold em um único processo, entregando a base
+silver à gold em memória e gravando o Parquet intermediário em segundo plano
+
+Uso:
+    python scr/core/main.py               # bronze + silver + gold
+    python scr/core/main.py --sem-bronze  # reaproveita o CSV bronze já baixado
+    python scr/core/main.py --chaves-hash # PKs da gold por hash da chave natural
+    python scr/core/main.py --metricas    # registra métricas de qualidade das dimensões
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+import logging
+import time
+import sys
+import os
+
+# Adicionar as pastas das camadas e o utils ao path para importação
+pasta_core = os.path.dirname(os.path.abspath(__file__))
+for pasta in ['bronze', 'silver', 'gold', os.path.join('..', 'utils')]:
+    sys.path.append(os.path.join(pasta_core, pasta))
+
+# Importar após configurar o path
+from rastreamento import span, exportar_rastreamento  # noqa: E402
+
+
+def configurar_log():
+    """
+    Configura o log do orquestrador; silver e gold usam o mesmo log no processo único
+    """
+    os.makedirs('logs', exist_ok=True)
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler(
+                f'logs/etl_clint_{datetime.now().strftime("%Y%m%d_%H%M%S")}.log', encoding='utf-8'),
+            logging.StreamHandler()
+        ]
+    )
+    return logging.getLogger(__name__)
+
+
+logger = logging.getLogger(__name__)
+
+
+def executar_bronze():
+    """
+    Coleta a exportação da Clint pelo serviço aquecido, se ativo, ou pelo RPA completo
+
+    A bronze continua entregando o CSV em disco: o arquivo é baixado pelo navegador.
+
+    Returns:
+        bool: True se a coleta foi concluída
+    """
+    from clint_servico_coleta import consultar_servico, solicitar_coleta
+    from clint_main_modular import executar_rpa_completo
+
+    if consultar_servico():
+        logger.info("Serviço de coleta ativo - enviando pedido de coleta")
+        if solicitar_coleta():
+            return True
+        # Um pedido sem resposta pode continuar rodando no serviço; o RPA completo só
+        # assume a coleta se o serviço deixou de responder
+        if consultar_servico():
+            logger.error("Coleta pelo serviço não concluída")
+            return False
+        logger.warning("Serviço de coleta parou de responder; executando o RPA completo")
+    return executar_rpa_completo()
+
+
+def _persistir_silver(tabela, destino, pai):
+    """
+    Grava o Parquet da silver em segundo plano (auditoria e execuções só da gold)
+
+    As marcas d'água pendentes da bronze são efetivadas depois da gravação.
+    """
+    from transformacao_leads import (gravar_silver, ler_manifesto_bronze,
+                                     ARQUIVO_BRONZE, NOME_MANIFESTO_BRONZE)
+
+    manifesto = ler_manifesto_bronze(
+        os.path.join(os.path.dirname(ARQUIVO_BRONZE), NOME_MANIFESTO_BRONZE))
+    with span("etl.persistencia", pai=pai, arquivo=destino):
+        gravar_silver(tabela, destino, manifesto)
+
+
+def executar_pipeline(com_bronze=True, tipo_chave=None, metricas=False):
+    """
+    Executa bronze, silver e gold em sequência no mesmo processo
+
+    Args:
+        com_bronze (bool): Executa a coleta; com False usa o CSV bronze existente
+        tipo_chave (str): Tipo das PKs da gold (padrão: gold_clint_digital.TIPO_CHAVE_PADRAO)
+        metricas (bool): Registra as métricas de qualidade de dados da gold
+
+    Returns:
+        bool: True se todas as etapas foram concluídas
+    """
+    from transformacao_leads import (transformar_leads, para_dataframe_silver,
+                                     ARQUIVO_BRONZE, ARQUIVO_SILVER)
+    import gold_clint_digital
+
+    inicio = time.time()
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="persistencia") as executor, \
+            span("etl", com_bronze=com_bronze) as rastro:
+
+        if com_bronze:
+            logger.info("=== ETAPA 1: BRONZE ===")
+            with span("etl.bronze"):
+                if not executar_bronze():
+                    logger.error("Falha na coleta da bronze; pipeline interrompido")
+                    return False
+
+        logger.info("=== ETAPA 2: SILVER ===")
+        tabela = transformar_leads(ARQUIVO_BRONZE, ARQUIVO_SILVER, {'gravar': False})
+
+        # O Parquet da silver é gravado enquanto a gold processa a mesma tabela em memória
+        persistencia = executor.submit(_persistir_silver, tabela, ARQUIVO_SILVER, rastro)
+
+        logger.info("=== ETAPA 3: GOLD ===")
+        gold_clint_digital.main(para_dataframe_silver(tabela), exportar_rastro=False,
+                                tipo_chave=tipo_chave or gold_clint_digital.TIPO_CHAVE_PADRAO,
+                                metricas=metricas)
+
+        persistencia.result()
+
+    logger.info(f"Pipeline ETL concluído em {time.time() - inicio:.2f} segundos")
+    return True
+
+
+def main():
+    """
+    Executa o pipeline pela linha de comando e retorna o código de saída
+    """
+    configurar_log()
+    com_bronze = "--sem-bronze" not in sys.argv[1:]
+    tipo_chave = "hash" if "--chaves-hash" in sys.argv[1:] else None
+    metricas = "--metricas" in sys.argv[1:]
+
+    try:
+        sucesso = executar_pipeline(com_bronze, tipo_chave, metricas)
+    except Exception as e:
+        logger.error(f"Erro no pipeline ETL: {e}")
+        sucesso = False
+    finally:
+        arquivo_jsonl, arquivo_trace = exportar_rastreamento("etl")
+        logger.info(f"Rastreamento salvo em {arquivo_jsonl} e {arquivo_trace}")
+
+    return 0 if sucesso else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
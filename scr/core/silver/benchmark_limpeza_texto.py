@@ -0,0 +1,120 @@
+"""
+Benchmark da Limpeza de Texto da Camada Silver
+Responsável por: Comparar a limpeza antiga (astype(str) + quatro passadas .str por coluna)
+com limpar_colunas_texto em uma exportação sintética larga, com textos longos
+
+Uso:
+    python benchmark_limpeza_texto.py [linhas] [repeticoes]
+"""
+
+import statistics
+import random
+import time
+import sys
+
+import numpy as np
+import pandas as pd
+
+from limpeza_texto import limpar_colunas_texto
+
+# Colunas livres do formulário, as mais pesadas da exportação
+COLUNAS_TEXTO_LONGO = ['notas_negociacao', 'principais_desafios', 'o_que_voce_espera_co',
+                       'qual_e_o_maior_obsta', 'notas_contato']
+COLUNAS_TEXTO_CURTO = ['nome', 'email', 'estagio', 'de_origem', 'usuario_email',
+                       'usuario_nome', 'tags', 'area_de_atuacao', 'perfil_profissional']
+
+PALAVRAS = ("cliente quer aumentar o faturamento mas tem dificuldade com equipe "
+            "processos marketing vendas gestão tempo investimento mentoria").split()
+
+
+def remover_quebras_linha_legado(df):
+    """
+    Limpeza original da silver, mantida aqui como referência do benchmark
+    """
+    for coluna in df.columns:
+        if df[coluna].dtype == 'object':
+            df[coluna] = df[coluna].astype(
+                str).str.replace('\n', ' ', regex=False)
+            df[coluna] = df[coluna].str.replace('\r', ' ', regex=False)
+            df[coluna] = df[coluna].str.replace('  ', ' ', regex=True)
+            df[coluna] = df[coluna].str.strip()
+    return df
+
+
+def gerar_exportacao(linhas, proporcao_nulos=0.3, semente=42):
+    """
+    Gera uma exportação sintética com textos longos (com quebras de linha) e curtos
+
+    Os nulos são NaN, como chegam do pd.read_csv da exportação.
+    """
+    aleatorio = random.Random(semente)
+
+    def texto_longo():
+        paragrafos = [" ".join(aleatorio.choices(PALAVRAS, k=aleatorio.randint(10, 40)))
+                      for _ in range(aleatorio.randint(1, 4))]
+        return "\r\n".join(paragrafos) + "  "
+
+    dados = {}
+    for coluna in COLUNAS_TEXTO_LONGO:
+        dados[coluna] = [np.nan if aleatorio.random() < proporcao_nulos else texto_longo()
+                         for _ in range(linhas)]
+    for coluna in COLUNAS_TEXTO_CURTO:
+        valores = [f" {coluna.upper()} {i} " for i in range(50)]
+        dados[coluna] = [np.nan if aleatorio.random() < proporcao_nulos else aleatorio.choice(valores)
+                         for _ in range(linhas)]
+    dados['valor'] = np.random.default_rng(semente).uniform(0, 50000, linhas)
+    return pd.DataFrame(dados)
+
+
+def medir(funcao, df, repeticoes):
+    """
+    Retorna a mediana do tempo de execução em segundos (cada repetição recebe uma cópia)
+    """
+    tempos = []
+    for _ in range(repeticoes):
+        copia = df.copy()
+        inicio = time.perf_counter()
+        funcao(copia)
+        tempos.append(time.perf_counter() - inicio)
+    return statistics.median(tempos)
+
+
+def executar_benchmark(linhas=200_000, repeticoes=3):
+    """
+    Executa o benchmark e exibe tempos e diferenças de resultado entre as duas limpezas
+    """
+    df = gerar_exportacao(linhas)
+    colunas = df.select_dtypes(include=['object']).columns
+    print(f"🧪 Limpeza de texto: {linhas} linhas, {len(colunas)} colunas de texto "
+          f"({repeticoes} repetições)")
+
+    tempo_legado = medir(remover_quebras_linha_legado, df, repeticoes)
+    tempo_novo = medir(limpar_colunas_texto, df, repeticoes)
+
+    legado = remover_quebras_linha_legado(df.copy())
+    novo = limpar_colunas_texto(df.copy())
+    nulos_como_texto = int((legado[colunas] == 'nan').sum().sum())
+    nulos_preservados = int(novo[colunas].isna().sum().sum())
+
+    # Fora os nulos, a única diferença esperada é o colapso completo de espaços repetidos
+    divergentes = sum(
+        int((legado[coluna].str.replace(r' +', ' ', regex=True) != novo[coluna].fillna('nan')).sum())
+        for coluna in colunas)
+
+    print("=" * 60)
+    print(f"{'limpeza':<12} {'tempo (s)':>10} {'ganho':>8}")
+    print("-" * 60)
+    print(f"{'legado':<12} {tempo_legado:>10.3f} {1:>7.1f}x")
+    print(f"{'nova':<12} {tempo_novo:>10.3f} {tempo_legado / tempo_novo:>7.1f}x")
+    print("=" * 60)
+    print(f"Nulos convertidos em 'nan' pela limpeza legada: {nulos_como_texto}")
+    print(f"Nulos preservados pela limpeza nova: {nulos_preservados}")
+    print(f"Valores divergentes (fora nulos e espaços repetidos): {divergentes}")
+
+    return {"legado": tempo_legado, "nova": tempo_novo}
+
+
+if __name__ == "__main__":
+    linhas_benchmark = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    repeticoes_benchmark = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    executar_benchmark(linhas_benchmark, repeticoes_benchmark)
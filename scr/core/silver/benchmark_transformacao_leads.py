@@ -0,0 +1,68 @@
+"""
+Benchmark da Transformação Silver
+Responsável por: Medir transformar_leads no mesmo processo sobre uma exportação sintética,
+gerada a partir do CSV de exemplo do simulador da bronze
+
+Uso:
+    python benchmark_transformacao_leads.py [linhas] [repeticoes]
+"""
+
+from collections import defaultdict
+import statistics
+import tempfile
+import time
+import os
+import sys
+
+import pandas as pd
+
+from transformacao_leads import transformar_leads
+from rastreamento import spans_registrados, limpar_rastreamento
+
+ARQUIVO_EXEMPLO = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                               '..', 'bronze', 'simulador', 'exportacao_exemplo.csv')
+
+
+def gerar_exportacao(caminho, linhas, semente=42):
+    """
+    Gera um CSV sintético com o layout da exportação, repetindo as linhas do exemplo com ids novos
+    """
+    exemplo = pd.read_csv(ARQUIVO_EXEMPLO, dtype=str, keep_default_na=False)
+    exportacao = exemplo.sample(n=linhas, replace=True, random_state=semente)
+    exportacao['id'] = [f"{i:08x}-0000-4000-8000-{i:012x}" for i in range(linhas)]
+    exportacao.to_csv(caminho, index=False)
+
+
+def executar_benchmark(linhas=100_000, repeticoes=3):
+    """
+    Executa transformar_leads repetidas vezes e exibe a mediana de cada etapa
+    """
+    pasta = tempfile.mkdtemp(prefix="silver_benchmark_")
+    origem = os.path.join(pasta, 'leads-forms-accelera.csv')
+    destino = os.path.join(pasta, 'leads-forms-accelera.parquet')
+    gerar_exportacao(origem, linhas)
+    print(f"🧪 Transformação silver: {linhas} linhas ({os.path.getsize(origem) / 1e6:.1f} MB), "
+          f"{repeticoes} repetições")
+
+    duracoes = defaultdict(list)
+    for _ in range(repeticoes):
+        limpar_rastreamento()
+        inicio = time.perf_counter()
+        transformar_leads(origem, destino)
+        duracoes['total'].append(time.perf_counter() - inicio)
+        for rastro in spans_registrados():
+            duracoes[rastro.nome].append(rastro.duracao)
+
+    print("=" * 50)
+    print(f"{'etapa':<20} {'mediana (s)':>12}")
+    print("-" * 50)
+    for etapa, tempos in duracoes.items():
+        print(f"{etapa:<20} {statistics.median(tempos):>12.3f}")
+    print("=" * 50)
+    return duracoes
+
+
+if __name__ == "__main__":
+    linhas_benchmark = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    repeticoes_benchmark = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    executar_benchmark(linhas_benchmark, repeticoes_benchmark)
@@ -0,0 +1,128 @@
+"""
+Conversão de Datas da Camada Silver
+Responsável por: Detectar o formato das colunas de data em uma amostra, converter com esse
+formato explícito (pyarrow) apenas os valores distintos e manter as datas como date32
+
+O formato detectado fica em cache por coluna durante o processo; se a amostra de uma nova
+exportação não couber mais nele, o formato é detectado de novo. Sem formato conhecido, a
+conversão testa os demais formatos e, por último, o pd.to_datetime com dia primeiro.
+"""
+
+import logging
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+# Formatos testados na detecção, em ordem de prioridade (a exportação da Clint usa dia primeiro)
+FORMATOS_CANDIDATOS = [
+    '%d/%m/%Y %H:%M:%S',
+    '%d/%m/%Y %H:%M',
+    '%d/%m/%Y',
+    '%Y-%m-%d %H:%M:%S',
+    '%Y-%m-%dT%H:%M:%S',
+    '%Y-%m-%d',
+]
+
+TAMANHO_AMOSTRA = 1000
+
+# Formato detectado por coluna, reaproveitado entre leituras no mesmo processo
+_formatos_detectados = {}
+
+
+def _converte_tudo(valores, formato):
+    """
+    Verifica se todos os valores não nulos são interpretados pelo formato
+    """
+    convertidos = pc.strptime(valores, format=formato, unit='s', error_is_null=True)
+    return convertidos.null_count == valores.null_count
+
+
+def _converter_com_pandas(valores):
+    """
+    Conversão alternativa (formato livre, dia primeiro), como a silver fazia antes
+    """
+    return pa.array(pd.to_datetime(
+        valores.to_pandas(), errors='coerce', dayfirst=True
+    ).dt.date, type=pa.date32(), from_pandas=True)
+
+
+def detectar_formato(valores, coluna=None, tamanho_amostra=TAMANHO_AMOSTRA):
+    """
+    Detecta o formato de data que interpreta todos os valores de uma amostra
+
+    Args:
+        valores: Array Arrow de texto (apenas valores distintos, de preferência)
+        coluna: Nome da coluna, usado como chave do cache
+        tamanho_amostra: Quantidade de valores testados
+
+    Returns:
+        str: Formato strptime, ou None se nenhum candidato servir
+    """
+    amostra = pc.drop_null(valores)[:tamanho_amostra]
+    if len(amostra) == 0:
+        return None
+
+    formato_cache = _formatos_detectados.get(coluna)
+    if formato_cache and _converte_tudo(amostra, formato_cache):
+        return formato_cache
+
+    for formato in FORMATOS_CANDIDATOS:
+        if _converte_tudo(amostra, formato):
+            if coluna is not None:
+                _formatos_detectados[coluna] = formato
+            logger.info(f'Formato de data detectado para {coluna}: {formato}')
+            return formato
+
+    logger.warning(f'Nenhum formato único serve para {coluna}; testando todos os formatos.')
+    return None
+
+
+def converter_coluna_data(valores, coluna=None):
+    """
+    Converte uma coluna de texto para date32, interpretando cada valor distinto uma única vez
+
+    Args:
+        valores: Array ou ChunkedArray Arrow (texto, timestamp ou date32)
+        coluna: Nome da coluna, usado no cache de formatos
+
+    Returns:
+        pyarrow.Array com as datas em date32 (valores não interpretados viram nulos)
+    """
+    if isinstance(valores, pa.ChunkedArray):
+        valores = valores.combine_chunks()
+    if pa.types.is_date32(valores.type):
+        return valores
+    if pa.types.is_timestamp(valores.type) or pa.types.is_date64(valores.type):
+        return valores.cast(pa.date32())
+
+    # Datas se repetem muito: converter só o dicionário e expandir pelos índices
+    codificados = valores if pa.types.is_dictionary(valores.type) else valores.dictionary_encode()
+    distintos = pc.utf8_trim_whitespace(codificados.dictionary.cast(pa.string()))
+
+    # Formato detectado primeiro; os demais candidatos e o pd.to_datetime só entram
+    # se sobrarem valores em outro formato (exportações com formatos misturados)
+    formato = detectar_formato(distintos, coluna)
+    formatos = [formato] if formato else []
+    formatos += [f for f in FORMATOS_CANDIDATOS if f != formato]
+
+    convertidos = pa.nulls(len(distintos), pa.date32())
+    for formato in formatos:
+        if convertidos.null_count == distintos.null_count:
+            break
+        convertidos = pc.coalesce(convertidos, pc.strptime(
+            distintos, format=formato, unit='s', error_is_null=True).cast(pa.date32()))
+
+    if convertidos.null_count > distintos.null_count:
+        convertidos = pc.coalesce(convertidos, _converter_com_pandas(distintos))
+
+    return convertidos.take(codificados.indices)
+
+
+def limpar_cache_formatos():
+    """
+    Esquece os formatos detectados (próxima conversão detecta de novo)
+    """
+    _formatos_detectados.clear()
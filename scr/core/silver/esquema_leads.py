@@ -0,0 +1,126 @@
+"""
+Esquema da Exportação de Leads da Clint
+Responsável por: Mapear as colunas do CSV exportado para os nomes da silver e definir o tipo
+Arrow de cada coluna, usado pelo leitor CSV para tipar os dados já na leitura
+"""
+
+import pyarrow as pa
+
+# Mapeamento das colunas conforme imagem fornecida
+colunas_map = {
+    'id': 'id',
+    'created_at': 'dt_criacao',
+    'name': 'nome',
+    'email': 'email',
+    'ddi': 'ddi',
+    'phone': 'fone',
+    'complete_phone': 'fone_completo',
+    'organization_name': 'de_organizacao',
+    'tags': 'tags',
+    'status': 'status_atual',
+    'stage': 'estagio',
+    'value': 'valor',
+    'lost_status': 'status_perda',
+    'user_email': 'usuario_email',
+    'user_name': 'usuario_nome',
+    'user_phone': 'usuario_fone',
+    'user_link': 'usuario_link',
+    'origin': 'de_origem',
+    'won_at': 'dt_ganho',
+    'lost_at': 'dt_perda',
+    'doc': 'documento',
+    'username': 'username',
+    'valid_phone': 'fone_validado',
+    'area_de_atuacao': 'area_de_atuacao',
+    'principais_desafios': 'principais_desafios',
+    'como_ficou_sabendo_d': 'como_ficou_sabendo_d',
+    'disposicao_de_invest': 'disposicao_de_invest',
+    'media_de_faturamento': 'media_de_faturamento',
+    'meta_para_os_proximo': 'meta_para_os_proximo',
+    'momento_atual_na_jor': 'momento_atual_na_jor',
+    'o_que_voce_espera_co': 'o_que_voce_espera_co',
+    'link_do_forms': 'link_do_forms',
+    'meta_de_faturamento': 'meta_de_faturamento',
+    'perfil_profissional': 'perfil_profissional',
+    'para_crescer_um_nego': 'para_crescer_um_nego',
+    'principal_objetivo_h': 'principal_objetivo_h',
+    'qual_e_o_maior_obsta': 'qual_e_o_maior_obsta',
+    'qual_e_sua_prioridad': 'qual_e_sua_prioridad',
+    'sua_posicao_no_merca': 'sua_posicao_no_merca',
+    'deal_notes': 'notas_negociacao',
+    'duplicate_phone': 'fone_duplicado',
+    'whatsapp_number': 'whatsapp',
+    'user': 'user',
+    'currency': 'moeda',
+    'user_id': 'userId',
+    'instagram': 'instagram',
+    'contact_notes': 'notas_contato',
+}
+
+# Colunas de data (nomes da silver)
+COLUNAS_DATA = ['dt_criacao', 'dt_perda', 'dt_ganho']
+
+# Colunas numéricas (nomes da silver)
+COLUNAS_NUMERICAS = ['valor']
+
+# Colunas com poucos valores distintos (status, estágio, vendedor e respostas de múltipla
+# escolha do formulário), lidas como dicionário: cada texto distinto é guardado uma vez
+COLUNAS_CATEGORICAS = [
+    'status_atual', 'estagio', 'status_perda', 'usuario_email', 'usuario_nome',
+    'usuario_fone', 'usuario_link', 'de_origem', 'moeda', 'user', 'userId',
+    'fone_validado', 'fone_duplicado', 'area_de_atuacao', 'como_ficou_sabendo_d',
+    'disposicao_de_invest', 'media_de_faturamento', 'meta_para_os_proximo',
+    'momento_atual_na_jor', 'meta_de_faturamento', 'perfil_profissional',
+    'qual_e_sua_prioridad', 'sua_posicao_no_merca',
+]
+
+# Datas são lidas como texto (dicionário) e convertidas depois por conversao_datas.py,
+# com o formato detectado na própria exportação
+TIPO_DATA = pa.date32()
+TIPO_CATEGORICO = pa.dictionary(pa.int32(), pa.string())
+
+
+def tipo_coluna(coluna):
+    """
+    Tipo Arrow de uma coluna da silver
+
+    Colunas fora das listas acima são texto; telefones, DDI e documentos também,
+    para não perder zeros à esquerda.
+    """
+    if coluna in COLUNAS_DATA:
+        return TIPO_DATA
+    if coluna in COLUNAS_NUMERICAS:
+        return pa.float64()
+    if coluna in COLUNAS_CATEGORICAS:
+        return TIPO_CATEGORICO
+    return pa.string()
+
+
+def tipos_colunas_csv(tipar_numeros=True):
+    """
+    Tipos das colunas pelo nome do CSV exportado, no formato do ConvertOptions do pyarrow
+
+    Args:
+        tipar_numeros (bool): Se False, as colunas numéricas ficam para a inferência do leitor
+
+    Returns:
+        dict: Nome da coluna no CSV -> tipo Arrow
+    """
+    tipos = {}
+    for coluna_csv, coluna in colunas_map.items():
+        tipo = tipo_coluna(coluna)
+        if tipo == TIPO_DATA:
+            tipos[coluna_csv] = TIPO_CATEGORICO
+        elif coluna not in COLUNAS_NUMERICAS or tipar_numeros:
+            tipos[coluna_csv] = tipo
+    return tipos
+
+
+def esquema_saida(esquema):
+    """
+    Esquema gravado no Parquet da silver: dicionários voltam a ser texto, para a gold
+    continuar lendo colunas object (o Parquet já codifica por dicionário internamente)
+    """
+    return pa.schema([
+        campo.with_type(campo.type.value_type) if pa.types.is_dictionary(campo.type) else campo
+        for campo in esquema])
@@ -0,0 +1,82 @@
+"""
+Leitura da Exportação Bronze para a Camada Silver
+Responsável por: Ler o CSV exportado com o leitor multithread do pyarrow, já tipado pelo
+esquema de esquema_leads.py, e gravar a tabela Arrow direto em Parquet
+"""
+
+import logging
+
+import pyarrow as pa
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+
+from esquema_leads import colunas_map, COLUNAS_DATA, tipos_colunas_csv, esquema_saida
+from conversao_datas import converter_coluna_data
+
+logger = logging.getLogger(__name__)
+
+
+def _ler_csv(caminho, tipos):
+    return pcsv.read_csv(
+        caminho,
+        read_options=pcsv.ReadOptions(use_threads=True),
+        # Notas e respostas do formulário têm quebras de linha dentro das aspas
+        parse_options=pcsv.ParseOptions(newlines_in_values=True),
+        convert_options=pcsv.ConvertOptions(
+            column_types=tipos,
+            strings_can_be_null=True,
+        ),
+    )
+
+
+def ler_csv_bronze(caminho):
+    """
+    Lê o CSV da bronze como tabela Arrow tipada, com as colunas já renomeadas para a silver
+
+    As datas chegam como texto e são convertidas por converter_datas. Se algum valor
+    numérico não couber no esquema, a leitura é refeita com esses tipos inferidos, como
+    no pd.read_csv.
+
+    Args:
+        caminho: Caminho do CSV exportado
+
+    Returns:
+        pyarrow.Table com as colunas da silver
+    """
+    try:
+        tabela = _ler_csv(caminho, tipos_colunas_csv())
+    except pa.ArrowInvalid as e:
+        logger.warning(f'CSV fora do esquema esperado ({e}); inferindo os tipos numéricos.')
+        tabela = _ler_csv(caminho, tipos_colunas_csv(tipar_numeros=False))
+
+    return tabela.rename_columns(
+        [colunas_map.get(coluna, coluna) for coluna in tabela.column_names])
+
+
+def converter_datas(tabela):
+    """
+    Converte as colunas de data para date32 (apenas data)
+
+    Args:
+        tabela: pyarrow.Table da silver
+
+    Returns:
+        pyarrow.Table com as datas em date32
+    """
+    for coluna in COLUNAS_DATA:
+        if coluna in tabela.column_names:
+            tabela = tabela.set_column(
+                tabela.column_names.index(coluna), coluna,
+                converter_coluna_data(tabela.column(coluna), coluna))
+    return tabela
+
+
+def escrever_parquet_silver(tabela, caminho):
+    """
+    Grava a tabela Arrow no Parquet da silver, sem passar pelo pandas
+
+    Args:
+        tabela: pyarrow.Table da silver
+        caminho: Caminho do Parquet
+    """
+    pq.write_table(tabela.cast(esquema_saida(tabela.schema)), caminho)
@@ -0,0 +1,104 @@
+"""
+Limpeza de Texto da Camada Silver
+Responsável por: Remover quebras de linha e espaços repetidos das colunas de texto em uma
+única passada por coluna (kernel do pyarrow), preservando os valores nulos, tanto em
+DataFrames quanto em tabelas Arrow
+"""
+
+import logging
+import re
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+logger = logging.getLogger(__name__)
+
+# Quebras de linha e sequências de espaços viram um único espaço; espaços simples
+# não casam com o padrão, o que evita reescrever cada palavra do texto
+PADRAO_ESPACOS = r'[ \r\n]{2,}|[\r\n]'
+_REGEX_ESPACOS = re.compile(PADRAO_ESPACOS)
+
+
+def _limpar_com_python(serie):
+    """
+    Caminho alternativo para colunas object com valores que não são texto (ex.: números misturados)
+    """
+    preenchidos = serie.notna()
+    limpa = serie.copy()
+    limpa[preenchidos] = [
+        _REGEX_ESPACOS.sub(' ', str(valor)).strip() for valor in serie[preenchidos]]
+    return limpa
+
+
+def _limpar_arrow(valores):
+    return pc.utf8_trim_whitespace(
+        pc.replace_substring_regex(valores, PADRAO_ESPACOS, ' '))
+
+
+def limpar_texto_serie(serie):
+    """
+    Substitui quebras de linha e espaços repetidos por um espaço e remove espaços nas bordas
+
+    Args:
+        serie: Série de texto do pandas
+
+    Returns:
+        Série limpa, com os nulos mantidos como nulos (e não como a string 'nan')
+    """
+    try:
+        valores = pa.array(serie, type=pa.string(), from_pandas=True)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return _limpar_com_python(serie)
+
+    valores = _limpar_arrow(valores)
+    return pd.Series(valores.to_pandas(), index=serie.index, name=serie.name)
+
+
+def limpar_colunas_texto(df, colunas=None):
+    """
+    Limpa todas as colunas de texto do DataFrame
+
+    Args:
+        df: DataFrame do pandas
+        colunas: Colunas a limpar (padrão: colunas object/string)
+
+    Returns:
+        DataFrame com as colunas de texto limpas
+    """
+    if colunas is None:
+        colunas = df.select_dtypes(include=['object', 'string']).columns
+
+    logger.info(f'Limpando {len(colunas)} colunas de texto...')
+    for coluna in colunas:
+        df[coluna] = limpar_texto_serie(df[coluna])
+    logger.info('Colunas de texto limpas com sucesso.')
+    return df
+
+
+def limpar_tabela_texto(tabela):
+    """
+    Limpa todas as colunas de texto de uma tabela Arrow, sem converter para pandas
+
+    Em colunas de dicionário apenas os valores distintos são limpos.
+
+    Args:
+        tabela: pyarrow.Table
+
+    Returns:
+        pyarrow.Table com as colunas de texto limpas
+    """
+    logger.info('Limpando colunas de texto da tabela Arrow...')
+    for indice, campo in enumerate(tabela.schema):
+        valores = tabela.column(indice)
+        if pa.types.is_string(campo.type):
+            valores = _limpar_arrow(valores)
+        elif pa.types.is_dictionary(campo.type) and pa.types.is_string(campo.type.value_type):
+            valores = pa.chunked_array(
+                [pa.DictionaryArray.from_arrays(parte.indices, _limpar_arrow(parte.dictionary))
+                 for parte in valores.chunks], type=campo.type)
+        else:
+            continue
+        tabela = tabela.set_column(indice, campo, valores)
+    logger.info('Colunas de texto limpas com sucesso.')
+    return tabela
@@ -0,0 +1,256 @@
+"""
+Transformação Silver dos Leads da Clint
+Responsável por: Transformar a exportação bronze (CSV) na base silver (Parquet): leitura
+tipada, datas, limpeza de texto e mescla das exportações incrementais
+
+Pode ser chamada no mesmo processo por um orquestrador ou benchmark; a execução pela linha
+de comando fica em leads-forms-accelera.py.
+"""
+
+import logging
+import json
+import time
+import os
+import sys
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Adicionar o diretório utils ao path para importação
+sys.path.append(os.path.join(os.path.dirname(
+    os.path.abspath(__file__)), '..', '..', 'utils'))
+
+from rastreamento import span, tamanho_arquivo  # noqa: E402
+from limpeza_texto import limpar_tabela_texto  # noqa: E402
+from esquema_leads import colunas_map, COLUNAS_DATA, esquema_saida  # noqa: E402
+from leitura_bronze import ler_csv_bronze, converter_datas, escrever_parquet_silver  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
+ARQUIVO_BRONZE = 'data/bronze/leads-forms-accelera/leads-forms-accelera.csv'
+ARQUIVO_SILVER = 'data/silver/leads-forms-accelera.parquet'
+# Manifesto gravado pela bronze indicando exportação completa ou incremental (delta)
+NOME_MANIFESTO_BRONZE = 'leads-forms-accelera.manifesto.json'
+
+# Datas no pandas como date32 do Arrow, sem objetos date do Python
+TIPO_DATA_PANDAS = pd.ArrowDtype(pa.date32())
+
+OPCOES_PADRAO = {
+    # Manifesto da bronze (padrão: ao lado do CSV de origem)
+    'manifesto': None,
+    # Força o tipo da exportação ("completa" ou "incremental"), ignorando o manifesto
+    'tipo': None,
+    # Grava o Parquet no destino; com False o chamador grava (ex.: em segundo plano)
+    'gravar': True,
+}
+
+
+def ler_manifesto_bronze(caminho):
+    """
+    Lê o manifesto da exportação bronze; sem manifesto, a exportação é tratada como completa
+
+    Args:
+        caminho: Caminho do manifesto
+
+    Returns:
+        dict com o tipo da exportação ("completa" ou "incremental")
+    """
+    if not caminho or not os.path.exists(caminho):
+        return {'tipo': 'completa'}
+    with open(caminho, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def para_pandas(tabela):
+    """
+    Converte a tabela Arrow para pandas mantendo as datas como date32
+    """
+    return tabela.to_pandas(types_mapper={pa.date32(): TIPO_DATA_PANDAS}.get)
+
+
+def para_dataframe_silver(tabela):
+    """
+    DataFrame igual ao que a gold leria do Parquet da silver (texto como object, datas date32)
+
+    Usado para entregar a base à gold em memória, sem gravar e reler o arquivo.
+    """
+    return para_pandas(tabela.cast(esquema_saida(tabela.schema)))
+
+
+def mesclar_incremental(silver_df, delta_df, chave='id'):
+    """
+    Mescla o delta exportado na base silver existente, mantendo a versão mais recente de cada negócio
+
+    Args:
+        silver_df: DataFrame da base silver atual
+        delta_df: DataFrame com os negócios criados/alterados desde a última coleta
+        chave: Coluna identificadora do negócio
+
+    Returns:
+        DataFrame com a base completa atualizada
+    """
+    # Colunas de texto ausentes no delta (ou vazias) chegam com outro tipo; alinhar com a base
+    for coluna in delta_df.columns.intersection(silver_df.columns):
+        if silver_df[coluna].dtype == 'object' and delta_df[coluna].dtype != 'object':
+            delta_df[coluna] = delta_df[coluna].astype(object)
+
+    # Bases gravadas antes da leitura tipada guardam as datas como texto 'yyyy-mm-dd'
+    for coluna in COLUNAS_DATA:
+        if coluna in silver_df.columns and silver_df[coluna].dtype != TIPO_DATA_PANDAS:
+            silver_df[coluna] = pd.to_datetime(
+                silver_df[coluna], errors='coerce').astype(TIPO_DATA_PANDAS)
+
+    mesclado = pd.concat([silver_df, delta_df], ignore_index=True)
+    mesclado = mesclado.drop_duplicates(subset=[chave], keep='last')
+    logger.info(
+        f'Delta mesclado: {len(delta_df)} linhas recebidas, '
+        f'{len(mesclado) - len(silver_df)} negócios novos, total {len(mesclado)}.')
+    return mesclado.reset_index(drop=True)
+
+
+def _ler_origem(origem):
+    """
+    Aceita o caminho do CSV bronze, uma tabela Arrow ou um DataFrame já carregado
+    """
+    if isinstance(origem, str):
+        try:
+            logger.info(f'Lendo arquivo bronze: {origem}')
+            with span('silver.leitura', arquivo=origem, bytes=tamanho_arquivo(origem)) as rastro:
+                tabela = ler_csv_bronze(origem)
+                rastro.definir(linhas=tabela.num_rows, colunas=tabela.num_columns)
+            logger.info('Arquivo bronze lido com sucesso.')
+            return tabela
+        except Exception as e:
+            logger.error(f'Erro ao ler o arquivo bronze: {e}')
+            raise
+
+    if isinstance(origem, pd.DataFrame):
+        origem = pa.Table.from_pandas(origem, preserve_index=False)
+    return origem.rename_columns(
+        [colunas_map.get(coluna, coluna) for coluna in origem.column_names])
+
+
+def transformar_leads(origem=ARQUIVO_BRONZE, destino=ARQUIVO_SILVER, opcoes=None):
+    """
+    Transforma a exportação bronze na base silver
+
+    Args:
+        origem: Caminho do CSV bronze, pyarrow.Table ou DataFrame (colunas do CSV ou da silver)
+        destino: Parquet da silver; também é a base da mescla incremental
+        opcoes (dict): Ajustes da execução (ver OPCOES_PADRAO)
+
+    Returns:
+        pyarrow.Table: Base silver resultante
+    """
+    opcoes = {**OPCOES_PADRAO, **(opcoes or {})}
+    t_inicio = time.time()
+
+    with span('silver') as rastro_silver:
+        tabela = _ler_origem(origem)
+
+        # Converter colunas de data para date32 (apenas data)
+        with span('silver.datas', linhas=tabela.num_rows):
+            tabela = converter_datas(tabela)
+
+        # Remover quebras de linha e espaços repetidos das colunas de texto (nulos preservados)
+        with span('silver.limpeza', linhas=tabela.num_rows):
+            tabela = limpar_tabela_texto(tabela)
+
+        # Exportação incremental: mesclar o delta na base silver existente pelo id do negócio
+        # (única etapa que precisa do pandas)
+        caminho_manifesto = opcoes['manifesto']
+        if caminho_manifesto is None and isinstance(origem, str):
+            caminho_manifesto = os.path.join(os.path.dirname(origem), NOME_MANIFESTO_BRONZE)
+        manifesto = ler_manifesto_bronze(caminho_manifesto)
+        tipo = opcoes['tipo'] or manifesto.get('tipo')
+
+        if tipo == 'incremental':
+            if destino and os.path.exists(destino) and 'id' in tabela.column_names:
+                logger.info(
+                    f"Exportação incremental desde {manifesto.get('desde')}, mesclando com {destino}")
+                with span('silver.mescla', linhas_delta=tabela.num_rows) as rastro:
+                    silver_df = mesclar_incremental(
+                        para_pandas(pq.read_table(destino)), para_pandas(tabela))
+                    tabela = pa.Table.from_pandas(silver_df, preserve_index=False)
+                    rastro.definir(linhas=tabela.num_rows)
+            else:
+                logger.warning(
+                    'Exportação incremental sem base silver existente; o delta será salvo como base.')
+
+        # Salvando no formato Parquet (silver), direto da tabela Arrow; a marca d'água da
+        # bronze só avança depois da gravação
+        if destino and opcoes['gravar']:
+            gravar_silver(tabela, destino, manifesto)
+
+        rastro_silver.definir(linhas=tabela.num_rows, tipo=tipo)
+
+    logger.info(
+        f'Fim do processamento silver. Duração total: {time.time() - t_inicio:.2f} segundos.')
+    return tabela
+
+
+def gravar_silver(tabela, destino=ARQUIVO_SILVER, manifesto=None):
+    """
+    Grava a base silver em Parquet, criando a pasta se necessário
+
+    Args:
+        tabela: pyarrow.Table da silver
+        destino: Caminho do Parquet
+        manifesto (dict): Manifesto da bronze; as marcas d'água pendentes são efetivadas
+            depois da gravação
+    """
+    try:
+        os.makedirs(os.path.dirname(destino) or '.', exist_ok=True)
+        with span('silver.escrita', arquivo=destino, linhas=tabela.num_rows) as rastro:
+            escrever_parquet_silver(tabela, destino)
+            rastro.definir(bytes=tamanho_arquivo(destino))
+        logger.info(f"Arquivo salvo em {destino} com colunas renomeadas.")
+    except Exception as e:
+        logger.error(f'Erro ao salvar o arquivo silver: {e}')
+        raise
+
+    if manifesto:
+        efetivar_marcas_dagua(manifesto)
+
+
+def efetivar_marcas_dagua(manifesto):
+    """
+    Grava as marcas d'água pendentes do manifesto da bronze no arquivo de marcas d'água
+
+    Chamada só depois que a silver foi gravada: se a transformação ou a mescla falhar, a
+    próxima coleta incremental repete o mesmo intervalo. Uma marca nunca volta para trás,
+    então reprocessar a mesma exportação (ex.: --sem-bronze) não altera nada.
+
+    Args:
+        manifesto (dict): Manifesto da bronze (marcas_pendentes e arquivo_marcas)
+
+    Returns:
+        int: Quantidade de marcas d'água atualizadas
+    """
+    pendentes = manifesto.get('marcas_pendentes') or {}
+    caminho = manifesto.get('arquivo_marcas')
+    if not pendentes or not caminho:
+        return 0
+
+    marcas = {}
+    if os.path.exists(caminho):
+        with open(caminho, 'r', encoding='utf-8') as f:
+            marcas = json.load(f)
+
+    atualizadas = {url: marca for url, marca in pendentes.items()
+                   if url not in marcas or marca['inicio_coleta'] > marcas[url]['inicio_coleta']}
+    if not atualizadas:
+        return 0
+    marcas.update(atualizadas)
+
+    # Gravação atômica, como na bronze, para não corromper o arquivo se o processo cair
+    os.makedirs(os.path.dirname(caminho) or '.', exist_ok=True)
+    caminho_temporario = f"{caminho}.tmp"
+    with open(caminho_temporario, 'w', encoding='utf-8') as f:
+        json.dump(marcas, f, indent=2)
+    os.replace(caminho_temporario, caminho)
+
+    for url, marca in atualizadas.items():
+        logger.info(f"Marca d'água de {url} atualizada: {marca['inicio_coleta']}")
+    return len(atualizadas)
@@ -0,0 +1,111 @@
+"""
+Clientes do Google Cloud compartilhados pelo processo
+Responsável por: Carregar config.yaml e credenciais uma única vez e criar sob demanda
+os clientes de Storage e BigQuery, mantendo seus pools de conexão HTTP durante todo o processo
+"""
+
+import os
+import threading
+import yaml
+
+# Caminho para o arquivo config.yaml a partir do diretório raiz
+CAMINHO_CONFIGURACAO = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))), 'scr', 'config', 'config.yaml')
+
+ESCOPOS = ["https://www.googleapis.com/auth/cloud-platform"]
+
+_lock = threading.RLock()
+_cache = {}
+
+
+def _obter_ou_criar(chave, fabrica):
+    """
+    Retorna o objeto em cache ou cria com a fábrica informada (thread-safe)
+    """
+    objeto = _cache.get(chave)
+    if objeto is not None:
+        return objeto
+
+    with _lock:
+        objeto = _cache.get(chave)
+        if objeto is None:
+            objeto = fabrica()
+            _cache[chave] = objeto
+        return objeto
+
+
+def obter_configuracao():
+    """
+    Carrega o config.yaml uma única vez por processo
+
+    Returns:
+        dict: Configuração do projeto
+    """
+    def _carregar():
+        with open(CAMINHO_CONFIGURACAO, 'r', encoding='utf-8') as file:
+            return yaml.safe_load(file)
+
+    return _obter_ou_criar("configuracao", _carregar)
+
+
+def obter_credenciais():
+    """
+    Carrega as credenciais da service account uma única vez por processo
+
+    Returns:
+        Credentials: Credenciais do Google Cloud
+    """
+    def _carregar():
+        from google.oauth2 import service_account
+
+        credentials_path = obter_configuracao().get('credentials-path')
+        if not credentials_path or not os.path.exists(credentials_path):
+            raise FileNotFoundError(
+                f"Arquivo de credenciais não encontrado: {credentials_path}")
+
+        return service_account.Credentials.from_service_account_file(
+            credentials_path, scopes=ESCOPOS)
+
+    return _obter_ou_criar("credenciais", _carregar)
+
+
+def obter_cliente_storage():
+    """
+    Retorna o cliente do Cloud Storage compartilhado pelo processo
+    """
+    def _criar():
+        from google.cloud import storage
+
+        return storage.Client(credentials=obter_credenciais(),
+                              project=obter_configuracao().get('project-id'))
+
+    return _obter_ou_criar("storage", _criar)
+
+
+def obter_cliente_bigquery():
+    """
+    Retorna o cliente do BigQuery compartilhado pelo processo
+    """
+    def _criar():
+        from google.cloud import bigquery
+
+        return bigquery.Client(credentials=obter_credenciais(),
+                               project=obter_configuracao()['project-id'])
+
+    return _obter_ou_criar("bigquery", _criar)
+
+
+def obter_bucket(nome=None):
+    """
+    Retorna o bucket do projeto (padrão: bucket-projeto do config.yaml)
+    """
+    nome = nome or obter_configuracao().get('bucket-projeto', 'p95-accelera360')
+    return _obter_ou_criar(f"bucket:{nome}", lambda: obter_cliente_storage().bucket(nome))
+
+
+def limpar_cache():
+    """
+    Descarta configuração, credenciais e clientes em cache (ex.: após trocar o config.yaml)
+    """
+    with _lock:
+        _cache.clear()
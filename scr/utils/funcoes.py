@@ -1,15 +1,24 @@
 import os
-import yaml
-import pandas as pd
-from google.cloud import bigquery
-from google.oauth2 import service_account
 import sys
 import time
+from datetime import timezone
+from zoneinfo import ZoneInfo
+import base64
+import gzip
+import hashlib
+import shutil
+import tempfile
 
 # Adicionar o diretório config ao path
 sys.path.append(os.path.join(os.path.dirname(
     os.path.abspath(__file__)), '..', 'config'))
 
+from clientes_gcp import obter_configuracao, obter_credenciais, obter_cliente_bigquery  # noqa: E402
+from rastreamento import span  # noqa: E402
+
+# Tamanho dos blocos de leitura e de upload resumable (múltiplo de 256 KB)
+TAMANHO_BLOCO_UPLOAD = 8 * 1024 * 1024
+
 
 def contagem_regressiva(segundos):
     """
@@ -45,16 +54,10 @@ def contagem_regressiva(segundos):
 
 def carregar_configuracao():
     """
-    Carrega as configurações do arquivo config.yaml
+    Carrega as configurações do arquivo config.yaml (uma única vez por processo)
     """
-    # Caminho para o arquivo config.yaml a partir do diretório raiz
-    workspace_root = os.path.dirname(os.path.dirname(
-        os.path.dirname(os.path.abspath(__file__))))
-    config_path = os.path.join(workspace_root, 'scr', 'config', 'config.yaml')
-
     try:
-        with open(config_path, 'r', encoding='utf-8') as file:
-            config = yaml.safe_load(file)
+        config = obter_configuracao()
         print("✅ Configuração carregada com sucesso")
         return config
     except Exception as e:
@@ -64,7 +67,7 @@ def carregar_configuracao():
 
 def obter_credenciais_bigquery(config):
     """
-    Obtém as credenciais do BigQuery
+    Obtém as credenciais do BigQuery (carregadas uma única vez por processo)
     """
     try:
         credentials_path = config.get('credentials-path')
@@ -74,10 +77,7 @@ def obter_credenciais_bigquery(config):
                 f"❌ Arquivo de credenciais não encontrado: {credentials_path}")
             return None
 
-        credentials = service_account.Credentials.from_service_account_file(
-            credentials_path,
-            scopes=["https://www.googleapis.com/auth/cloud-platform"]
-        )
+        credentials = obter_credenciais()
         print("✅ Credenciais do BigQuery carregadas com sucesso")
         return credentials
 
@@ -86,61 +86,238 @@ def obter_credenciais_bigquery(config):
         return None
 
 
-def capturar_codigo_acesso_client():
+class ProvedorTokenAcesso:
     """
-    Captura o código de acesso do client usando a query do BigQuery
+    Provedor do código de acesso (2FA) da Clint gravado no BigQuery
+
+    Usa o cliente BigQuery compartilhado pelo processo e consulta apenas a
+    linha mais recente da tabela de tokens.
+    """
+
+    TABELA_TOKEN = "lille-422512.P95_Accelera360.validacao_token"
+
+    def __init__(self, fuso_horario_token="UTC"):
+        """
+        Args:
+            fuso_horario_token (str): Fuso usado quando data_token não tem fuso (DATETIME);
+                o padrão assume que o gerador do token grava em UTC
+        """
+        self.fuso_horario_token = ZoneInfo(fuso_horario_token)
+
+    @property
+    def client(self):
+        """
+        Cliente BigQuery compartilhado (criado uma única vez no processo)
+        """
+        return obter_cliente_bigquery()
+
+    def token_mais_recente(self):
+        """
+        Consulta o token mais recente
+
+        Returns:
+            tuple: (token, data_token), ou (None, None) se a tabela estiver vazia
+        """
+        query = f"""
+        SELECT token, data_token
+        FROM `{self.TABELA_TOKEN}`
+        ORDER BY data_token DESC
+        LIMIT 1
+        """
+        linhas = list(self.client.query(query).result())
+        if not linhas:
+            return None, None
+        return linhas[0]['token'], linhas[0]['data_token']
+
+    def _normalizar_data(self, data):
+        """
+        Converte data_token para datetime com fuso, para comparar com o momento do login
+        """
+        if data.tzinfo is None:
+            return data.replace(tzinfo=self.fuso_horario_token)
+        return data
+
+    def aguardar_token_novo(self, desde, timeout=180, intervalo_inicial=2,
+                            intervalo_maximo=15, fator=1.5, cancelado=None):
+        """
+        Aguarda aparecer um token gerado depois do momento informado
+
+        Consulta o BigQuery com backoff exponencial até o token do login atual
+        chegar, descartando tokens antigos de tentativas anteriores.
+
+        Args:
+            desde (datetime): Momento do login (com fuso; sem fuso assume-se UTC)
+            timeout (float): Tempo máximo de espera em segundos
+            intervalo_inicial (float): Primeiro intervalo entre consultas em segundos
+            intervalo_maximo (float): Maior intervalo entre consultas em segundos
+            fator (float): Fator de crescimento do intervalo
+            cancelado (threading.Event): Interrompe a espera quando sinalizado
+
+        Returns:
+            str: Token novo, ou None se o tempo esgotar ou a espera for cancelada
+        """
+        if desde.tzinfo is None:
+            desde = desde.replace(tzinfo=timezone.utc)
+
+        print(
+            f"⏳ Aguardando token gerado após {desde.isoformat(timespec='seconds')} (máximo {timeout}s)...")
+
+        inicio = time.monotonic()
+        intervalo = intervalo_inicial
+        tentativas = 0
+
+        while True:
+            tentativas += 1
+            try:
+                token, data_token = self.token_mais_recente()
+                if token and data_token and self._normalizar_data(data_token) > desde:
+                    print(
+                        f"✅ Token novo encontrado após {time.monotonic() - inicio:.1f}s ({tentativas} consulta(s)): {token[:10]}...")
+                    return token
+            except Exception as e:
+                print(f"⚠️ Erro ao consultar token: {e}")
+
+            restante = timeout - (time.monotonic() - inicio)
+            if restante <= 0:
+                print(
+                    f"❌ Nenhum token novo após {timeout}s ({tentativas} consulta(s))")
+                return None
+
+            if cancelado is not None:
+                if cancelado.wait(min(intervalo, restante)):
+                    print("⚠️ Espera pelo token cancelada")
+                    return None
+            else:
+                time.sleep(min(intervalo, restante))
+            intervalo = min(intervalo * fator, intervalo_maximo)
+
+
+_provedor_token = None
+
+
+def obter_provedor_token(fuso_horario_token=None):
+    """
+    Retorna o provedor de token compartilhado pelo processo
+
+    Args:
+        fuso_horario_token (str): Fuso de data_token sem fuso (padrão: CLINT_FUSO_TOKEN em
+            variaveis.py, que assume UTC quando não configurado); usado só na criação do provedor
+
+    Returns:
+        ProvedorTokenAcesso: Provedor compartilhado
+    """
+    global _provedor_token
+    if _provedor_token is None:
+        if fuso_horario_token is None:
+            from variaveis import clint_fuso_token
+            fuso_horario_token = clint_fuso_token
+        _provedor_token = ProvedorTokenAcesso(fuso_horario_token)
+    return _provedor_token
+
+
+def calcular_checksum_arquivo(caminho, tamanho_bloco=TAMANHO_BLOCO_UPLOAD):
+    """
+    Calcula o checksum de um arquivo lendo-o em blocos
+
+    Usa CRC32C (mesmo formato base64 do atributo blob.crc32c do GCS) quando
+    google-crc32c está disponível; caso contrário, usa MD5 (blob.md5_hash).
+
+    Returns:
+        tuple: (algoritmo, checksum em base64)
     """
     try:
-        print("🚀 Iniciando captura do código de acesso do client...")
+        import google_crc32c
+        calculo = google_crc32c.Checksum()
+        algoritmo = "crc32c"
+    except ImportError:
+        calculo = hashlib.md5()
+        algoritmo = "md5"
 
-        # Carregar configuração
-        config = carregar_configuracao()
-        if not config:
-            return None
+    with open(caminho, 'rb') as f:
+        for bloco in iter(lambda: f.read(tamanho_bloco), b''):
+            calculo.update(bloco)
 
-        # Obter credenciais
-        credentials = obter_credenciais_bigquery(config)
-        if not credentials:
-            return None
+    return algoritmo, base64.b64encode(calculo.digest()).decode('ascii')
 
-        # Criar cliente BigQuery
-        client = bigquery.Client(
-            credentials=credentials,
-            project=config['project-id']
-        )
+
+def upload_arquivo_gcs(bucket, caminho_local, nome_blob, content_type='application/octet-stream',
+                       compactar=False, tamanho_bloco=TAMANHO_BLOCO_UPLOAD):
+    """
+    Envia um arquivo para o GCS direto do disco, em blocos (upload resumable)
+
+    O checksum do arquivo local é gravado nos metadados do blob; se o blob
+    existente tiver o mesmo checksum e a mesma compactação (Content-Encoding)
+    o upload é ignorado.
+
+    Args:
+        bucket: Bucket do google.cloud.storage
+        caminho_local (str): Arquivo a enviar
+        nome_blob (str): Caminho do objeto no bucket
+        content_type (str): Content-Type do objeto
+        compactar (bool): Envia compactado com Content-Encoding gzip
+        tamanho_bloco (int): Tamanho de cada bloco do upload resumable (múltiplo de 256 KB)
+
+    Returns:
+        bool: True se o arquivo foi enviado ou já estava atualizado no bucket
+    """
+    with span("upload.gcs", blob=nome_blob, compactar=compactar) as rastro:
+        algoritmo, checksum = calcular_checksum_arquivo(caminho_local)
+        chave_metadado = f"{algoritmo}-origem"
+
+        # Comparar com o objeto existente antes de enviar
+        blob_existente = bucket.get_blob(nome_blob)
+        codificacao = 'gzip' if compactar else None
+        # Ligar ou desligar CLINT_UPLOAD_GZIP exige reenviar o objeto na nova codificação
+        if blob_existente is not None and (blob_existente.content_encoding or None) == codificacao:
+            checksum_remoto = (blob_existente.metadata or {}).get(chave_metadado)
+            if checksum_remoto is None and not compactar and not blob_existente.content_encoding:
+                checksum_remoto = blob_existente.crc32c if algoritmo == "crc32c" else blob_existente.md5_hash
+            if checksum_remoto == checksum:
+                print(
+                    f"⏭️ Upload ignorado, objeto já atualizado: gs://{bucket.name}/{nome_blob}")
+                rastro.definir(ignorado=True, bytes=0)
+                return True
+
+        blob = bucket.blob(nome_blob, chunk_size=tamanho_bloco)
+        blob.metadata = {chave_metadado: checksum}
+        tamanho_original = os.path.getsize(caminho_local)
+
+        if compactar:
+            blob.content_encoding = codificacao
+            with tempfile.TemporaryDirectory() as pasta_temporaria:
+                caminho_gzip = os.path.join(pasta_temporaria, 'upload.gz')
+                # mtime=0 deixa o conteúdo compactado determinístico
+                with open(caminho_local, 'rb') as origem, \
+                        gzip.GzipFile(caminho_gzip, 'wb', mtime=0) as destino:
+                    shutil.copyfileobj(origem, destino, tamanho_bloco)
+                tamanho_enviado = os.path.getsize(caminho_gzip)
+                blob.upload_from_filename(caminho_gzip, content_type=content_type)
+        else:
+            tamanho_enviado = tamanho_original
+            blob.upload_from_filename(caminho_local, content_type=content_type)
+
+        rastro.definir(ignorado=False, bytes=tamanho_enviado,
+                       bytes_originais=tamanho_original)
+        print(f"✅ Arquivo enviado para: gs://{bucket.name}/{nome_blob}")
         print(
-            f"✅ Cliente BigQuery criado para projeto: {config['project-id']}")
-
-        # Query para capturar o código de acesso
-        query = """
-        WITH MAXDATE AS (
-          SELECT
-            MAX(data_token) AS max_data
-          FROM `lille-422512.P95_Accelera360.validacao_token`  
-        )
-        SELECT 
-          token
-        FROM `lille-422512.P95_Accelera360.validacao_token` vt
-        CROSS JOIN MAXDATE
-        WHERE vt.data_token = MAXDATE.max_data
-        """
+            f"📊 Tamanho: {tamanho_original} bytes (enviados {tamanho_enviado} bytes)")
+        return True
 
-        print("🔍 Executando query no BigQuery...")
 
-        # Executar query
-        query_job = client.query(query)
-        results = query_job.result()
+def capturar_codigo_acesso_client():
+    """
+    Captura o código de acesso do client usando a query do BigQuery
+    """
+    try:
+        print("🚀 Iniciando captura do código de acesso do client...")
 
-        # Converter resultados para DataFrame
-        df = results.to_dataframe()
+        print("🔍 Executando query no BigQuery...")
+        token, _ = obter_provedor_token().token_mais_recente()
 
-        if df.empty:
+        if not token:
             print("⚠️ Nenhum resultado encontrado na query")
             return None
 
-        # Obter o token (primeira linha)
-        token = df.iloc[0]['token']
-
         print(f"✅ Código de acesso capturado com sucesso: {token[:10]}...")
         return token
 
@@ -156,24 +333,11 @@ def testar_conexao_bigquery():
     try:
         print("🧪 Testando conexão com BigQuery...")
 
-        # Carregar configuração
-        config = carregar_configuracao()
-        if not config:
-            return False
-
-        # Obter credenciais
-        credentials = obter_credenciais_bigquery(config)
-        if not credentials:
-            return False
-
-        # Criar cliente BigQuery
-        client = bigquery.Client(
-            credentials=credentials,
-            project=config['project-id']
-        )
+        provedor = obter_provedor_token()
+        client = provedor.client
 
         # Testar conexão com uma query simples
-        query = f"SELECT 1 as test FROM `{config['project-id']}.P95_Accelera360.validacao_token` LIMIT 1"
+        query = f"SELECT 1 as test FROM `{provedor.TABELA_TOKEN}` LIMIT 1"
         query_job = client.query(query)
         results = query_job.result()
 
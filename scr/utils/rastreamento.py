@@ -0,0 +1,240 @@
+"""
+Rastreamento de Etapas do Pipeline
+Responsável por: Registrar spans aninhados (duração, quantidade de linhas, bytes) de todas as
+camadas e exportá-los em JSON lines e no formato Chrome trace (chrome://tracing / Perfetto)
+"""
+
+from contextlib import contextmanager
+from datetime import datetime
+import itertools
+import threading
+import json
+import time
+import os
+
+# Pasta padrão dos arquivos de rastreamento (logs/rastreamento na raiz do projeto)
+PASTA_RASTREAMENTO = os.path.join(os.path.dirname(os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__)))), 'logs', 'rastreamento')
+
+_lock = threading.Lock()
+_local = threading.local()
+_spans_encerrados = []
+_ids = itertools.count(1)
+
+# Referência para converter o relógio monotônico em horário absoluto
+_ORIGEM_NS = time.perf_counter_ns()
+_ORIGEM_EPOCH_NS = time.time_ns()
+
+
+def _pilha():
+    """
+    Pilha de spans abertos da thread atual
+    """
+    if not hasattr(_local, "pilha"):
+        _local.pilha = []
+    return _local.pilha
+
+
+class Span:
+    """
+    Trecho de execução rastreado, com atributos como linhas e bytes
+    """
+
+    def __init__(self, nome, atributos, pai=None):
+        self.id = next(_ids)
+        self.nome = nome
+        self.pai = pai.id if pai is not None else None
+        self.atributos = dict(atributos)
+        self.thread = threading.current_thread().name
+        self.thread_id = threading.get_ident()
+        self.inicio_ns = time.perf_counter_ns()
+        self.duracao_ns = None
+        self.erro = None
+
+    def definir(self, **atributos):
+        """
+        Adiciona ou atualiza atributos do span (ex.: linhas, bytes)
+        """
+        self.atributos.update(atributos)
+        return self
+
+    def encerrar(self, erro=None, **atributos):
+        """
+        Encerra o span e o registra; spans filhos ainda abertos são encerrados junto
+        """
+        if self.duracao_ns is not None:
+            return self
+
+        pilha = _pilha()
+        if self in pilha:
+            while pilha and pilha[-1] is not self:
+                pilha[-1].encerrar(erro="span não encerrado explicitamente")
+            pilha.pop()
+
+        self.atributos.update(atributos)
+        self.erro = erro
+        self.duracao_ns = time.perf_counter_ns() - self.inicio_ns
+
+        with _lock:
+            _spans_encerrados.append(self)
+        return self
+
+    @property
+    def duracao(self):
+        """
+        Duração em segundos (None enquanto aberto)
+        """
+        return None if self.duracao_ns is None else self.duracao_ns / 1e9
+
+    def para_dict(self):
+        """
+        Representação do span usada no JSON lines
+        """
+        inicio_epoch = (_ORIGEM_EPOCH_NS + self.inicio_ns - _ORIGEM_NS) / 1e9
+        return {
+            "id": self.id,
+            "pai": self.pai,
+            "nome": self.nome,
+            "inicio": datetime.fromtimestamp(inicio_epoch).isoformat(),
+            "duracao": self.duracao,
+            "thread": self.thread,
+            "erro": self.erro,
+            "atributos": self.atributos,
+        }
+
+
+def span_atual():
+    """
+    Retorna o span aberto mais interno da thread atual (ou None)
+    """
+    pilha = _pilha()
+    return pilha[-1] if pilha else None
+
+
+def iniciar_span(nome, pai=None, **atributos):
+    """
+    Abre um span filho do span atual da thread
+
+    Use quando o trecho não cabe em um bloco `with`; encerre com `span.encerrar()`.
+
+    Args:
+        nome (str): Nome do span (ex.: "bronze.download")
+        pai (Span): Span pai explícito, para trechos executados em outras threads
+        **atributos: Atributos iniciais do span
+
+    Returns:
+        Span: Span aberto
+    """
+    novo = Span(nome, atributos, pai or span_atual())
+    _pilha().append(novo)
+    return novo
+
+
+@contextmanager
+def span(nome, pai=None, **atributos):
+    """
+    Rastreia o bloco `with` como um span; exceções são registradas e propagadas
+
+    Exemplo:
+        with span("silver.leitura", arquivo=caminho) as s:
+            df = pd.read_csv(caminho)
+            s.definir(linhas=len(df))
+    """
+    atual = iniciar_span(nome, pai, **atributos)
+    try:
+        yield atual
+    except BaseException as e:
+        atual.encerrar(erro=f"{type(e).__name__}: {e}")
+        raise
+    else:
+        atual.encerrar()
+
+
+def tamanho_arquivo(caminho):
+    """
+    Tamanho do arquivo em bytes, ou None se não existir (atributo `bytes` dos spans)
+    """
+    try:
+        return os.path.getsize(caminho)
+    except OSError:
+        return None
+
+
+def spans_registrados():
+    """
+    Retorna a lista de spans encerrados até o momento
+    """
+    with _lock:
+        return list(_spans_encerrados)
+
+
+def limpar_rastreamento():
+    """
+    Descarta os spans registrados (ex.: entre pedidos de um serviço de longa duração)
+    """
+    with _lock:
+        _spans_encerrados.clear()
+
+
+def exportar_jsonl(caminho, spans=None):
+    """
+    Grava um span por linha em JSON
+    """
+    spans = spans_registrados() if spans is None else spans
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        for s in sorted(spans, key=lambda s: s.inicio_ns):
+            f.write(json.dumps(s.para_dict(), ensure_ascii=False, default=str))
+            f.write("\n")
+    return caminho
+
+
+def exportar_chrome_trace(caminho, spans=None):
+    """
+    Grava os spans no formato Chrome trace (eventos completos "X"), aberto no chrome://tracing ou Perfetto
+    """
+    spans = spans_registrados() if spans is None else spans
+    pid = os.getpid()
+    eventos = [{
+        "name": "thread_name", "ph": "M", "pid": pid, "tid": tid,
+        "args": {"name": nome_thread},
+    } for tid, nome_thread in {s.thread_id: s.thread for s in spans}.items()]
+
+    for s in spans:
+        argumentos = dict(s.atributos)
+        if s.erro:
+            argumentos["erro"] = s.erro
+        eventos.append({
+            "name": s.nome,
+            "cat": s.nome.split(".")[0],
+            "ph": "X",
+            "ts": (s.inicio_ns - _ORIGEM_NS) / 1000,
+            "dur": s.duracao_ns / 1000,
+            "pid": pid,
+            "tid": s.thread_id,
+            "args": argumentos,
+        })
+
+    os.makedirs(os.path.dirname(caminho), exist_ok=True)
+    with open(caminho, 'w', encoding='utf-8') as f:
+        json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"},
+                  f, ensure_ascii=False, default=str)
+    return caminho
+
+
+def exportar_rastreamento(prefixo, pasta=PASTA_RASTREAMENTO):
+    """
+    Exporta os spans registrados em JSON lines e Chrome trace com o mesmo prefixo
+
+    Args:
+        prefixo (str): Prefixo dos arquivos (ex.: "bronze", "silver", "gold")
+        pasta (str): Pasta de destino
+
+    Returns:
+        tuple: Caminhos (jsonl, trace) gerados
+    """
+    spans = spans_registrados()
+    carimbo = datetime.now().strftime("%Y%m%d_%H%M%S")
+    base = os.path.join(pasta, f"{prefixo}_{carimbo}")
+    return (exportar_jsonl(f"{base}.jsonl", spans),
+            exportar_chrome_trace(f"{base}.trace.json", spans))
@@ -3,11 +3,65 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+# Raiz do projeto (scr/utils -> raiz), usada nos caminhos padrão de dados
+_raiz_projeto = os.path.abspath(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', '..'))
+
 clint_url = os.getenv("CLINT_URL")
 clint_user = os.getenv("CLINT_USER")
 clint_password = os.getenv("CLINT_PASSWORD")
 
-# URLs para coleta de dados
+# Pasta de downloads do Chrome (camada bronze)
+clint_pasta_downloads = os.getenv(
+    "CLINT_PASTA_DOWNLOADS", r"C:\Repositorio\Python\p95-accelera360\data\bronze\leads-forms-accelera")
+
+# Quantidade de origens coletadas em paralelo (1 = coleta sequencial)
+clint_concorrencia = int(os.getenv("CLINT_CONCORRENCIA", "1"))
+
+# Modo de exportação: "navegador" (botão da página) ou "http" (requisição direta aprendida)
+clint_modo_exportacao = os.getenv("CLINT_MODO_EXPORTACAO", "navegador")
+
+# Perfil do navegador: "padrao" (janela maximizada) ou "leve" (headless, sem imagens/fontes/rastreadores)
+clint_perfil_driver = os.getenv("CLINT_PERFIL_DRIVER", "padrao")
+
+# Envia os CSVs da camada bronze compactados (Content-Encoding gzip)
+clint_upload_gzip = os.getenv("CLINT_UPLOAD_GZIP", "0") == "1"
+
+# Modo de coleta: "completa" (todo o histórico) ou "incremental" (apenas negócios desde a última coleta)
+clint_modo_coleta = os.getenv("CLINT_MODO_COLETA", "completa")
+
+# Margem de segurança (em horas) subtraída da marca d'água na coleta incremental
+clint_margem_incremental_horas = int(
+    os.getenv("CLINT_MARGEM_INCREMENTAL_HORAS", "24"))
+
+# Seletores do filtro de data da página de pipeline (coleta incremental)
+clint_seletor_filtro_data = os.getenv(
+    "CLINT_SELETOR_FILTRO_DATA", '[data-cy="tbl-date-deal-filter"]')
+clint_seletor_campo_data = os.getenv(
+    "CLINT_SELETOR_CAMPO_DATA", "//*[contains(text(), 'Atualizado em')]")
+clint_seletor_data_inicial = os.getenv(
+    "CLINT_SELETOR_DATA_INICIAL", "input[placeholder='Data inicial']")
+clint_formato_filtro_data = os.getenv("CLINT_FORMATO_FILTRO_DATA", "%d/%m/%Y")
+
+# Fuso horário de data_token na tabela de tokens (2FA) quando a coluna é DATETIME, sem fuso
+# (nome IANA, ex.: "America/Sao_Paulo"); o padrão assume que o gerador grava em UTC
+clint_fuso_token = os.getenv("CLINT_FUSO_TOKEN", "UTC")
+
+# Porta local (127.0.0.1) do serviço de coleta com navegador aquecido
+clint_servico_porta = int(os.getenv("CLINT_SERVICO_PORTA", "8765"))
+
+# Pasta da sessão autenticada e da requisição de exportação aprendida
+clint_pasta_sessao = os.getenv(
+    "CLINT_PASTA_SESSAO", os.path.join(_raiz_projeto, 'data', 'sessao'))
+
+# Pasta do estado entre execuções (marcas d'água da coleta incremental)
+clint_pasta_estado = os.getenv(
+    "CLINT_PASTA_ESTADO", os.path.join(_raiz_projeto, 'data', 'estado'))
+
+# URLs para coleta de dados (CLINT_URLS, separadas por vírgula, substitui a lista)
 clint_urls = [
     "https://app.clint.digital/origin/1bb864dd-9fdf-498c-aaee-256776337fe8",
 ]
+if os.getenv("CLINT_URLS"):
+    clint_urls = [url.strip()
+                  for url in os.getenv("CLINT_URLS").split(",") if url.strip()]